@@ -19,7 +19,14 @@ import plotly.graph_objects as go
 import pyperf
 
 from adaptix._internal.utils import pairs
-from benchmarks.pybench.director_api import BenchAccessor, BenchChecker, BenchmarkDirector, BenchStorageFactory
+from benchmarks.pybench.director_api import (
+    BenchAccessor,
+    BenchChecker,
+    BenchmarkDirector,
+    BenchStorageFactory,
+    get_median_memory_measure,
+)
+from benchmarks.pybench.storage import MemoryMeasure
 
 T = TypeVar("T")
 
@@ -199,6 +206,51 @@ BENCHMARK_HUBS: Iterable[HubDescription] = [
             boundary_rate=1.5,
         ),
     ),
+    HubDescription(
+        key="debug_trail-loading",
+        title="Debug Trail (loading)",
+        module="benchmarks.debug_trail.hub_loading",
+        x_bounder=ClusterAxisBounder(
+            last_cluster_idx=-1,
+            boundary_rate=2,
+        ),
+    ),
+    HubDescription(
+        key="omit_default-dumping",
+        title="Omit Default (dumping)",
+        module="benchmarks.omit_default.hub_dumping",
+        x_bounder=ClusterAxisBounder(
+            last_cluster_idx=-1,
+            boundary_rate=2,
+        ),
+    ),
+    HubDescription(
+        key="nested_schema-building",
+        title="Nested Schema (building)",
+        module="benchmarks.nested_schema.hub_building",
+        x_bounder=ClusterAxisBounder(
+            last_cluster_idx=-1,
+            boundary_rate=2,
+        ),
+    ),
+    HubDescription(
+        key="retort_build-construction",
+        title="Retort Building (construction)",
+        module="benchmarks.retort_build.hub_construction",
+        x_bounder=ClusterAxisBounder(
+            last_cluster_idx=-1,
+            boundary_rate=2,
+        ),
+    ),
+    HubDescription(
+        key="retort_build-first_call",
+        title="Retort Building (first call)",
+        module="benchmarks.retort_build.hub_first_call",
+        x_bounder=ClusterAxisBounder(
+            last_cluster_idx=-1,
+            boundary_rate=2,
+        ),
+    ),
 ]
 KEY_TO_HUB = {
     hub_description.key: hub_description
@@ -384,6 +436,12 @@ class Orchestrator(HubProcessor):
             type=int,
             default=None,
         )
+        parser.add_argument(
+            "--memory",
+            action="store_true",
+            required=False,
+            default=False,
+        )
 
     def __init__(
         self,
@@ -394,6 +452,7 @@ class Orchestrator(HubProcessor):
         env_exclude: Optional[Sequence[str]] = None,
         series: int = 2,
         max_tries: Optional[int] = None,
+        memory: bool = False,
     ):
         super().__init__(
             namespace=namespace,
@@ -404,6 +463,7 @@ class Orchestrator(HubProcessor):
         )
         self.series = series
         self.max_tries = max_tries
+        self.memory = memory
 
     def start(self) -> None:
         self.print("Start environments preparation")
@@ -506,9 +566,10 @@ class Orchestrator(HubProcessor):
     def run_case(self, hub_description: HubDescription, env_description: EnvDescription, case_state: CaseState) -> None:
         hub_module = hub_description.module
         env = env_description.tox_env
+        extra_args = " --memory" if self.memory else ""
         for _ in range(self.series):
             self.print(f"Running   hub: {hub_description.key:<30} env: {env}")
-            self.run(f"tox exec -e {env} --skip-pkg-install -- python -m {hub_module} run --unstable")
+            self.run(f"tox exec -e {env} --skip-pkg-install -- python -m {hub_module} run --unstable{extra_args}")
             case_state.tries_count += 1
             self.update_local_ids_with_warnings(case_state)
             if case_state.is_completed:
@@ -920,6 +981,50 @@ class Releaser(HubProcessor):
                 release_zip.writestr(filename, json.dumps(content))
 
 
+class MemoryReporter(HubProcessor):
+    """Prints median memory measures of all cases of the hub side by side,
+    so libraries can be compared. Only cases run with ``--memory`` are shown.
+    """
+
+    def start(self) -> None:
+        for hub_description, env_to_director in self.load_directors(self.filtered_hubs()).items():
+            for env_description, director in env_to_director.items():
+                self.print(f"{hub_description.key} at {env_description.title}")
+                rows = self._director_to_memory_rows(director)
+                if rows:
+                    self.print(self._format_table(rows))
+                else:
+                    self.print("No memory measures, run the hub with --memory to collect them")
+                self.print()
+
+    def _director_to_memory_rows(self, director: BenchmarkDirector) -> Sequence[tuple[str, MemoryMeasure]]:
+        accessor = director.make_accessor()
+        rows = []
+        for schema in accessor.schemas:
+            case_result = accessor.get_case_result(schema)
+            if case_result is None:
+                continue
+            memory = case_result["pybench_data"].get("memory")
+            if memory is None:
+                continue
+            rows.append((accessor.get_local_id(schema), get_median_memory_measure(memory)))
+        rows.sort(key=lambda row: row[1]["peak"])
+        return rows
+
+    def _format_table(self, rows: Sequence[tuple[str, MemoryMeasure]]) -> str:
+        min_peak = max(rows[0][1]["peak"], 1)
+        label_width = max(len("case"), *(len(label) for label, _ in rows))
+        lines = [f"{'case':<{label_width}}  {'peak, KiB':>12}  {'retained, KiB':>14}  {'peak ratio':>10}"]
+        lines.extend(
+            f"{label:<{label_width}}"
+            f"  {measure['peak'] / 1024:>12,.1f}"
+            f"  {measure['retained'] / 1024:>14,.1f}"
+            f"  {measure['peak'] / min_peak:>9.2f}x"
+            for label, measure in rows
+        )
+        return "\n".join(lines)
+
+
 class ListGetter(Foundation):
     @classmethod
     def add_arguments(cls, parser: ArgumentParser) -> None:
@@ -936,6 +1041,7 @@ class ListGetter(Foundation):
 COMMAND_TO_CLS = {
     "run": Orchestrator,
     "render": Renderer,
+    "memory": MemoryReporter,
     "validate": HubValidator,
     "release": Releaser,
     "list": ListGetter,
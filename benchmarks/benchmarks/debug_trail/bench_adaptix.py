@@ -0,0 +1,67 @@
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List
+
+from adaptix import DebugTrail, Retort
+from adaptix.load_error import LoadError
+from benchmarks.pybench.bench_api import benchmark_plan
+from benchmarks.simple_structures.common import create_dumped_book
+
+
+@dataclass
+class Review:
+    id: int
+    title: str
+    rating: float
+    text: str
+
+
+@dataclass
+class Book:
+    id: int
+    name: str
+    reviews: List[Review]
+
+
+retort = Retort()
+
+
+def create_invalid_dumped_book(*, reviews_count: int) -> Dict[str, Any]:
+    data = create_dumped_book(reviews_count=reviews_count)
+    # the error is placed at the end to make the loader process all valid data before failing
+    data["reviews"][-1]["id"] = str(data["reviews"][-1]["id"])
+    return data
+
+
+def load_invalid(loader: Callable[[Any], Book], data: Any) -> None:
+    try:
+        loader(data)
+    except LoadError:
+        pass
+    else:
+        raise RuntimeError("Invalid data is loaded without errors")
+
+
+def test_loading_valid():
+    for debug_trail in DebugTrail:
+        loader = retort.replace(debug_trail=debug_trail).get_loader(Book)
+        assert loader(create_dumped_book(reviews_count=1)).reviews[0].id == 482
+
+
+def test_loading_invalid():
+    for debug_trail in DebugTrail:
+        loader = retort.replace(debug_trail=debug_trail).get_loader(Book)
+        load_invalid(loader, create_invalid_dumped_book(reviews_count=1))
+
+
+def bench_loading_valid(debug_trail: str, reviews_count: int):
+    loader = retort.replace(debug_trail=DebugTrail(debug_trail)).get_loader(Book)
+
+    data = create_dumped_book(reviews_count=reviews_count)
+    return benchmark_plan(loader, data)
+
+
+def bench_loading_invalid(debug_trail: str, reviews_count: int):
+    loader = retort.replace(debug_trail=DebugTrail(debug_trail)).get_loader(Book)
+
+    data = create_invalid_dumped_book(reviews_count=reviews_count)
+    return benchmark_plan(load_invalid, loader, data)
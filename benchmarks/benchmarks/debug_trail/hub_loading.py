@@ -0,0 +1,39 @@
+import sys
+
+from adaptix import DebugTrail
+from benchmarks.debug_trail import bench_adaptix
+from benchmarks.pybench.director_api import BenchmarkDirector, BenchSchema, CheckParams
+
+REVIEWS_COUNT = 100
+
+director = BenchmarkDirector(
+    benchmark="debug_trail/loading",
+    env_spec={
+        "py": f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}",
+        "py_impl": sys.implementation.name,
+    },
+    check_params=lambda env_spec: CheckParams(
+        stdev_rel_threshold=0.07 if env_spec["py_impl"] == "pypy" else 0.04,
+    ),
+)
+
+for debug_trail in DebugTrail:
+    director.add(
+        BenchSchema(
+            entry_point=bench_adaptix.bench_loading_valid,
+            base="adaptix",
+            tags=["valid", f"dt_{debug_trail.value.lower()}"],
+            kwargs={"debug_trail": debug_trail.value, "reviews_count": REVIEWS_COUNT},
+            used_distributions=["adaptix"],
+        ),
+        BenchSchema(
+            entry_point=bench_adaptix.bench_loading_invalid,
+            base="adaptix",
+            tags=["invalid", f"dt_{debug_trail.value.lower()}"],
+            kwargs={"debug_trail": debug_trail.value, "reviews_count": REVIEWS_COUNT},
+            used_distributions=["adaptix"],
+        ),
+    )
+
+if __name__ == "__main__":
+    director.cli()
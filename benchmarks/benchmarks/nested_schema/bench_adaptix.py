@@ -0,0 +1,52 @@
+from dataclasses import make_dataclass
+from typing import Any, Dict
+
+from adaptix import Retort
+from adaptix.provider import invalidate_shape_cache
+from adaptix.retort import clear_code_caches
+from benchmarks.pybench.bench_api import benchmark_plan
+
+
+def create_nested_schema(depth: int) -> Any:
+    schema = make_dataclass("Level0", [("value", int)])
+    for i in range(1, depth):
+        schema = make_dataclass(f"Level{i}", [("value", int), ("child", schema)])
+    return schema
+
+
+def create_nested_data(depth: int) -> Dict[str, Any]:
+    data: Dict[str, Any] = {"value": 0}
+    for i in range(1, depth):
+        data = {"value": i, "child": data}
+    return data
+
+
+def reset_process_caches() -> None:
+    # shapes and compiled code are shared between retorts,
+    # so the first call of a new retort is cold only after these caches are cleared
+    invalidate_shape_cache()
+    clear_code_caches()
+
+
+def build_loader(schema: Any) -> Any:
+    reset_process_caches()
+    return Retort().get_loader(schema)
+
+
+def build_dumper(schema: Any) -> Any:
+    reset_process_caches()
+    return Retort().get_dumper(schema)
+
+
+def test_nested_schema():
+    schema = create_nested_schema(10)
+    data = create_nested_data(10)
+    assert build_dumper(schema)(build_loader(schema)(data)) == data
+
+
+def bench_loader_building(depth: int):
+    return benchmark_plan(build_loader, create_nested_schema(depth))
+
+
+def bench_dumper_building(depth: int):
+    return benchmark_plan(build_dumper, create_nested_schema(depth))
@@ -0,0 +1,36 @@
+import sys
+
+from benchmarks.nested_schema import bench_adaptix
+from benchmarks.pybench.director_api import BenchmarkDirector, BenchSchema, CheckParams
+
+director = BenchmarkDirector(
+    benchmark="nested_schema/building",
+    env_spec={
+        "py": f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}",
+        "py_impl": sys.implementation.name,
+    },
+    check_params=lambda env_spec: CheckParams(
+        stdev_rel_threshold=0.07 if env_spec["py_impl"] == "pypy" else 0.04,
+    ),
+)
+
+for depth in (10, 25, 50):
+    director.add(
+        BenchSchema(
+            entry_point=bench_adaptix.bench_loader_building,
+            base="adaptix",
+            tags=["loader", f"depth_{depth}"],
+            kwargs={"depth": depth},
+            used_distributions=["adaptix"],
+        ),
+        BenchSchema(
+            entry_point=bench_adaptix.bench_dumper_building,
+            base="adaptix",
+            tags=["dumper", f"depth_{depth}"],
+            kwargs={"depth": depth},
+            used_distributions=["adaptix"],
+        ),
+    )
+
+if __name__ == "__main__":
+    director.cli()
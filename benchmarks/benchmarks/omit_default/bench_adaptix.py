@@ -0,0 +1,62 @@
+from dataclasses import field, make_dataclass
+from typing import Any, List, Optional
+
+from adaptix import DebugTrail, Retort, name_mapping
+from benchmarks.pybench.bench_api import benchmark_plan
+
+FIELDS_COUNT = 80
+SPARSE_SET_FIELDS_COUNT = 2
+
+
+def create_wide_schema(fields_count: int) -> Any:
+    return make_dataclass(
+        "WideModel",
+        [
+            ("id", int),
+            *(
+                (f"opt_{i}", Optional[int], field(default=None))
+                if i % 2 == 0 else
+                (f"list_{i}", List[int], field(default_factory=list))
+                for i in range(1, fields_count)
+            ),
+        ],
+    )
+
+
+def create_wide_object(schema: Any, set_fields_count: int) -> Any:
+    return schema(
+        id=0,
+        **{
+            f"opt_{i}" if i % 2 == 0 else f"list_{i}": i if i % 2 == 0 else [i]
+            for i in range(1, set_fields_count + 1)
+        },
+    )
+
+
+retort = Retort(
+    recipe=[
+        name_mapping(omit_default=True),
+    ],
+)
+
+
+def test_dumping():
+    schema = create_wide_schema(FIELDS_COUNT)
+    dumper = retort.get_dumper(schema)
+    assert dumper(create_wide_object(schema, 0)) == {"id": 0}
+    assert dumper(create_wide_object(schema, SPARSE_SET_FIELDS_COUNT)) == {
+        "id": 0,
+        "list_1": [1],
+        "opt_2": 2,
+    }
+    assert len(dumper(create_wide_object(schema, FIELDS_COUNT - 1))) == FIELDS_COUNT
+
+
+def bench_dumping(debug_trail: str, set_fields_count: int):
+    schema = create_wide_schema(FIELDS_COUNT)
+    dumper = retort.replace(
+        debug_trail=DebugTrail(debug_trail),
+    ).get_dumper(schema)
+
+    data = create_wide_object(schema, set_fields_count)
+    return benchmark_plan(dumper, data)
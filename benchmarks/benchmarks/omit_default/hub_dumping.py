@@ -0,0 +1,36 @@
+import sys
+
+from adaptix import DebugTrail
+from benchmarks.omit_default import bench_adaptix
+from benchmarks.pybench.director_api import BenchmarkDirector, BenchSchema, CheckParams
+
+director = BenchmarkDirector(
+    benchmark="omit_default/dumping",
+    env_spec={
+        "py": f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}",
+        "py_impl": sys.implementation.name,
+    },
+    check_params=lambda env_spec: CheckParams(
+        stdev_rel_threshold=0.07 if env_spec["py_impl"] == "pypy" else 0.04,
+    ),
+)
+
+DENSITY_TO_SET_FIELDS_COUNT = {
+    "sparse": bench_adaptix.SPARSE_SET_FIELDS_COUNT,
+    "dense": bench_adaptix.FIELDS_COUNT - 1,
+}
+
+for debug_trail in DebugTrail:
+    for density, set_fields_count in DENSITY_TO_SET_FIELDS_COUNT.items():
+        director.add(
+            BenchSchema(
+                entry_point=bench_adaptix.bench_dumping,
+                base="adaptix",
+                tags=[density, f"dt_{debug_trail.value.lower()}"],
+                kwargs={"debug_trail": debug_trail.value, "set_fields_count": set_fields_count},
+                used_distributions=["adaptix"],
+            ),
+        )
+
+if __name__ == "__main__":
+    director.cli()
@@ -12,6 +12,7 @@ from copy import copy
 from dataclasses import dataclass
 from functools import cached_property
 from pathlib import Path
+from statistics import median
 from tempfile import TemporaryDirectory
 from typing import Any, Callable, Literal, Optional, TypeVar, Union
 
@@ -23,6 +24,8 @@ from benchmarks.pybench.storage import (
     BenchCaseResultStats,
     BenchStorage,
     FilesystemBenchStorage,
+    MemoryMeasure,
+    PybenchMemoryData,
     SqliteBenchStorage,
     UninitedBenchStorage,
 )
@@ -43,6 +46,7 @@ EnvSpec = Mapping[str, str]
 class CheckParams:
     stdev_rel_threshold: Optional[float] = None
     ignore_pyperf_warnings: Optional[bool] = None
+    memory_rel_threshold: Optional[float] = None
 
 
 @dataclass(frozen=True)
@@ -58,6 +62,7 @@ class BenchSchema:
 
 BUILTIN_CHECK_PARAMS = CheckParams(
     ignore_pyperf_warnings=False,
+    memory_rel_threshold=0.05,
 )
 
 
@@ -222,7 +227,8 @@ class BenchChecker:
         check_params = self.accessor.resolve_check_params(schema)
         warnings = self._process_pyperf_warnings(schema, bench, check_params, format_checks(bench))
         self_warnings = self._check_yourself(schema, bench, check_params)
-        return [*warnings, *self_warnings]
+        memory_warnings = self._check_memory(data, check_params)
+        return [*warnings, *self_warnings, *memory_warnings]
 
     def _check_yourself(self, schema: BenchSchema, bench: pyperf.Benchmark, check_params: CheckParams) -> Sequence[str]:
         lines: list[str] = []
@@ -236,6 +242,24 @@ class BenchChecker:
             )
         return lines
 
+    def _check_memory(self, data: BenchCaseResult, check_params: CheckParams) -> Sequence[str]:
+        memory = data["pybench_data"].get("memory")
+        threshold = check_params.memory_rel_threshold
+        if memory is None or threshold is None:
+            return []
+
+        lines: list[str] = []
+        measure = get_median_memory_measure(memory)
+        for key in ("peak", "retained"):
+            value = measure[key]
+            baseline = memory["baseline"][key]
+            if value > baseline * (1 + threshold):
+                lines.append(
+                    f"the {key} memory has grown from {baseline} to {value} bytes,"
+                    f" max allowed growth is {threshold:.0%}",
+                )
+        return lines
+
     def check_results(self, *, local_id_list: bool = False):
         lines = []
         schemas_with_warnings = []
@@ -256,6 +280,13 @@ class BenchChecker:
             print("\n".join(lines))
 
 
+def get_median_memory_measure(memory: PybenchMemoryData) -> MemoryMeasure:
+    return {
+        "peak": int(median(memory["peak"])),
+        "retained": int(median(memory["retained"])),
+    }
+
+
 class BenchRunner:
     def __init__(self, accessor: BenchAccessor, checker: BenchChecker):
         self.accessor = accessor
@@ -276,6 +307,19 @@ class BenchRunner:
             help="run only unstable or missing benchmarks",
         )
 
+        memory_group = parser.add_argument_group("memory")
+        memory_group.add_argument(
+            "--memory", action="store_true", required=False, default=False,
+            help="also measure peak and retained memory of each call via tracemalloc",
+        )
+        memory_group.add_argument(
+            "--memory-runs", action="store", required=False, type=int, default=5,
+        )
+        memory_group.add_argument(
+            "--reset-memory-baseline", action="store_true", required=False, default=False,
+            help="use new memory measures as a baseline instead of the stored one",
+        )
+
     def run_benchmarks(
         self,
         *,
@@ -283,6 +327,9 @@ class BenchRunner:
         exclude: Optional[Sequence[str]] = None,
         missing: bool = False,
         unstable: bool = False,
+        memory: bool = False,
+        memory_runs: int = 5,
+        reset_memory_baseline: bool = False,
     ) -> None:
         schemas: Sequence[BenchSchema]
         if missing:
@@ -323,9 +370,19 @@ class BenchRunner:
 
         print("Benchmarks to run: " + " ".join(benchmarks_to_run))
         for tag in benchmarks_to_run:
-            self.run_one_benchmark(local_id_to_schema[tag])
+            self.run_one_benchmark(
+                local_id_to_schema[tag],
+                memory_runs=memory_runs if memory else None,
+                reset_memory_baseline=reset_memory_baseline,
+            )
 
-    def run_one_benchmark(self, schema: BenchSchema) -> None:
+    def run_one_benchmark(
+        self,
+        schema: BenchSchema,
+        *,
+        memory_runs: Optional[int] = None,
+        reset_memory_baseline: bool = False,
+    ) -> None:
         distributions = {
             dist: importlib.metadata.version(dist)
             for dist in schema.used_distributions
@@ -336,20 +393,38 @@ class BenchRunner:
             if isinstance(schema.entry_point, str) else
             schema.entry_point,
         )
+        entrypoint = (
+            schema.entry_point
+            if isinstance(schema.entry_point, str) else
+            get_function_object_ref(schema.entry_point)
+        )
+        params = [schema.kwargs[param] for param in sig.parameters]
         with TemporaryDirectory() as dir_name:
             temp_file = Path(dir_name) / f"{bench_id}.json"
             print(f"start: {bench_id}")
             self.launch_benchmark(
                 bench_name=bench_id,
-                entrypoint=(
-                    schema.entry_point
-                    if isinstance(schema.entry_point, str) else
-                    get_function_object_ref(schema.entry_point)
-                ),
-                params=[schema.kwargs[param] for param in sig.parameters],
+                entrypoint=entrypoint,
+                params=params,
                 extra_args=["-o", str(temp_file)],
             )
             case_result: BenchCaseResult = json.loads(temp_file.read_text())
+
+            memory_data = None
+            if memory_runs is not None:
+                memory_file = Path(dir_name) / f"{bench_id}-memory.json"
+                self.launch_memory_benchmark(
+                    entrypoint=entrypoint,
+                    params=params,
+                    runs=memory_runs,
+                    output_file=memory_file,
+                )
+                memory_data = self._make_memory_data(
+                    schema,
+                    json.loads(memory_file.read_text()),
+                    reset_baseline=reset_memory_baseline,
+                )
+
             case_result["pybench_data"] = {
                 "case_id": self.accessor.get_id(schema),
                 "base": schema.base,
@@ -357,6 +432,7 @@ class BenchRunner:
                 "env_spec": self.accessor.env_spec,
                 "kwargs": schema.kwargs,
                 "distributions": distributions,
+                "memory": memory_data,
             }
             bench = pyperf.Benchmark.loads(
                 json.dumps(case_result, ensure_ascii=False, check_circular=False),
@@ -372,8 +448,37 @@ class BenchRunner:
                 f" (max allowed is {check_params.stdev_rel_threshold:.1%})"
                 "\n",
             )
+            if memory_data is not None:
+                measure = get_median_memory_measure(memory_data)
+                print(
+                    f"Peak memory is {measure['peak']} bytes (baseline is {memory_data['baseline']['peak']}),"
+                    f" retained memory is {measure['retained']} bytes"
+                    f" (baseline is {memory_data['baseline']['retained']})"
+                    "\n",
+                )
             self.accessor.write_case_result(case_result, stats)
 
+    def _make_memory_data(
+        self,
+        schema: BenchSchema,
+        measures: Mapping[str, Sequence[int]],
+        *,
+        reset_baseline: bool,
+    ) -> PybenchMemoryData:
+        memory_data: PybenchMemoryData = {
+            "peak": measures["peak"],
+            "retained": measures["retained"],
+            "baseline": {"peak": 0, "retained": 0},
+        }
+        # baseline is inherited from the first stored measurement, so rerunning does not hide a regression
+        previous_result = None if reset_baseline else self.accessor.get_case_result(schema)
+        previous_memory = None if previous_result is None else previous_result["pybench_data"].get("memory")
+        if previous_memory is None:
+            memory_data["baseline"] = get_median_memory_measure(memory_data)
+        else:
+            memory_data["baseline"] = previous_memory["baseline"]
+        return memory_data
+
     def launch_benchmark(
         self,
         bench_name: str,
@@ -396,6 +501,24 @@ class BenchRunner:
             check=True,
         )
 
+    def launch_memory_benchmark(
+        self,
+        entrypoint: str,
+        params: list[Any],
+        runs: int,
+        output_file: Path,
+    ) -> None:
+        subprocess.run(
+            [sys.executable, "-m", "benchmarks.pybench.memory_runner", str(output_file)],
+            env={
+                **os.environ,
+                "PYBENCH_ENTRYPOINT": entrypoint,
+                "PYBENCH_PARAMS": json.dumps(params),
+                "PYBENCH_MEMORY_RUNS": str(runs),
+            },
+            check=True,
+        )
+
 
 T = TypeVar("T")
 
@@ -0,0 +1,52 @@
+# pylint: disable=import-error,no-name-in-module
+import gc
+import json
+import os
+import sys
+import tracemalloc
+from pathlib import Path
+from typing import Any
+
+from benchmarks.pybench.bench_api import BenchmarkPlan
+from benchmarks.pybench.utils import load_by_object_ref
+
+
+def measure_once(benchmark_plan: BenchmarkPlan) -> tuple[int, int]:
+    """Return peak of allocated memory during the call
+    and the amount of memory retained by the call result.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result: Any = benchmark_plan.func(*benchmark_plan.args)
+        peak = tracemalloc.get_traced_memory()[1]
+        gc.collect()
+        retained = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del result
+    return peak, retained
+
+
+def main():
+    output_file = Path(sys.argv[1])
+    runs = int(os.environ["PYBENCH_MEMORY_RUNS"])
+    func = load_by_object_ref(os.environ["PYBENCH_ENTRYPOINT"])
+    params = json.loads(os.environ["PYBENCH_PARAMS"])
+
+    benchmark_plan = func(*params)
+    # first call fills caches (lazy imports, interned strings, etc.) that do not belong to the measured code
+    benchmark_plan.func(*benchmark_plan.args)
+
+    peaks = []
+    retained = []
+    for _ in range(runs):
+        run_peak, run_retained = measure_once(benchmark_plan)
+        peaks.append(run_peak)
+        retained.append(run_retained)
+
+    output_file.write_text(json.dumps({"peak": peaks, "retained": retained}))
+
+
+if __name__ == "__main__":
+    main()
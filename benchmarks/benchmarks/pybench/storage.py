@@ -1,7 +1,7 @@
 import json
 import sqlite3
 from abc import ABC, abstractmethod
-from collections.abc import Iterable, Mapping
+from collections.abc import Iterable, Mapping, Sequence
 from contextlib import AbstractContextManager
 from datetime import datetime, timezone
 from pathlib import Path
@@ -10,6 +10,17 @@ from typing import Any, Optional, TypedDict
 from pyperf._formatter import format_timedelta
 
 
+class MemoryMeasure(TypedDict):
+    peak: int
+    retained: int
+
+
+class PybenchMemoryData(TypedDict):
+    peak: Sequence[int]
+    retained: Sequence[int]
+    baseline: MemoryMeasure
+
+
 class PybenchData(TypedDict):
     case_id: str
     base: str
@@ -17,6 +28,7 @@ class PybenchData(TypedDict):
     env_spec: Mapping[str, str]
     kwargs: Mapping[str, Any]
     distributions: Mapping[str, str]
+    memory: Optional[PybenchMemoryData]
 
 
 class BenchCaseResult(TypedDict):
@@ -0,0 +1,72 @@
+from dataclasses import make_dataclass
+from functools import partial
+from typing import Any, Callable, Dict, List, Union
+
+from adaptix import P, Provider, Retort, loader
+from benchmarks.nested_schema.bench_adaptix import create_nested_schema, reset_process_caches
+from benchmarks.pybench.bench_api import benchmark_plan
+
+
+def create_flat_schema(size: int) -> Any:
+    return make_dataclass("Flat", [(f"field_{i}", int) for i in range(size)])
+
+
+def create_union_schema(width: int) -> Any:
+    cases = tuple(
+        make_dataclass(f"Case{i}", [(f"field_{i}", int)])
+        for i in range(width)
+    )
+    return make_dataclass("WithUnion", [("value", Union[cases])])  # type: ignore[arg-type]
+
+
+def create_recipe(length: int) -> List[Provider]:
+    # providers never match the schemas, so each of them is checked on every request
+    return [
+        loader(P[f"unknown_field_{i}"], int)
+        for i in range(length)
+    ]
+
+
+SCHEMA_FACTORIES: Dict[str, Callable[[int], Any]] = {
+    "flat": create_flat_schema,
+    "nested": create_nested_schema,
+    "union": create_union_schema,
+}
+
+
+def build_loader(schema: Any, recipe: List[Provider]) -> Any:
+    reset_process_caches()
+    return Retort(recipe=recipe).get_loader(schema)
+
+
+def build_dumper(schema: Any, recipe: List[Provider]) -> Any:
+    reset_process_caches()
+    return Retort(recipe=recipe).get_dumper(schema)
+
+
+def test_schemas():
+    assert create_flat_schema(3)(field_0=0, field_1=1, field_2=2)
+    for factory in SCHEMA_FACTORIES.values():
+        build_loader(factory(5), create_recipe(5))
+        build_dumper(factory(5), create_recipe(5))
+
+
+def test_extend():
+    Retort().extend(recipe=create_recipe(5)).get_loader(create_flat_schema(5))
+
+
+def bench_construction(recipe_length: int):
+    return benchmark_plan(partial(Retort, recipe=create_recipe(recipe_length)))
+
+
+def bench_extend(recipe_length: int):
+    retort = Retort()
+    return benchmark_plan(partial(retort.extend, recipe=create_recipe(recipe_length)))
+
+
+def bench_first_loader(schema: str, size: int, recipe_length: int):
+    return benchmark_plan(build_loader, SCHEMA_FACTORIES[schema](size), create_recipe(recipe_length))
+
+
+def bench_first_dumper(schema: str, size: int, recipe_length: int):
+    return benchmark_plan(build_dumper, SCHEMA_FACTORIES[schema](size), create_recipe(recipe_length))
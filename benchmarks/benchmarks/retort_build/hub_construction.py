@@ -0,0 +1,36 @@
+import sys
+
+from benchmarks.pybench.director_api import BenchmarkDirector, BenchSchema, CheckParams
+from benchmarks.retort_build import bench_adaptix
+
+director = BenchmarkDirector(
+    benchmark="retort_build/construction",
+    env_spec={
+        "py": f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}",
+        "py_impl": sys.implementation.name,
+    },
+    check_params=lambda env_spec: CheckParams(
+        stdev_rel_threshold=0.07 if env_spec["py_impl"] == "pypy" else 0.04,
+    ),
+)
+
+for recipe_length in (0, 10, 100):
+    director.add(
+        BenchSchema(
+            entry_point=bench_adaptix.bench_construction,
+            base="adaptix",
+            tags=["construction", f"recipe_{recipe_length}"],
+            kwargs={"recipe_length": recipe_length},
+            used_distributions=["adaptix"],
+        ),
+        BenchSchema(
+            entry_point=bench_adaptix.bench_extend,
+            base="adaptix",
+            tags=["extend", f"recipe_{recipe_length}"],
+            kwargs={"recipe_length": recipe_length},
+            used_distributions=["adaptix"],
+        ),
+    )
+
+if __name__ == "__main__":
+    director.cli()
@@ -0,0 +1,45 @@
+import sys
+
+from benchmarks.pybench.director_api import BenchmarkDirector, BenchSchema, CheckParams
+from benchmarks.retort_build import bench_adaptix
+
+director = BenchmarkDirector(
+    benchmark="retort_build/first_call",
+    env_spec={
+        "py": f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}",
+        "py_impl": sys.implementation.name,
+    },
+    check_params=lambda env_spec: CheckParams(
+        stdev_rel_threshold=0.07 if env_spec["py_impl"] == "pypy" else 0.04,
+    ),
+)
+
+SCHEMA_SIZES = {
+    "flat": (10, 50, 200),
+    "nested": (5, 20, 50),
+    "union": (2, 8, 32),
+}
+RECIPE_LENGTHS = (0, 100)
+
+for schema, sizes in SCHEMA_SIZES.items():
+    for size in sizes:
+        for recipe_length in RECIPE_LENGTHS:
+            director.add(
+                BenchSchema(
+                    entry_point=bench_adaptix.bench_first_loader,
+                    base="adaptix",
+                    tags=["loader", f"{schema}_{size}", f"recipe_{recipe_length}"],
+                    kwargs={"schema": schema, "size": size, "recipe_length": recipe_length},
+                    used_distributions=["adaptix"],
+                ),
+                BenchSchema(
+                    entry_point=bench_adaptix.bench_first_dumper,
+                    base="adaptix",
+                    tags=["dumper", f"{schema}_{size}", f"recipe_{recipe_length}"],
+                    kwargs={"schema": schema, "size": size, "recipe_length": recipe_length},
+                    used_distributions=["adaptix"],
+                ),
+            )
+
+if __name__ == "__main__":
+    director.cli()
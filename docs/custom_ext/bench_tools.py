@@ -48,7 +48,10 @@ class CustomBenchUsedDistributions(SphinxMacroDirective):
         distributions: dict[str, str] = {}
 
         for hub_description in BENCHMARK_HUBS:
-            with ZipFile(RELEASE_DATA / f"{hub_description.key}.zip") as release_zip:
+            release_file = RELEASE_DATA / f"{hub_description.key}.zip"
+            if not release_file.exists():  # hub is added after the last release
+                continue
+            with ZipFile(release_file) as release_zip:
                 index = json.loads(release_zip.read("index.json"))
                 for file_list in index["env_files"].values():
                     for file in file_list:
@@ -0,0 +1,22 @@
+import sqlite3
+from dataclasses import dataclass
+
+from adaptix.conversion import get_converter, make_row_type
+
+
+@dataclass
+class Book:
+    id: int
+    title: str
+    price: int
+
+
+connection = sqlite3.connect(":memory:")
+connection.execute("CREATE TABLE book (id INTEGER, title TEXT, price INTEGER)")
+connection.execute("INSERT INTO book VALUES (1, 'Fahrenheit 451', 100)")
+
+cursor = connection.execute("SELECT price, title, id FROM book")
+BookRow = make_row_type(cursor.description)
+convert_row_to_book = get_converter(BookRow, Book)
+
+assert [convert_row_to_book(row) for row in cursor] == [Book(id=1, title="Fahrenheit 451", price=100)]
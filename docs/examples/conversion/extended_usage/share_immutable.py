@@ -0,0 +1,28 @@
+from dataclasses import dataclass
+
+from adaptix.conversion import get_converter, share_immutable
+
+
+@dataclass(frozen=True)
+class Currency:
+    code: str
+    symbols: tuple[str, ...]
+
+
+@dataclass
+class Product:
+    title: str
+    currency: Currency
+
+
+@dataclass
+class ProductDTO:
+    title: str
+    currency: Currency
+
+
+convert_product_to_dto = get_converter(Product, ProductDTO, recipe=[share_immutable()])
+
+usd = Currency(code="USD", symbols=("$",))
+dto = convert_product_to_dto(Product(title="Book", currency=usd))
+assert dto.currency is usd
@@ -0,0 +1,24 @@
+from dataclasses import dataclass
+
+from adaptix.conversion import get_updater
+
+
+@dataclass
+class Book:
+    id: int
+    title: str
+    price: int
+    author: str
+
+
+@dataclass
+class BookPatch:
+    title: str
+    price: int
+
+
+update_book = get_updater(BookPatch, Book, skip_unchanged=True)
+
+book = Book(id=1, title="Fahrenheit 451", price=100, author="Ray Bradbury")
+update_book(BookPatch(title="Fahrenheit 451", price=120), book)
+assert book == Book(id=1, title="Fahrenheit 451", price=120, author="Ray Bradbury")
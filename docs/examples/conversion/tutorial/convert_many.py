@@ -0,0 +1,30 @@
+from dataclasses import dataclass
+
+from adaptix.conversion import convert_many, get_converter
+
+
+@dataclass
+class Book:
+    title: str
+    price: int
+
+
+@dataclass
+class BookDTO:
+    title: str
+    price: int
+
+
+books = [
+    Book(title="Fahrenheit 451", price=100),
+    Book(title="1984", price=120),
+]
+
+assert (
+    convert_many(books, BookDTO)
+    ==
+    [BookDTO(title="Fahrenheit 451", price=100), BookDTO(title="1984", price=120)]
+)
+
+convert_books_to_dto = get_converter(list[Book], list[BookDTO])
+assert convert_books_to_dto(books) == convert_many(books, BookDTO)
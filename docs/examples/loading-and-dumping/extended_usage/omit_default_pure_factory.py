@@ -0,0 +1,29 @@
+from dataclasses import dataclass, field
+
+from adaptix import Retort, name_mapping
+
+
+@dataclass(frozen=True)
+class Pagination:
+    limit: int = 100
+    offset: int = 0
+
+
+@dataclass
+class SearchRequest:
+    query: str
+    pagination: Pagination = field(default_factory=Pagination)
+
+
+retort = Retort(
+    recipe=[
+        name_mapping(
+            SearchRequest,
+            omit_default=True,
+            pure_default_factory=True,
+        ),
+    ],
+)
+
+request = SearchRequest(query="adaptix")
+assert retort.dump(request) == {"query": "adaptix"}
@@ -0,0 +1,19 @@
+from typing import TypedDict
+
+from adaptix import Retort, share_typed_dict_input
+
+
+class Author(TypedDict):
+    name: str
+    born_at: int
+
+
+class Book(TypedDict):
+    title: str
+    author: Author
+
+
+retort = Retort(recipe=[share_typed_dict_input(Book, Author)])
+
+data = {"title": "Fahrenheit 451", "author": {"name": "Ray Bradbury", "born_at": 1920}}
+assert retort.load(data, Book) is data
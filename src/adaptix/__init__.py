@@ -6,6 +6,7 @@ from ._internal.morphing.facade.provider import (
     as_is_loader,
     as_sentinel,
     constructor,
+    copy_typed_dict_input,
     date_by_timestamp,
     datetime_by_format,
     datetime_by_timestamp,
@@ -18,6 +19,7 @@ from ._internal.morphing.facade.provider import (
     flag_by_member_names,
     loader,
     name_mapping,
+    share_typed_dict_input,
     validator,
     with_property,
 )
@@ -80,6 +82,7 @@ __all__ = (
     "as_sentinel",
     "bound",
     "constructor",
+    "copy_typed_dict_input",
     "create_loc_stack_checker",
     "date_by_timestamp",
     "datetime_by_format",
@@ -97,6 +100,7 @@ __all__ = (
     "name_mapping",
     "provider",
     "retort",
+    "share_typed_dict_input",
     "validator",
     "with_property",
 )
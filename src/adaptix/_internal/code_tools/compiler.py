@@ -1,8 +1,14 @@
+import hashlib
 import linecache
+import sys
+import zlib
 from abc import ABC, abstractmethod
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
+from collections.abc import Iterator, Sequence
+from enum import Enum
 from threading import Lock
-from typing import Any, Callable
+from types import CodeType
+from typing import Any, Callable, Generic, TypeVar, Union, overload
 
 from .code_builder import CodeBuilder
 
@@ -43,8 +49,207 @@ class ConcurrentCounter:
 
 _counter = ConcurrentCounter()
 
+T = TypeVar("T")
+
+
+class SourceDigestCache(Generic[T]):
+    """LRU cache of objects produced from source code.
+    Entries are keyed by the digest of source, so the cache does not keep the source text itself.
+    """
+    __slots__ = ("_data", "_factory", "_lock", "_maxsize")
+
+    def __init__(self, factory: Callable[[str], T], maxsize: int):
+        self._factory = factory
+        self._maxsize = maxsize
+        self._lock = Lock()
+        self._data: OrderedDict[bytes, T] = OrderedDict()
+
+    def __call__(self, source: str) -> T:
+        key = hashlib.sha256(source.encode()).digest()
+        with self._lock:
+            try:
+                self._data.move_to_end(key)
+                return self._data[key]
+            except KeyError:
+                pass
+
+        value = self._factory(source)
+        with self._lock:
+            self._data[key] = value
+            if len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+        return value
+
+    def values(self) -> list[T]:
+        with self._lock:
+            return list(self._data.values())
+
+    def cache_clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+_compile_source = SourceDigestCache(lambda source: compile(source, "<adaptix generated>", "exec"), maxsize=512)
+
+
+def _replace_filename(code_obj: CodeType, filename: str) -> CodeType:
+    return code_obj.replace(
+        co_filename=filename,
+        co_consts=tuple(
+            _replace_filename(const, filename) if isinstance(const, CodeType) else const
+            for const in code_obj.co_consts
+        ),
+    )
+
+
+class SourceRetention(Enum):
+    """Policy of storing source code of generated closures at ``linecache``.
+    The source is required only to render tracebacks and for ``inspect.getsource``.
+
+    ``FULL`` -- source lines are stored as is.
+    ``LAZY`` -- source is stored compressed and lines are materialized on each access.
+    ``NONE`` -- source is not stored, tracebacks contain no lines of generated code.
+    """
+    FULL = "FULL"
+    LAZY = "LAZY"
+    NONE = "NONE"
+
+
+class CompressedLines(Sequence[str]):
+    __slots__ = ("_data", "_len")
+
+    def __init__(self, source: str):
+        lines = source.splitlines(keepends=True)
+        self._len = len(lines)
+        self._data = zlib.compress("".join(lines).encode())
+
+    def _materialize(self) -> list[str]:
+        return zlib.decompress(self._data).decode().splitlines(keepends=True)
+
+    @overload
+    def __getitem__(self, index: int) -> str:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[str]:
+        ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[str, list[str]]:
+        return self._materialize()[index]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._materialize())
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __sizeof__(self) -> int:
+        return object.__sizeof__(self) + sys.getsizeof(self._data)
+
+
+_get_full_lines = SourceDigestCache(lambda source: source.splitlines(keepends=True), maxsize=512)
+_get_compressed_lines = SourceDigestCache(CompressedLines, maxsize=512)
+
+
+class GeneratedSourceRegistry:
+    """Registers source code of generated closures at ``linecache``.
+    Closures produced from the same source share one storage of lines.
+    """
+
+    _MIN_PRUNE_THRESHOLD = 1024
+
+    def __init__(self, retention: SourceRetention = SourceRetention.FULL):
+        self.retention = retention
+        self._lock = Lock()
+        self._filenames: set[str] = set()
+        self._prune_threshold = self._MIN_PRUNE_THRESHOLD
+
+    def register(self, filename: str, source: str) -> None:
+        lines: Sequence[str]
+        if self.retention == SourceRetention.FULL:
+            lines = _get_full_lines(source)
+        elif self.retention == SourceRetention.LAZY:
+            lines = _get_compressed_lines(source)
+        else:
+            return
+
+        linecache.cache[filename] = (len(source), None, lines, filename)  # type: ignore[assignment]
+        with self._lock:
+            self._filenames.add(filename)
+            if len(self._filenames) >= self._prune_threshold:
+                self._prune()
+
+    def _prune(self) -> None:
+        # entries can be removed from linecache by other code (e.g. ``linecache.clearcache()``)
+        self._filenames = {
+            filename for filename in self._filenames
+            if filename in linecache.cache and len(linecache.cache[filename]) != 1
+        }
+        self._prune_threshold = max(self._MIN_PRUNE_THRESHOLD, len(self._filenames) * 2)
+
+    def get_retained_size(self) -> int:
+        """Calculate amount of bytes retained by sources of generated closures.
+        It includes lines stored at ``linecache`` and lines kept by caches sharing them between closures.
+        Compiled code objects are not counted.
+        """
+        with self._lock:
+            self._prune()
+            filenames = list(self._filenames)
+
+        all_lines: list[Sequence[str]] = []
+        for filename in filenames:
+            entry = linecache.cache.get(filename)
+            if entry is not None and len(entry) != 1:
+                all_lines.append(entry[2])
+        all_lines.extend(_get_full_lines.values())
+        all_lines.extend(_get_compressed_lines.values())
+
+        seen_ids = set()
+        size = 0
+        for lines in all_lines:
+            if id(lines) in seen_ids:
+                continue
+            seen_ids.add(id(lines))
+            size += sys.getsizeof(lines)
+            if isinstance(lines, list):
+                size += sum(sys.getsizeof(line) for line in lines)
+        return size
+
+
+generated_source_registry = GeneratedSourceRegistry()
+
+
+def set_source_retention(retention: SourceRetention) -> None:
+    """Set how source code of closures generated after this call is stored for tracebacks.
+    Closures that are already generated keep their sources.
+    """
+    generated_source_registry.retention = retention
+
+
+def get_retained_source_size() -> int:
+    """Return the approximate amount of memory (in bytes) retained by source code of generated closures.
+    Compiled code objects are not counted.
+    """
+    return generated_source_registry.get_retained_size()
+
+
+def clear_code_caches() -> None:
+    """Drop compiled code objects and source lines that are shared between generated closures.
+    Closures generated after this call are compiled from scratch, already generated closures are not affected.
+    """
+    _compile_source.cache_clear()
+    _get_full_lines.cache_clear()
+    _get_compressed_lines.cache_clear()
+
 
 class BasicClosureCompiler(ClosureCompiler):
+    """Compiler executing source of each closure at a separate generated file.
+
+    Code objects are cached by digest of source text, so structurally identical closures
+    (e.g. loaders of different parametrizations of the same generic model)
+    are compiled only once and differ only by namespace and filename.
+    """
+
     def _make_source_builder(self, builder: CodeBuilder) -> CodeBuilder:
         main_builder = CodeBuilder()
 
@@ -55,16 +260,11 @@ class BasicClosureCompiler(ClosureCompiler):
         return main_builder
 
     def _compile(self, source: str, unique_filename: str, namespace: dict[str, Any]):
-        code_obj = compile(source, unique_filename, "exec")
+        code_obj = _replace_filename(_compile_source(source), unique_filename)
 
         local_namespace: dict[str, Any] = {}
         exec(code_obj, namespace, local_namespace)  # noqa: S102
-        linecache.cache[unique_filename] = (
-            len(source),
-            None,
-            source.splitlines(keepends=True),
-            unique_filename,
-        )
+        generated_source_registry.register(unique_filename, source)
         return local_namespace["_closure_maker"]()
 
     def _get_unique_id(self, base_id: str) -> str:
@@ -7,6 +7,8 @@ T = TypeVar("T")
 Loader = Callable[[Any], V_co]
 Dumper = Callable[[K_contra], Any]
 Converter = Callable[..., Any]
+Updater = Callable[..., None]
+Assigner = Callable[[Any, Any, Any], None]
 Coercer = Callable[[Any, Any], Any]
 OneArgCoercer = Callable[[Any], Any]
 
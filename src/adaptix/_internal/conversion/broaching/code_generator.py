@@ -3,9 +3,10 @@ import itertools
 from abc import ABC, abstractmethod
 from ast import AST
 from collections import defaultdict
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence, Set
+from dataclasses import replace
 from inspect import Signature
-from typing import Union
+from typing import Any, Optional, Union
 
 from ...code_tools.ast_templater import ast_substitute
 from ...code_tools.cascade_namespace import BuiltinCascadeNamespace, CascadeNamespace
@@ -33,11 +34,54 @@ BroachingPlan = Union[
 ]
 
 
+def count_parameter_usages(plan: BroachingPlan, name: str) -> int:
+    if isinstance(plan, ParameterElement):
+        return int(plan.name == name)
+    if isinstance(plan, ConstantElement):
+        return 0
+    if isinstance(plan, FunctionElement):
+        return sum(count_parameter_usages(arg.element, name) for arg in plan.args)
+    if isinstance(plan, AccessorElement):
+        return count_parameter_usages(plan.target, name)
+    raise TypeError
+
+
+def replace_parameters(plan: BroachingPlan, substitution: Mapping[str, BroachingPlan]) -> BroachingPlan:
+    """Replace parameter elements with plans according to the substitution"""
+    if isinstance(plan, ParameterElement):
+        return substitution.get(plan.name, plan)
+    if isinstance(plan, ConstantElement):
+        return plan
+    if isinstance(plan, FunctionElement):
+        return replace(
+            plan,
+            args=tuple(replace(arg, element=replace_parameters(arg.element, substitution)) for arg in plan.args),
+        )
+    if isinstance(plan, AccessorElement):
+        return replace(plan, target=replace_parameters(plan.target, substitution))
+    raise TypeError
+
+
+_BROACHING_PLAN_ATTR = "_adaptix_broaching_plan"
+
+
+def attach_broaching_plan(func: Any, plan: BroachingPlan) -> None:
+    """Store the plan that the function was generated from, so the plan can be inlined into other plans.
+    The plan must take the same parameters as the function.
+    """
+    setattr(func, _BROACHING_PLAN_ATTR, plan)
+
+
+def get_broaching_plan(func: Any) -> Optional[BroachingPlan]:
+    return getattr(func, _BROACHING_PLAN_ATTR, None)
+
+
 class GenState:
     def __init__(self, namespace: CascadeNamespace, name_sanitizer: NameSanitizer):
         self._namespace = namespace
         self._name_sanitizer = name_sanitizer
         self._prefix_counter: defaultdict[str, int] = defaultdict(lambda: 0)
+        self.inlining_stack: list[Any] = []
 
     def register_next_id(self, prefix: str, obj: object) -> str:
         number = self._prefix_counter[prefix]
@@ -56,6 +100,49 @@ class GenState:
                 return name
         raise RuntimeError
 
+    def register_next_var(self, prefix: str) -> str:
+        while True:
+            number = self._prefix_counter[prefix]
+            self._prefix_counter[prefix] += 1
+            name = f"{prefix}_{number}"
+            if self._namespace.try_register_var(name):
+                return name
+
+
+class _FirstNameAssigner(ast.NodeTransformer):
+    """Replaces the first load of the name with the assignment expression,
+    so the value is evaluated once and reused by the following loads.
+    Fields are visited in the order of evaluation of expressions produced by the code generator.
+    """
+
+    def __init__(self, name: str, value: AST):
+        self._name = name
+        self._value = value
+        self._is_assigned = False
+
+    def visit_Name(self, node: ast.Name) -> AST:  # noqa: N802
+        if self._is_assigned or node.id != self._name:
+            return node
+        self._is_assigned = True
+        return ast.NamedExpr(
+            target=ast.Name(id=self._name, ctx=ast.Store()),
+            value=self._value,  # type: ignore[arg-type]
+        )
+
+
+class _ModuleUnwrapper(ast.NodeTransformer):
+    """Replaces modules produced by templating with expressions they contain"""
+
+    def visit_Module(self, node: ast.Module) -> AST:  # noqa: N802
+        self.generic_visit(node)
+        if len(node.body) == 1 and isinstance(node.body[0], ast.Expr):
+            return node.body[0].value
+        return node
+
+
+def unwrap_modules(node: AST) -> AST:
+    return _ModuleUnwrapper().visit(node)
+
 
 class BroachingCodeGenerator(ABC):
     @abstractmethod
@@ -64,9 +151,18 @@ class BroachingCodeGenerator(ABC):
 
 
 class BuiltinBroachingCodeGenerator(BroachingCodeGenerator):
-    def __init__(self, plan: BroachingPlan, name_sanitizer: NameSanitizer):
+    """Generates a single expression from the plan.
+
+    Calls of functions that have an attached broaching plan (see ``attach_broaching_plan``)
+    are replaced with the code of the plan itself,
+    until the depth of nested inlining reaches ``max_inline_depth``.
+    Recursive plans are never inlined into themselves.
+    """
+
+    def __init__(self, plan: BroachingPlan, name_sanitizer: NameSanitizer, max_inline_depth: int = 0):
         self._plan = plan
         self._name_sanitizer = name_sanitizer
+        self._max_inline_depth = max_inline_depth
 
     def _create_state(self, namespace: CascadeNamespace) -> GenState:
         return GenState(
@@ -74,9 +170,18 @@ class BuiltinBroachingCodeGenerator(BroachingCodeGenerator):
             name_sanitizer=self._name_sanitizer,
         )
 
+    def _get_occupied_names(self, signature: Signature) -> Set[str]:
+        return signature.parameters.keys()
+
+    def _gen_body(self, state: GenState) -> AST:
+        return self._gen_plan_element_dispatch(state, self._plan)
+
+    def _gen_closure_body(self, builder: CodeBuilder, state: GenState) -> None:
+        builder += "return " + ast.unparse(unwrap_modules(self._gen_body(state)))
+
     def produce_code(self, signature: Signature, closure_name: str) -> tuple[str, Mapping[str, object]]:
         builder = CodeBuilder()
-        namespace = BuiltinCascadeNamespace(occupied=signature.parameters.keys())
+        namespace = BuiltinCascadeNamespace(occupied=self._get_occupied_names(signature))
         state = self._create_state(namespace=namespace)
 
         namespace.add_outer_constant("_closure_signature", signature)
@@ -85,8 +190,7 @@ class BuiltinBroachingCodeGenerator(BroachingCodeGenerator):
             return_annotation=Signature.empty,
         )
         with builder(f"def {closure_name}{no_types_signature}:"):
-            body = self._gen_plan_element_dispatch(state, self._plan)
-            builder += "return " + ast.unparse(body)
+            self._gen_closure_body(builder, state)
 
         builder += f"{closure_name}.__signature__ = _closure_signature"
         builder += f"{closure_name}.__name__ = {closure_name!r}"
@@ -130,6 +234,10 @@ class BuiltinBroachingCodeGenerator(BroachingCodeGenerator):
         ):
             return self._gen_plan_element_dispatch(state, element.args[0].element)
 
+        inlined = self._try_inline_function_element(state, element)
+        if inlined is not None:
+            return inlined
+
         if not element.args:
             literal = get_literal_from_factory(element.func)
             if literal is not None:
@@ -142,6 +250,35 @@ class BuiltinBroachingCodeGenerator(BroachingCodeGenerator):
 
         return self._gen_function_call(state, element, name)
 
+    def _try_inline_function_element(self, state: GenState, element: FunctionElement[BroachingPlan]) -> Optional[AST]:
+        if len(state.inlining_stack) >= self._max_inline_depth or element.func in state.inlining_stack:
+            return None
+
+        plan = get_broaching_plan(element.func)
+        if (
+            plan is None
+            or len(element.args) != 2  # noqa: PLR2004
+            or not isinstance(element.args[0], PositionalArg)
+            or element.args[1] != PositionalArg(ParameterElement("ctx"))
+        ):
+            return None
+
+        data_arg = element.args[0].element
+        if isinstance(data_arg, ParameterElement) or count_parameter_usages(plan, "data") <= 1:
+            return self._gen_inlined_plan(state, element.func, replace_parameters(plan, {"data": data_arg}))
+
+        data_expr = self._gen_plan_element_dispatch(state, data_arg)
+        var = state.register_next_var("inlined")
+        body = self._gen_inlined_plan(state, element.func, replace_parameters(plan, {"data": ParameterElement(var)}))
+        return _FirstNameAssigner(var, data_expr).visit(body)
+
+    def _gen_inlined_plan(self, state: GenState, func: Any, plan: BroachingPlan) -> AST:
+        state.inlining_stack.append(func)
+        try:
+            return self._gen_plan_element_dispatch(state, plan)
+        finally:
+            state.inlining_stack.pop()
+
     def _gen_function_call(self, state: GenState, element: FunctionElement[BroachingPlan], name: str) -> AST:
         args = []
         keywords = []
@@ -191,3 +328,72 @@ class BuiltinBroachingCodeGenerator(BroachingCodeGenerator):
             f"{name}(__target_expr__)",
             target_expr=target_expr,
         )
+
+
+class TemplateBroachingCodeGenerator(BuiltinBroachingCodeGenerator):
+    """Generates code of the expression template substituting each ``__name__`` placeholder with the code of plan.
+    Names that are bound inside the template (e.g. comprehension variables) must be passed as ``bound_names``.
+    """
+
+    def __init__(
+        self,
+        template: str,
+        plans: Mapping[str, BroachingPlan],
+        bound_names: Set[str],
+        name_sanitizer: NameSanitizer,
+        max_inline_depth: int = 0,
+    ):
+        super().__init__(
+            plan=ParameterElement("data"),
+            name_sanitizer=name_sanitizer,
+            max_inline_depth=max_inline_depth,
+        )
+        self._template = template
+        self._plans = plans
+        self._bound_names = bound_names
+
+    def _get_occupied_names(self, signature: Signature) -> Set[str]:
+        return signature.parameters.keys() | self._bound_names
+
+    def _gen_body(self, state: GenState) -> AST:
+        return ast_substitute(
+            self._template,
+            **{
+                name: self._gen_plan_element_dispatch(state, plan)
+                for name, plan in self._plans.items()
+            },
+        )
+
+
+class AssignmentBroachingCodeGenerator(BuiltinBroachingCodeGenerator):
+    """Generates statements assigning the result of each plan to the target expression.
+    If ``skip_unchanged`` is set, the assignment is performed only if the new value differs from the current one.
+    """
+
+    def __init__(
+        self,
+        assignments: Sequence[tuple[BroachingPlan, BroachingPlan]],
+        name_sanitizer: NameSanitizer,
+        *,
+        skip_unchanged: bool = False,
+        max_inline_depth: int = 0,
+    ):
+        super().__init__(
+            plan=ParameterElement("data"),
+            name_sanitizer=name_sanitizer,
+            max_inline_depth=max_inline_depth,
+        )
+        self._assignments = assignments
+        self._skip_unchanged = skip_unchanged
+
+    def _gen_closure_body(self, builder: CodeBuilder, state: GenState) -> None:
+        for target, plan in self._assignments:
+            target_expr = ast.unparse(unwrap_modules(self._gen_plan_element_dispatch(state, target)))
+            value_expr = ast.unparse(unwrap_modules(self._gen_plan_element_dispatch(state, plan)))
+            if self._skip_unchanged:
+                value_var = state.register_next_var("value")
+                builder += f"{value_var} = {value_expr}"
+                with builder(f"if {target_expr} != {value_var}:"):
+                    builder += f"{target_expr} = {value_var}"
+            else:
+                builder += f"{target_expr} = {value_expr}"
@@ -1,18 +1,31 @@
 import collections.abc
 from abc import ABC, abstractmethod
 from collections import deque
+from collections.abc import Mapping, Set
 from dataclasses import replace
+from inspect import Parameter, Signature
 from typing import Any, Callable, Union, final
 
+from ..code_tools.compiler import BasicClosureCompiler, ClosureCompiler
+from ..code_tools.name_sanitizer import BuiltinNameSanitizer, NameSanitizer
 from ..common import Coercer, OneArgCoercer, TypeHint
+from ..morphing.model.basic_gen import compile_closure_with_globals_capturing, fetch_code_gen_hook
 from ..morphing.utils import try_normalize_type
 from ..provider.essential import CannotProvide, Mediator
 from ..provider.loc_stack_filtering import LocStackChecker
 from ..provider.location import GenericParamLoc
 from ..special_cases_optimization import as_is_stub, as_is_stub_with_ctx
 from ..type_tools import BaseNormType, is_generic, is_parametrized, is_subclass_soft, normalize_type, strip_tags
+from .broaching.code_generator import (
+    BroachingPlan,
+    TemplateBroachingCodeGenerator,
+    get_broaching_plan,
+    replace_parameters,
+)
+from .broaching.definitions import ConstantElement, FunctionElement, ParameterElement, PositionalArg
 from .provider_template import CoercerProvider
-from .request_cls import CoercerRequest
+from .request_cls import CoercerRequest, CopyPolicyRequest, ImmutabilityRequest, InlineDepthRequest
+from .row import is_row_type
 
 
 class NormTypeCoercerProvider(CoercerProvider, ABC):
@@ -46,6 +59,42 @@ class SameTypeCoercerProvider(NormTypeCoercerProvider):
         raise CannotProvide
 
 
+class ImmutableSharingCoercerProvider(NormTypeCoercerProvider):
+    """Passes deeply immutable objects by reference if the copy policy allows it"""
+
+    def _provide_coercer_norm_types(
+        self,
+        mediator: Mediator,
+        request: CoercerRequest,
+        norm_src: BaseNormType,
+        norm_dst: BaseNormType,
+    ) -> Coercer:
+        if norm_src != norm_dst:
+            raise CannotProvide
+
+        policy = mediator.mandatory_provide(CopyPolicyRequest(loc_stack=request.dst))
+        if not policy.share_immutable:
+            raise CannotProvide
+
+        immutability = mediator.mandatory_provide(ImmutabilityRequest(loc_stack=request.dst))
+        if not immutability.is_immutable:
+            raise CannotProvide
+        return as_is_stub_with_ctx
+
+
+class UntypedRowColumnCoercerProvider(CoercerProvider):
+    """Passes values of row columns without declared type as is"""
+
+    def _provide_coercer(self, mediator: Mediator, request: CoercerRequest) -> Coercer:
+        if (
+            len(request.src) >= 2  # noqa: PLR2004
+            and request.src.last.type == Any
+            and is_row_type(request.src[-2].type)
+        ):
+            return as_is_stub_with_ctx
+        raise CannotProvide
+
+
 class DstAnyCoercerProvider(NormTypeCoercerProvider):
     def _provide_coercer_norm_types(
         self,
@@ -179,7 +228,67 @@ class TypeHintTagsUnwrappingProvider(CoercerProvider):
         )
 
 
-class IterableCoercerProvider(NormTypeCoercerProvider):
+class ElementwiseCoercerProvider(NormTypeCoercerProvider, ABC):
+    """Base class for providers of container coercers.
+    If any element coercer is generated from a broaching plan,
+    the coercer of the container is generated with the element conversion inlined into the comprehension.
+    """
+
+    def __init__(self, *, name_sanitizer: NameSanitizer = BuiltinNameSanitizer()):
+        self._name_sanitizer = name_sanitizer
+
+    def _get_element_plan(self, coercer: Coercer, element_name: str) -> BroachingPlan:
+        plan = get_broaching_plan(coercer)
+        if plan is None:
+            plan = FunctionElement(
+                func=coercer,
+                args=(
+                    PositionalArg(ParameterElement("data")),
+                    PositionalArg(ParameterElement("ctx")),
+                ),
+            )
+        return replace_parameters(plan, {"data": ParameterElement(element_name)})
+
+    def _generate_coercer(
+        self,
+        mediator: Mediator,
+        request: CoercerRequest,
+        *,
+        template: str,
+        plans: Mapping[str, BroachingPlan],
+        bound_names: Set[str],
+        closure_name: str,
+    ) -> Coercer:
+        code_gen = TemplateBroachingCodeGenerator(
+            template=template,
+            plans=plans,
+            bound_names=bound_names,
+            name_sanitizer=self._name_sanitizer,
+            max_inline_depth=mediator.mandatory_provide(InlineDepthRequest(loc_stack=request.dst)),
+        )
+        closure_code, namespace = code_gen.produce_code(
+            signature=Signature(
+                parameters=[
+                    Parameter("data", Parameter.POSITIONAL_ONLY),
+                    Parameter("ctx", Parameter.POSITIONAL_ONLY),
+                ],
+            ),
+            closure_name=closure_name,
+        )
+        return compile_closure_with_globals_capturing(
+            compiler=self._get_compiler(),
+            code_gen_hook=fetch_code_gen_hook(mediator, request.dst),
+            namespace=namespace,
+            closure_code=closure_code,
+            closure_name=closure_name,
+            file_name=closure_name,
+        )
+
+    def _get_compiler(self) -> ClosureCompiler:
+        return BasicClosureCompiler()
+
+
+class IterableCoercerProvider(ElementwiseCoercerProvider):
     CONCRETE_ORIGINS = {set, list, tuple, deque}
     ABC_TO_IMPL = {
         collections.abc.Iterable: tuple,
@@ -209,11 +318,37 @@ class IterableCoercerProvider(NormTypeCoercerProvider):
             lambda x: "Cannot create coercer for iterables. Coercer for element cannot be created",
         )
 
+        if element_coercer == as_is_stub_with_ctx:
+            def iterable_copying_coercer(data, ctx):
+                return dst_factory(data)
+
+            return iterable_copying_coercer
+
+        if get_broaching_plan(element_coercer) is not None:
+            return self._generate_coercer(
+                mediator,
+                request,
+                template=self._get_comprehension_template(dst_factory),
+                plans={
+                    "element": self._get_element_plan(element_coercer, "element"),
+                    "dst_factory": ConstantElement(dst_factory),
+                },
+                bound_names={"element"},
+                closure_name="iterable_coercer",
+            )
+
         def iterable_coercer(data, ctx):
             return dst_factory(element_coercer(element, ctx) for element in data)
 
         return iterable_coercer
 
+    def _get_comprehension_template(self, dst_factory: Callable) -> str:
+        if dst_factory is list:
+            return "[__element__ for element in data]"
+        if dst_factory is set:
+            return "{__element__ for element in data}"
+        return "__dst_factory__([__element__ for element in data])"
+
     def _parse_source(self, norm: BaseNormType) -> TypeHint:
         if norm.origin is tuple and norm.args[-1] != Ellipsis:
             raise CannotProvide("Constant-length tuple is not supported yet", is_demonstrative=True)
@@ -231,7 +366,7 @@ class IterableCoercerProvider(NormTypeCoercerProvider):
         raise CannotProvide
 
 
-class DictCoercerProvider(NormTypeCoercerProvider):
+class DictCoercerProvider(ElementwiseCoercerProvider):
     def _provide_coercer_norm_types(
         self,
         mediator: Mediator,
@@ -256,6 +391,34 @@ class DictCoercerProvider(NormTypeCoercerProvider):
             lambda x: "Cannot create coercer for dicts. Coercer for value cannot be created",
         )
 
+        if key_coercer == as_is_stub_with_ctx and value_coercer == as_is_stub_with_ctx:
+            def dict_copying_coercer(data, ctx):
+                return dict(data)
+
+            return dict_copying_coercer
+
+        if (
+            get_broaching_plan(key_coercer) is not None
+            or get_broaching_plan(value_coercer) is not None
+        ):
+            return self._generate_coercer(
+                mediator,
+                request,
+                template="{__key__: __value__ for key, value in data.items()}",
+                plans={
+                    "key": self._get_element_plan(key_coercer, "key"),
+                    "value": self._get_element_plan(value_coercer, "value"),
+                },
+                bound_names={"key", "value"},
+                closure_name="dict_coercer",
+            )
+
+        if key_coercer == as_is_stub_with_ctx:
+            def dict_value_coercer(data, ctx):
+                return {key: value_coercer(value, ctx) for key, value in data.items()}
+
+            return dict_value_coercer
+
         def dict_coercer(data, ctx):
             return {key_coercer(key, ctx): value_coercer(value, ctx) for key, value in data.items()}
 
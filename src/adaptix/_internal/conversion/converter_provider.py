@@ -8,25 +8,34 @@ from ..code_tools.cascade_namespace import BuiltinCascadeNamespace, CascadeNames
 from ..code_tools.code_builder import CodeBuilder
 from ..code_tools.compiler import BasicClosureCompiler, ClosureCompiler
 from ..code_tools.name_sanitizer import BuiltinNameSanitizer, NameSanitizer
-from ..common import Coercer, Converter, TypeHint
-from ..conversion.request_cls import CoercerRequest, ConversionContext, ConverterRequest
+from ..common import Assigner, Coercer, Converter, TypeHint, Updater
+from ..conversion.request_cls import (
+    AssignerRequest,
+    CoercerRequest,
+    ConversionContext,
+    ConverterRequest,
+    UpdaterRequest,
+)
 from ..model_tools.definitions import DefaultValue, NoDefault
 from ..morphing.model.basic_gen import compile_closure_with_globals_capturing, fetch_code_gen_hook
 from ..provider.essential import CannotProvide, Mediator
 from ..provider.loc_stack_filtering import LocStack
 from ..provider.location import FieldLoc, TypeHintLoc
-from .provider_template import ConverterProvider
+from .provider_template import ConverterProvider, UpdaterProvider
 
 
-class BuiltinConverterProvider(ConverterProvider):
+class _SignatureProviderMixin:
     def __init__(self, *, name_sanitizer: NameSanitizer = BuiltinNameSanitizer()):
         self._name_sanitizer = name_sanitizer
 
-    def _provide_converter(self, mediator: Mediator, request: ConverterRequest) -> Converter:
-        signature = request.signature
-        if len(signature.parameters.values()) == 0:
+    def _validate_signature(self, signature: Signature, required_params_count: int) -> None:
+        if len(signature.parameters.values()) < required_params_count:
             raise CannotProvide(
-                message="At least one parameter is required",
+                message=(
+                    "At least one parameter is required"
+                    if required_params_count == 1 else
+                    f"At least {required_params_count} parameters are required"
+                ),
                 is_demonstrative=True,
             )
         if any(
@@ -38,6 +47,47 @@ class BuiltinConverterProvider(ConverterProvider):
                 is_demonstrative=True,
             )
 
+    def _register_mangled(self, namespace: CascadeNamespace, base: str, obj: object) -> str:
+        base = self._name_sanitizer.sanitize(base)
+        if namespace.try_add_constant(base, obj):
+            return base
+
+        for i in itertools.count(1):
+            name = f"{base}_{i}"
+            if namespace.try_add_constant(name, obj):
+                return name
+        raise RuntimeError
+
+    def _get_ctx_passing(self, ctx_parameters: Sequence[Parameter]) -> str:
+        if len(ctx_parameters) == 0:
+            return "None"
+        if len(ctx_parameters) == 1:
+            return ctx_parameters[0].name
+        return "(" + ", ".join(param.name for param in ctx_parameters) + ")"
+
+    def _get_compiler(self) -> ClosureCompiler:
+        return BasicClosureCompiler()
+
+    def _get_type_from_annotation(self, annotation: Any) -> TypeHint:
+        return Any if annotation == Signature.empty else annotation
+
+    def _param_to_loc(self, parameter: Parameter) -> FieldLoc:
+        return FieldLoc(
+            field_id=parameter.name,
+            type=self._get_type_from_annotation(parameter.annotation),
+            default=NoDefault() if parameter.default == Signature.empty else DefaultValue(parameter.default),
+            metadata={},
+        )
+
+    def _get_dst_field(self, annotation: Any) -> TypeHintLoc:
+        return TypeHintLoc(
+            self._get_type_from_annotation(annotation),
+        )
+
+
+class BuiltinConverterProvider(_SignatureProviderMixin, ConverterProvider):
+    def _provide_converter(self, mediator: Mediator, request: ConverterRequest) -> Converter:
+        self._validate_signature(request.signature, required_params_count=1)
         return self._make_converter(mediator, request)
 
     def _make_converter(self, mediator: Mediator, request: ConverterRequest):
@@ -68,17 +118,6 @@ class BuiltinConverterProvider(ConverterProvider):
             file_name=self._get_file_name(request),
         )
 
-    def _register_mangled(self, namespace: CascadeNamespace, base: str, obj: object) -> str:
-        base = self._name_sanitizer.sanitize(base)
-        if namespace.try_add_constant(base, obj):
-            return base
-
-        for i in itertools.count(1):
-            name = f"{base}_{i}"
-            if namespace.try_add_constant(name, obj):
-                return name
-        raise RuntimeError
-
     def _produce_code(
         self,
         signature: Signature,
@@ -111,16 +150,6 @@ class BuiltinConverterProvider(ConverterProvider):
         builder += f"{closure_name}.__name__ = {closure_name!r}"
         return builder.string(), namespace.all_constants
 
-    def _get_ctx_passing(self, ctx_parameters: Sequence[Parameter]) -> str:
-        if len(ctx_parameters) == 0:
-            return "None"
-        if len(ctx_parameters) == 1:
-            return ctx_parameters[0].name
-        return "(" + ", ".join(param.name for param in ctx_parameters) + ")"
-
-    def _get_compiler(self) -> ClosureCompiler:
-        return BasicClosureCompiler()
-
     def _get_closure_name(self, request: ConverterRequest) -> str:
         if request.function_name is not None:
             return request.function_name
@@ -141,18 +170,82 @@ class BuiltinConverterProvider(ConverterProvider):
         dst = self._get_type_from_annotation(request.signature.return_annotation)
         return self._name_sanitizer.sanitize(f"convert_{src}_to_{dst}")
 
-    def _get_type_from_annotation(self, annotation: Any) -> TypeHint:
-        return Any if annotation == Signature.empty else annotation
 
-    def _param_to_loc(self, parameter: Parameter) -> FieldLoc:
-        return FieldLoc(
-            field_id=parameter.name,
-            type=self._get_type_from_annotation(parameter.annotation),
-            default=NoDefault() if parameter.default == Signature.empty else DefaultValue(parameter.default),
-            metadata={},
+class BuiltinUpdaterProvider(_SignatureProviderMixin, UpdaterProvider):
+    """Produces updaters taking the source object, the destination object and extra parameters.
+    Fields of the destination object are assigned by the assigner of the destination model.
+    """
+
+    def _provide_updater(self, mediator: Mediator, request: UpdaterRequest) -> Updater:
+        self._validate_signature(request.signature, required_params_count=2)
+        return self._make_updater(mediator, request)
+
+    def _make_updater(self, mediator: Mediator, request: UpdaterRequest) -> Updater:
+        src_param, dst_param, *extra_params = request.signature.parameters.values()
+        dst_loc = self._get_dst_field(dst_param.annotation)
+
+        assigner = mediator.mandatory_provide(
+            AssignerRequest(
+                src=LocStack(self._param_to_loc(src_param)),
+                ctx=ConversionContext(tuple(map(self._param_to_loc, extra_params))),
+                dst=LocStack(dst_loc),
+                skip_unchanged=request.skip_unchanged,
+            ),
+            lambda x: "Cannot create top-level assigner",
+        )
+        closure_name = self._get_closure_name(request)
+        updater_code, updater_namespace = self._produce_code(
+            signature=request.signature,
+            closure_name=closure_name,
+            stub_function=request.stub_function,
+            assigner=assigner,
+        )
+        return compile_closure_with_globals_capturing(
+            compiler=self._get_compiler(),
+            code_gen_hook=fetch_code_gen_hook(mediator, LocStack(dst_loc)),
+            namespace=updater_namespace,
+            closure_code=updater_code,
+            closure_name=closure_name,
+            file_name=closure_name,
         )
 
-    def _get_dst_field(self, return_annotation: Any) -> TypeHintLoc:
-        return TypeHintLoc(
-            self._get_type_from_annotation(return_annotation),
+    def _produce_code(
+        self,
+        signature: Signature,
+        stub_function: Optional[Callable],
+        closure_name: str,
+        assigner: Assigner,
+    ) -> tuple[str, Mapping[str, object]]:
+        builder = CodeBuilder()
+        namespace = BuiltinCascadeNamespace(occupied=signature.parameters.keys())
+        namespace.add_outer_constant("_closure_signature", signature)
+        namespace.add_outer_constant("_stub_function", stub_function)
+        namespace.add_outer_constant("_update_wrapper", update_wrapper)
+        assigner_var = self._register_mangled(namespace, "assigner", assigner)
+
+        no_types_signature = signature.replace(
+            parameters=[param.replace(annotation=Signature.empty) for param in signature.parameters.values()],
+            return_annotation=Signature.empty,
+        )
+        parameters = tuple(signature.parameters.values())
+        ctx_passing = self._get_ctx_passing(parameters[2:])
+        builder(
+            f"""
+            def {closure_name}{no_types_signature}:
+                {assigner_var}({parameters[0].name}, {parameters[1].name}, {ctx_passing})
+            """,
         )
+        if stub_function is not None:
+            builder += f"_update_wrapper({closure_name}, _stub_function)"
+        builder += f"{closure_name}.__signature__ = _closure_signature"
+        builder += f"{closure_name}.__name__ = {closure_name!r}"
+        return builder.string(), namespace.all_constants
+
+    def _get_closure_name(self, request: UpdaterRequest) -> str:
+        if request.function_name is not None:
+            return request.function_name
+        stub_function_name = getattr(request.stub_function, "__name__", None)
+        if stub_function_name is not None:
+            return stub_function_name
+        src, dst, *_ = request.signature.parameters.values()
+        return self._name_sanitizer.sanitize(f"update_{dst}_from_{src}")
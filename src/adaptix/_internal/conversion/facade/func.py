@@ -23,6 +23,25 @@ def convert(src_obj: Any, dst: type[DstT], *, recipe: Iterable[Provider] = ()) -
     return _global_retort.convert(src_obj, dst, recipe=recipe)
 
 
+def convert_many(
+    src_objs: Iterable[Any],
+    dst: type[DstT],
+    *,
+    src: Optional[TypeHint] = None,
+    recipe: Iterable[Provider] = (),
+) -> list[DstT]:
+    """Function transforming source objects to a list of destination objects.
+
+    :param src_objs: Objects to be converted.
+    :param dst: A type of converter output data for each object.
+    :param src: A type of converter input data for each object.
+        If value is None, the type of the first object is used.
+    :param recipe: An extra recipe adding to retort.
+    :return: List of destination instances
+    """
+    return _global_retort.convert_many(src_objs, dst, src=src, recipe=recipe)
+
+
 @overload
 def get_converter(
     src: type[SrcT],
@@ -57,6 +76,51 @@ def get_converter(src: TypeHint, dst: TypeHint, *, recipe: Iterable[Provider] =
     return _global_retort.get_converter(src, dst, recipe=recipe, name=name)
 
 
+@overload
+def get_updater(
+    src: type[SrcT],
+    dst: type[DstT],
+    *,
+    skip_unchanged: bool = False,
+    recipe: Iterable[Provider] = (),
+    name: Optional[str] = None,
+) -> Callable[[SrcT, DstT], None]:
+    ...
+
+
+@overload
+def get_updater(
+    src: TypeHint,
+    dst: TypeHint,
+    *,
+    skip_unchanged: bool = False,
+    recipe: Iterable[Provider] = (),
+    name: Optional[str] = None,
+) -> Callable[[Any, Any], None]:
+    ...
+
+
+def get_updater(
+    src: TypeHint,
+    dst: TypeHint,
+    *,
+    skip_unchanged: bool = False,
+    recipe: Iterable[Provider] = (),
+    name: Optional[str] = None,
+):
+    """Factory producing updater assigning linked fields of the source object to the existing destination object.
+    Fields of the destination object that are not linked are kept untouched.
+
+    :param src: A type of updater input data.
+    :param dst: A type of object to be updated.
+    :param skip_unchanged: Do not assign fields which values are equal to the current ones.
+    :param recipe: An extra recipe adding to retort.
+    :param name: Name of generated function, if value is None, name will be derived.
+    :return: Desired updater function
+    """
+    return _global_retort.get_updater(src, dst, skip_unchanged=skip_unchanged, recipe=recipe, name=name)
+
+
 @overload
 def impl_converter(func_stub: CallableT, /) -> CallableT:
     ...
@@ -77,3 +141,33 @@ def impl_converter(stub_function: Optional[Callable] = None, *, recipe: Iterable
     if stub_function is None:
         return _global_retort.impl_converter(recipe=recipe)
     return _global_retort.impl_converter(stub_function)
+
+
+@overload
+def impl_updater(func_stub: CallableT, /) -> CallableT:
+    ...
+
+
+@overload
+def impl_updater(*, skip_unchanged: bool = False, recipe: Iterable[Provider] = ()) -> Callable[[CallableT], CallableT]:
+    ...
+
+
+def impl_updater(
+    stub_function: Optional[Callable] = None,
+    *,
+    skip_unchanged: bool = False,
+    recipe: Iterable[Provider] = (),
+):
+    """Decorator producing updater with signature of stub function.
+    The first parameter of stub function is the source object, the second one is the object to be updated,
+    other parameters are passed to linking like at ``impl_converter``.
+
+    :param stub_function: A function that signature is used to generate updater.
+    :param skip_unchanged: Do not assign fields which values are equal to the current ones.
+    :param recipe: An extra recipe adding to retort.
+    :return: Desired updater function
+    """
+    if stub_function is None:
+        return _global_retort.impl_updater(skip_unchanged=skip_unchanged, recipe=recipe)
+    return _global_retort.impl_updater(stub_function)
@@ -6,8 +6,9 @@ from ...provider.essential import Provider
 from ...provider.facade.provider import bound_by_any
 from ...provider.loc_stack_filtering import LocStackChecker, Pred, create_loc_stack_checker
 from ..coercer_provider import MatchingCoercerProvider
+from ..immutability_provider import ImmutabilityProvider
 from ..linking_provider import ConstantLinkingProvider, FunctionLinkingProvider, MatchingLinkingProvider
-from ..policy_provider import UnlinkedOptionalPolicyProvider
+from ..policy_provider import CopyPolicyProvider, InlineDepthProvider, UnlinkedOptionalPolicyProvider
 from ..request_filtering import FromCtxParam
 
 
@@ -107,6 +108,66 @@ def forbid_unlinked_optional(*preds: Pred) -> Provider:
     return bound_by_any(preds, UnlinkedOptionalPolicyProvider(is_allowed=False))
 
 
+def share_immutable(*preds: Pred) -> Provider:
+    """Sets policy to pass deeply immutable objects to the destination by reference instead of copying.
+    It is applied only if source and destination types are the same.
+
+    Builtin scalar types, enums and tuples, frozensets, unions, frozen dataclasses and named tuples
+    consisting of immutable types are recognized as immutable.
+    Other types can be marked via :func:`.conversion.treat_as_immutable`.
+
+    A shared object is passed as is, so :func:`.conversion.link`, :func:`.conversion.coercer`
+    and other rules targeting fields inside it are not applied.
+    Use :func:`.conversion.copy_immutable` for objects that need such rules.
+
+    :param preds: Predicate specifying target of policy.
+        Each predicate is merged via ``|`` operator.
+        See :ref:`predicate-system` for details.
+    :return: Desired provider.
+    """
+    return bound_by_any(preds, CopyPolicyProvider(share_immutable=True))
+
+
+def copy_immutable(*preds: Pred) -> Provider:
+    """Sets policy to copy immutable objects like any other objects.
+
+    :param preds: Predicate specifying target of policy.
+        Each predicate is merged via ``|`` operator.
+        See :ref:`predicate-system` for details.
+    :return: Desired provider.
+    """
+    return bound_by_any(preds, CopyPolicyProvider(share_immutable=False))
+
+
+def treat_as_immutable(first_pred: Pred, *preds: Pred) -> Provider:
+    """Marks types as deeply immutable, so they can be shared according to :func:`.conversion.share_immutable`.
+
+    :param first_pred: Predicate specifying immutable type.
+    :param preds: Other predicates specifying immutable types.
+        Each predicate is merged via ``|`` operator.
+        See :ref:`predicate-system` for details.
+    :return: Desired provider.
+    """
+    return bound_by_any([first_pred, *preds], ImmutabilityProvider(is_immutable=True))
+
+
+def inline_depth(depth: int, *preds: Pred) -> Provider:
+    """Sets how many levels of nested coercers are inlined into the code of the outer coercer.
+    Inlining removes function calls between nested models and containers,
+    but increases the size of generated code.
+    Zero disables inlining. The default depth is 3.
+
+    :param depth: Maximum depth of inlining.
+    :param preds: Predicate specifying target of policy.
+        Each predicate is merged via ``|`` operator.
+        See :ref:`predicate-system` for details.
+    :return: Desired provider.
+    """
+    if depth < 0:
+        raise ValueError(f"depth must be non-negative, got {depth!r}")
+    return bound_by_any(preds, InlineDepthProvider(depth=depth))
+
+
 def from_param(param_name: str) -> LocStackChecker:
     """The special predicate form matching only top-level parameters by name"""
     return FromCtxParam(param_name)
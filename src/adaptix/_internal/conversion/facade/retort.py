@@ -1,10 +1,10 @@
 import inspect
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
 from functools import partial
 from inspect import Parameter, Signature
 from typing import Any, Callable, Optional, TypeVar, overload
 
-from ...common import Converter, TypeHint
+from ...common import Converter, TypeHint, Updater
 from ...provider.essential import Provider
 from ...provider.loc_stack_filtering import P
 from ...provider.shape_provider import BUILTIN_SHAPE_PROVIDER
@@ -15,19 +15,22 @@ from ...utils import Omittable, Omitted
 from ..coercer_provider import (
     DictCoercerProvider,
     DstAnyCoercerProvider,
+    ImmutableSharingCoercerProvider,
     IterableCoercerProvider,
     OptionalCoercerProvider,
     SameTypeCoercerProvider,
     SubclassCoercerProvider,
     TypeHintTagsUnwrappingProvider,
     UnionSubcaseCoercerProvider,
+    UntypedRowColumnCoercerProvider,
 )
-from ..converter_provider import BuiltinConverterProvider
+from ..converter_provider import BuiltinConverterProvider, BuiltinUpdaterProvider
+from ..immutability_provider import BuiltinImmutabilityProvider
 from ..linking_provider import DefaultLinkingProvider
 from ..model_coercer_provider import ModelCoercerProvider
-from ..request_cls import ConverterRequest
+from ..request_cls import ConverterRequest, UpdaterRequest
 from .checker import ensure_function_is_stub
-from .provider import forbid_unlinked_optional
+from .provider import copy_immutable, forbid_unlinked_optional, inline_depth
 
 
 class FilledConversionRetort(OperatingRetort):
@@ -35,9 +38,11 @@ class FilledConversionRetort(OperatingRetort):
         BUILTIN_SHAPE_PROVIDER,
 
         BuiltinConverterProvider(),
+        BuiltinUpdaterProvider(),
 
         DefaultLinkingProvider(),
 
+        ImmutableSharingCoercerProvider(),
         ModelCoercerProvider(),
         IterableCoercerProvider(),
         DictCoercerProvider(),
@@ -46,10 +51,14 @@ class FilledConversionRetort(OperatingRetort):
 
         SameTypeCoercerProvider(),
         DstAnyCoercerProvider(),
+        UntypedRowColumnCoercerProvider(),
         UnionSubcaseCoercerProvider(),
         SubclassCoercerProvider(),
 
         forbid_unlinked_optional(P.ANY),
+        copy_immutable(P.ANY),
+        inline_depth(3, P.ANY),
+        BuiltinImmutabilityProvider(),
     ]
 
 
@@ -63,6 +72,7 @@ class AdornedConversionRetort(OperatingRetort):
     def _calculate_derived(self) -> None:
         super()._calculate_derived()
         self._simple_converter_cache: dict[tuple[TypeHint, TypeHint, Optional[str]], Converter] = {}
+        self._simple_updater_cache: dict[tuple[TypeHint, TypeHint, bool, Optional[str]], Updater] = {}
 
     def replace(
         self: AR,
@@ -154,6 +164,95 @@ class AdornedConversionRetort(OperatingRetort):
         retort._simple_converter_cache[(src, dst, name)] = converter
         return converter
 
+    def _produce_updater(
+        self,
+        signature: Signature,
+        stub_function: Optional[Callable],
+        function_name: Optional[str],
+        skip_unchanged: bool,  # noqa: FBT001
+    ) -> Callable[..., None]:
+        return self._facade_provide(
+            UpdaterRequest(
+                signature=signature,
+                function_name=function_name,
+                stub_function=stub_function,
+                skip_unchanged=skip_unchanged,
+            ),
+            error_message=f"Cannot produce updater for {signature!r}",
+        )
+
+    def _make_simple_updater(
+        self,
+        src: TypeHint,
+        dst: TypeHint,
+        name: Optional[str],
+        skip_unchanged: bool,  # noqa: FBT001
+    ) -> Updater:
+        return self._produce_updater(
+            signature=Signature(
+                parameters=[
+                    Parameter("src", kind=Parameter.POSITIONAL_ONLY, annotation=src),
+                    Parameter("dst", kind=Parameter.POSITIONAL_ONLY, annotation=dst),
+                ],
+                return_annotation=None,
+            ),
+            stub_function=None,
+            function_name=name,
+            skip_unchanged=skip_unchanged,
+        )
+
+    @overload
+    def get_updater(
+        self,
+        src: type[SrcT],
+        dst: type[DstT],
+        *,
+        skip_unchanged: bool = False,
+        recipe: Iterable[Provider] = (),
+    ) -> Callable[[SrcT, DstT], None]:
+        ...
+
+    @overload
+    def get_updater(
+        self,
+        src: TypeHint,
+        dst: TypeHint,
+        *,
+        skip_unchanged: bool = False,
+        name: Optional[str] = None,
+        recipe: Iterable[Provider] = (),
+    ) -> Callable[[Any, Any], None]:
+        ...
+
+    def get_updater(
+        self,
+        src: TypeHint,
+        dst: TypeHint,
+        *,
+        skip_unchanged: bool = False,
+        name: Optional[str] = None,
+        recipe: Iterable[Provider] = (),
+    ):
+        """Method producing updater assigning linked fields of the source object to the existing destination object.
+        Fields of the destination object that are not linked are kept untouched.
+
+        :param src: A type of updater input data.
+        :param dst: A type of object to be updated.
+        :param skip_unchanged: Do not assign fields which values are equal to the current ones.
+        :param recipe: An extra recipe adding to retort.
+        :param name: Name of generated function, if value is None, name will be derived.
+        :return: Desired updater function
+        """
+        retort = self.extend(recipe=recipe) if recipe else self
+
+        try:
+            return retort._simple_updater_cache[(src, dst, skip_unchanged, name)]
+        except KeyError:
+            pass
+        updater = retort._make_simple_updater(src, dst, name, skip_unchanged)
+        retort._simple_updater_cache[(src, dst, skip_unchanged, name)] = updater
+        return updater
+
     @overload
     def impl_converter(self, func_stub: CallableT, /) -> CallableT:
         ...
@@ -180,6 +279,47 @@ class AdornedConversionRetort(OperatingRetort):
             function_name=None,
         )
 
+    @overload
+    def impl_updater(self, func_stub: CallableT, /) -> CallableT:
+        ...
+
+    @overload
+    def impl_updater(
+        self,
+        *,
+        skip_unchanged: bool = False,
+        recipe: Iterable[Provider] = (),
+    ) -> Callable[[CallableT], CallableT]:
+        ...
+
+    def impl_updater(
+        self,
+        stub_function: Optional[Callable] = None,
+        *,
+        skip_unchanged: bool = False,
+        recipe: Iterable[Provider] = (),
+    ):
+        """Decorator producing updater with signature of stub function.
+        The first parameter of stub function is the source object, the second one is the object to be updated,
+        other parameters are passed to linking like at ``impl_converter``.
+
+        :param stub_function: A function that signature is used to generate updater.
+        :param skip_unchanged: Do not assign fields which values are equal to the current ones.
+        :param recipe: An extra recipe adding to retort.
+        :return: Desired updater function
+        """
+        if stub_function is None:
+            return partial(self.impl_updater, skip_unchanged=skip_unchanged, recipe=recipe)
+
+        ensure_function_is_stub(stub_function)
+        retort = self.extend(recipe=recipe) if recipe else self
+        return retort._produce_updater(
+            signature=inspect.signature(stub_function),
+            stub_function=stub_function,
+            function_name=None,
+            skip_unchanged=skip_unchanged,
+        )
+
     def convert(self, src_obj: Any, dst: type[DstT], *, recipe: Iterable[Provider] = ()) -> DstT:
         """Method transforming a source object to destination.
 
@@ -197,6 +337,40 @@ class AdornedConversionRetort(OperatingRetort):
 
         return self.get_converter(src, dst, recipe=recipe)(src_obj)
 
+    def convert_many(
+        self,
+        src_objs: Iterable[Any],
+        dst: type[DstT],
+        *,
+        src: Optional[TypeHint] = None,
+        recipe: Iterable[Provider] = (),
+    ) -> list[DstT]:
+        """Method transforming source objects to a list of destination objects.
+        All objects are converted inside one generated loop,
+        so the conversion of each object does not require an extra function call.
+
+        :param src_objs: Objects to be converted.
+        :param dst: A type of converter output data for each object.
+        :param src: A type of converter input data for each object.
+            If value is None, the type of the first object is used.
+        :param recipe: An extra recipe adding to retort.
+        :return: List of destination instances
+        """
+        if src is None:
+            if not isinstance(src_objs, Sequence):
+                src_objs = list(src_objs)
+            if not src_objs:
+                return []
+
+            src = type(src_objs[0])
+            if is_generic_class(src):
+                raise ValueError(
+                    f"Cannot infer the actual type of generic class instance ({src!r}),"
+                    " you have to pass the type of objects explicitly via `src` parameter",
+                )
+
+        return self.get_converter(Iterable[src], list[dst], recipe=recipe)(src_objs)  # type: ignore[valid-type]
+
 
 class ConversionRetort(FilledConversionRetort, AdornedConversionRetort):
     pass
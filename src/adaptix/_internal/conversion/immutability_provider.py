@@ -0,0 +1,117 @@
+import dataclasses
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
+from enum import Enum
+from fractions import Fraction
+from ipaddress import IPv4Address, IPv4Interface, IPv4Network, IPv6Address, IPv6Interface, IPv6Network
+from pathlib import PurePath
+from typing import Annotated, Literal, Union
+from uuid import UUID
+
+from ..morphing.utils import try_normalize_type
+from ..provider.essential import CannotProvide, Mediator
+from ..provider.fields import output_field_to_loc
+from ..provider.loc_stack_filtering import LocStack
+from ..provider.location import AnyLoc, GenericParamLoc
+from ..provider.methods_provider import MethodsProvider, method_handler
+from ..provider.shape_provider import OutputShapeRequest, provide_generic_resolved_shape
+from ..type_tools import BaseNormType, is_subclass_soft
+from .request_cls import Immutability, ImmutabilityRequest
+
+IMMUTABLE_TYPES = frozenset(
+    {
+        None,
+        int,
+        float,
+        complex,
+        bool,
+        str,
+        bytes,
+        Decimal,
+        Fraction,
+        date,
+        time,
+        datetime,
+        timedelta,
+        timezone,
+        UUID,
+        range,
+        IPv4Address,
+        IPv6Address,
+        IPv4Network,
+        IPv6Network,
+        IPv4Interface,
+        IPv6Interface,
+    },
+)
+IMMUTABLE_BASE_CLASSES = (Enum, PurePath)
+
+
+class ImmutabilityProvider(MethodsProvider):
+    def __init__(self, *, is_immutable: bool):
+        self._is_immutable = is_immutable
+
+    @method_handler
+    def _immutability(self, mediator: Mediator, request: ImmutabilityRequest) -> Immutability:
+        return Immutability(is_immutable=self._is_immutable)
+
+
+class BuiltinImmutabilityProvider(MethodsProvider):
+    """Recognizes deeply immutable types.
+    Builtin scalar types and enums are immutable.
+    Tuples, frozensets, unions, frozen dataclasses and named tuples are immutable
+    if all their parameters (or fields) are immutable.
+    Each parameter and field is checked via a separate request, so other providers can mark them as immutable.
+    """
+
+    @method_handler
+    def _immutability(self, mediator: Mediator, request: ImmutabilityRequest) -> Immutability:
+        if self._is_recursive(request.loc_stack):
+            return Immutability(is_immutable=True)
+        return Immutability(is_immutable=self._is_immutable(mediator, request.loc_stack))
+
+    def _is_recursive(self, loc_stack: LocStack[AnyLoc]) -> bool:
+        tp = loc_stack.last.type
+        return sum(loc.type == tp for loc in loc_stack) > 1
+
+    def _is_immutable(self, mediator: Mediator, loc_stack: LocStack[AnyLoc]) -> bool:
+        norm = try_normalize_type(loc_stack.last.type)
+        if norm.origin in IMMUTABLE_TYPES or norm.origin == Literal:
+            return True
+        if isinstance(norm.origin, type) and issubclass(norm.origin, IMMUTABLE_BASE_CLASSES):
+            return True
+        if norm.origin == Annotated:
+            return self._are_args_immutable(mediator, loc_stack, norm.args[:1])
+        if norm.origin in (tuple, frozenset, Union):
+            return self._are_args_immutable(mediator, loc_stack, norm.args)
+        if self._is_frozen_model(norm.origin):
+            return self._are_fields_immutable(mediator, loc_stack)
+        return False
+
+    def _is_frozen_model(self, tp: object) -> bool:
+        if dataclasses.is_dataclass(tp) and isinstance(tp, type):
+            return tp.__dataclass_params__.frozen  # type: ignore[attr-defined]
+        return is_subclass_soft(tp, tuple) and hasattr(tp, "_fields")
+
+    def _are_args_immutable(self, mediator: Mediator, loc_stack: LocStack[AnyLoc], args: tuple) -> bool:
+        return all(
+            self._is_immutable_by_request(
+                mediator,
+                loc_stack.append_with(GenericParamLoc(type=arg.source, generic_pos=i)),
+            )
+            for i, arg in enumerate(args)
+            if isinstance(arg, BaseNormType)
+        )
+
+    def _are_fields_immutable(self, mediator: Mediator, loc_stack: LocStack[AnyLoc]) -> bool:
+        try:
+            shape = provide_generic_resolved_shape(mediator, OutputShapeRequest(loc_stack=loc_stack))
+        except CannotProvide:
+            return False
+        return all(
+            self._is_immutable_by_request(mediator, loc_stack.append_with(output_field_to_loc(field)))
+            for field in shape.fields
+        )
+
+    def _is_immutable_by_request(self, mediator: Mediator, loc_stack: LocStack[AnyLoc]) -> bool:
+        return mediator.mandatory_provide(ImmutabilityRequest(loc_stack=loc_stack)).is_immutable
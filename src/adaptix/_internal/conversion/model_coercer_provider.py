@@ -1,12 +1,18 @@
 import sys
 from collections.abc import Iterable, Mapping, Sequence
-from inspect import Parameter, Signature
+from inspect import Parameter, Signature, getattr_static
 from typing import Callable, Optional
 
 from ..code_tools.compiler import BasicClosureCompiler, ClosureCompiler
 from ..code_tools.name_sanitizer import BuiltinNameSanitizer, NameSanitizer
-from ..common import Coercer, TypeHint
-from ..conversion.broaching.code_generator import BroachingCodeGenerator, BroachingPlan, BuiltinBroachingCodeGenerator
+from ..common import Assigner, Coercer, TypeHint
+from ..conversion.broaching.code_generator import (
+    AssignmentBroachingCodeGenerator,
+    BroachingCodeGenerator,
+    BroachingPlan,
+    BuiltinBroachingCodeGenerator,
+    attach_broaching_plan,
+)
 from ..conversion.broaching.definitions import (
     AccessorElement,
     ConstantElement,
@@ -17,19 +23,31 @@ from ..conversion.broaching.definitions import (
     PositionalArg,
 )
 from ..conversion.request_cls import (
+    AssignerRequest,
     CoercerRequest,
     ConstantLinking,
     ConversionDestItem,
     ConversionSourceItem,
     FieldLinking,
     FunctionLinking,
+    InlineDepthRequest,
     LinkingRequest,
     LinkingResult,
     ModelLinking,
     UnlinkedOptionalPolicyRequest,
 )
 from ..feature_requirement import HAS_PY_310
-from ..model_tools.definitions import DefaultValue, InputField, InputShape, OutputShape, ParamKind, create_key_accessor
+from ..model_tools.definitions import (
+    DefaultValue,
+    DescriptorAccessor,
+    InputField,
+    InputShape,
+    ItemAccessor,
+    OutputShape,
+    ParamKind,
+    create_key_accessor,
+)
+from ..model_tools.introspection.attrs import is_attrs_attribute_read_only
 from ..morphing.model.basic_gen import compile_closure_with_globals_capturing, fetch_code_gen_hook
 from ..provider.essential import AggregateCannotProvide, CannotProvide, Mediator, mandatory_apply_by_iterable
 from ..provider.fields import input_field_to_loc, output_field_to_loc
@@ -37,11 +55,12 @@ from ..provider.loc_stack_filtering import LocStack
 from ..provider.loc_stack_tools import format_loc_stack, format_type, get_callable_name
 from ..provider.location import AnyLoc, OutputFieldLoc
 from ..provider.shape_provider import InputShapeRequest, OutputShapeRequest, provide_generic_resolved_shape
+from ..type_tools import strip_alias
 from ..utils import add_note
-from .provider_template import CoercerProvider
+from .provider_template import AssignerProvider, CoercerProvider
 
 
-class ModelCoercerProvider(CoercerProvider):
+class ModelCoercerProvider(CoercerProvider, AssignerProvider):
     def __init__(self, *, name_sanitizer: NameSanitizer = BuiltinNameSanitizer()):
         self._name_sanitizer = name_sanitizer
 
@@ -55,6 +74,132 @@ class ModelCoercerProvider(CoercerProvider):
         )
         return self._make_coercer(mediator, request, broaching_plan)
 
+    def _provide_assigner(self, mediator: Mediator, request: AssignerRequest) -> Assigner:
+        coercer_request = CoercerRequest(src=request.src, ctx=request.ctx, dst=request.dst)
+        dst_shape, src_shape = self._fetch_shapes(mediator, coercer_request)
+        dst_output_shape = self._fetch_dst_output_shape(mediator, request.dst)
+        field_linkings = [
+            (dst_field, linking)
+            for dst_field, linking in self._fetch_assignment_linkings(mediator, coercer_request, dst_shape, src_shape)
+            if linking is not None
+        ]
+        if not field_linkings:
+            raise CannotProvide(
+                "Cannot create assigner for models. No fields of destination model are linked",
+                is_demonstrative=True,
+            )
+
+        field_to_sub_plan = self._generate_sub_plan(
+            mediator=mediator,
+            request=coercer_request,
+            field_linkings=field_linkings,
+            parent_func=None,
+        )
+        assignments = [
+            (
+                self._get_assignment_target(request.dst.last.type, dst_output_shape, dst_field),
+                field_to_sub_plan[dst_field],
+            )
+            for dst_field, linking in field_linkings
+        ]
+        return self._make_assigner(mediator, request, assignments)
+
+    def _fetch_assignment_linkings(
+        self,
+        mediator: Mediator,
+        request: CoercerRequest,
+        dst_shape: InputShape,
+        src_shape: OutputShape,
+    ) -> Iterable[tuple[InputField, Optional[LinkingResult]]]:
+        sources = tuple(
+            request.src.append_with(output_field_to_loc(src_field))
+            for src_field in src_shape.fields
+        )
+        result: list[tuple[InputField, Optional[LinkingResult]]] = []
+        for dst_field in dst_shape.fields:
+            try:
+                linking = mediator.provide(
+                    LinkingRequest(
+                        sources=sources,
+                        context=request.ctx,
+                        destination=request.dst.append_with(input_field_to_loc(dst_field)),
+                    ),
+                )
+            except CannotProvide:
+                result.append((dst_field, None))
+            else:
+                result.append((dst_field, linking))
+        return result
+
+    def _get_assignment_target(
+        self,
+        dst_type: TypeHint,
+        dst_output_shape: OutputShape,
+        dst_field: InputField,
+    ) -> BroachingPlan:
+        try:
+            accessor = dst_output_shape.fields_dict[dst_field.id].accessor
+        except KeyError:
+            raise CannotProvide(
+                f"Cannot assign field {dst_field.id!r}, it is not present at destination object",
+                is_demonstrative=True,
+            ) from None
+        dst_cls = strip_alias(dst_type)
+        if not (
+            (isinstance(accessor, DescriptorAccessor) and not self._is_read_only_attr(dst_cls, accessor.attr_name))
+            or (isinstance(accessor, ItemAccessor) and hasattr(dst_cls, "__setitem__"))
+        ):
+            raise CannotProvide(
+                f"Cannot assign field {dst_field.id!r}, destination object does not support assignment",
+                is_demonstrative=True,
+            )
+        return AccessorElement(ParameterElement("target"), accessor)
+
+    def _is_read_only_attr(self, dst_cls: TypeHint, attr_name: str) -> bool:
+        dataclass_params = getattr(dst_cls, "__dataclass_params__", None)
+        if dataclass_params is not None and dataclass_params.frozen:
+            return True
+
+        if is_attrs_attribute_read_only(dst_cls, attr_name):
+            return True
+
+        descriptor = getattr_static(dst_cls, attr_name, None)
+        return isinstance(descriptor, property) and descriptor.fset is None
+
+    def _make_assigner(
+        self,
+        mediator: Mediator,
+        request: AssignerRequest,
+        assignments: Sequence[tuple[BroachingPlan, BroachingPlan]],
+    ) -> Assigner:
+        code_gen = AssignmentBroachingCodeGenerator(
+            assignments=assignments,
+            name_sanitizer=self._name_sanitizer,
+            skip_unchanged=request.skip_unchanged,
+            max_inline_depth=mediator.mandatory_provide(InlineDepthRequest(loc_stack=request.dst)),
+        )
+        closure_name = self._name_sanitizer.sanitize(
+            f"assign_{self._loc_stack_to_view_string(request.src)}_to_{self._loc_stack_to_view_string(request.dst)}",
+        )
+        assigner_code, assigner_namespace = code_gen.produce_code(
+            signature=Signature(
+                parameters=[
+                    Parameter("data", Parameter.POSITIONAL_ONLY),
+                    Parameter("target", Parameter.POSITIONAL_ONLY),
+                    Parameter("ctx", Parameter.POSITIONAL_ONLY),
+                ],
+            ),
+            closure_name=closure_name,
+        )
+        return compile_closure_with_globals_capturing(
+            compiler=self._get_compiler(),
+            code_gen_hook=fetch_code_gen_hook(mediator, request.dst),
+            namespace=assigner_namespace,
+            closure_code=assigner_code,
+            closure_name=closure_name,
+            file_name=closure_name,
+        )
+
     def _fetch_shapes(self, mediator: Mediator, request: CoercerRequest) -> tuple[InputShape, OutputShape]:
         exception_and_type_list: list[tuple[CannotProvide, LocStack]] = []
         try:
@@ -101,7 +246,10 @@ class ModelCoercerProvider(CoercerProvider):
         request: CoercerRequest,
         broaching_plan: BroachingPlan,
     ):
-        code_gen = self._create_broaching_code_gen(broaching_plan)
+        code_gen = self._create_broaching_code_gen(
+            broaching_plan,
+            mediator.mandatory_provide(InlineDepthRequest(loc_stack=request.dst)),
+        )
         closure_name = self._get_closure_name(request)
         dumper_code, dumper_namespace = code_gen.produce_code(
             signature=Signature(
@@ -112,7 +260,7 @@ class ModelCoercerProvider(CoercerProvider):
             ),
             closure_name=closure_name,
         )
-        return compile_closure_with_globals_capturing(
+        coercer = compile_closure_with_globals_capturing(
             compiler=self._get_compiler(),
             code_gen_hook=fetch_code_gen_hook(mediator, request.dst),
             namespace=dumper_namespace,
@@ -120,6 +268,8 @@ class ModelCoercerProvider(CoercerProvider):
             closure_name=closure_name,
             file_name=self._get_file_name(request),
         )
+        attach_broaching_plan(coercer, broaching_plan)
+        return coercer
 
     def _loc_stack_to_view_string(self, loc_stack: LocStack[AnyLoc]) -> str:
         tp = loc_stack.last.type
@@ -149,11 +299,21 @@ class ModelCoercerProvider(CoercerProvider):
             OutputShapeRequest(loc_stack=loc_stack),
         )
 
+    def _fetch_dst_output_shape(self, mediator: Mediator, loc_stack: LocStack[ConversionDestItem]) -> OutputShape:
+        return provide_generic_resolved_shape(
+            mediator,
+            OutputShapeRequest(loc_stack=loc_stack),
+        )
+
     def _get_compiler(self) -> ClosureCompiler:
         return BasicClosureCompiler()
 
-    def _create_broaching_code_gen(self, plan: BroachingPlan) -> BroachingCodeGenerator:
-        return BuiltinBroachingCodeGenerator(plan=plan, name_sanitizer=self._name_sanitizer)
+    def _create_broaching_code_gen(self, plan: BroachingPlan, max_inline_depth: int) -> BroachingCodeGenerator:
+        return BuiltinBroachingCodeGenerator(
+            plan=plan,
+            name_sanitizer=self._name_sanitizer,
+            max_inline_depth=max_inline_depth,
+        )
 
     def _fetch_linkings(
         self,
@@ -1,6 +1,12 @@
 from ..provider.essential import Mediator
 from ..provider.methods_provider import MethodsProvider, method_handler
-from .request_cls import UnlinkedOptionalPolicy, UnlinkedOptionalPolicyRequest
+from .request_cls import (
+    CopyPolicy,
+    CopyPolicyRequest,
+    InlineDepthRequest,
+    UnlinkedOptionalPolicy,
+    UnlinkedOptionalPolicyRequest,
+)
 
 
 class UnlinkedOptionalPolicyProvider(MethodsProvider):
@@ -14,3 +20,29 @@ class UnlinkedOptionalPolicyProvider(MethodsProvider):
         request: UnlinkedOptionalPolicyRequest,
     ) -> UnlinkedOptionalPolicy:
         return UnlinkedOptionalPolicy(is_allowed=self._is_allowed)
+
+
+class CopyPolicyProvider(MethodsProvider):
+    def __init__(self, *, share_immutable: bool):
+        self._share_immutable = share_immutable
+
+    @method_handler
+    def _copy_policy(
+        self,
+        mediator: Mediator,
+        request: CopyPolicyRequest,
+    ) -> CopyPolicy:
+        return CopyPolicy(share_immutable=self._share_immutable)
+
+
+class InlineDepthProvider(MethodsProvider):
+    def __init__(self, *, depth: int):
+        self._depth = depth
+
+    @method_handler
+    def _inline_depth(
+        self,
+        mediator: Mediator,
+        request: InlineDepthRequest,
+    ) -> int:
+        return self._depth
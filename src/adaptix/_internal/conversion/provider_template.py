@@ -1,10 +1,17 @@
 from abc import ABC, abstractmethod
 from typing import final
 
-from ..common import Coercer, Converter
+from ..common import Assigner, Coercer, Converter, Updater
 from ..provider.essential import Mediator
 from ..provider.methods_provider import MethodsProvider, method_handler
-from .request_cls import CoercerRequest, ConverterRequest, LinkingRequest, LinkingResult
+from .request_cls import (
+    AssignerRequest,
+    CoercerRequest,
+    ConverterRequest,
+    LinkingRequest,
+    LinkingResult,
+    UpdaterRequest,
+)
 
 
 class ConverterProvider(MethodsProvider, ABC):
@@ -18,6 +25,17 @@ class ConverterProvider(MethodsProvider, ABC):
         ...
 
 
+class UpdaterProvider(MethodsProvider, ABC):
+    @final
+    @method_handler
+    def _outer_provide_updater(self, mediator: Mediator, request: UpdaterRequest):
+        return self._provide_updater(mediator, request)
+
+    @abstractmethod
+    def _provide_updater(self, mediator: Mediator, request: UpdaterRequest) -> Updater:
+        ...
+
+
 class CoercerProvider(MethodsProvider, ABC):
     @method_handler
     @abstractmethod
@@ -25,6 +43,13 @@ class CoercerProvider(MethodsProvider, ABC):
         ...
 
 
+class AssignerProvider(MethodsProvider, ABC):
+    @method_handler
+    @abstractmethod
+    def _provide_assigner(self, mediator: Mediator, request: AssignerRequest) -> Assigner:
+        ...
+
+
 class LinkingProvider(MethodsProvider, ABC):
     @method_handler
     @abstractmethod
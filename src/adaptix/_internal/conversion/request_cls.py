@@ -2,7 +2,7 @@ from dataclasses import dataclass, field, replace
 from inspect import Signature
 from typing import Callable, Optional, TypeVar, Union
 
-from ..common import Coercer, VarTuple
+from ..common import Assigner, Coercer, Updater, VarTuple
 from ..model_tools.definitions import DefaultFactory, DefaultValue, InputField, ParamKind
 from ..provider.essential import Request
 from ..provider.loc_stack_filtering import LocStack
@@ -17,6 +17,14 @@ class ConverterRequest(Request):
     stub_function: Optional[Callable]
 
 
+@dataclass(frozen=True)
+class UpdaterRequest(Request[Updater]):
+    signature: Signature
+    function_name: Optional[str]
+    stub_function: Optional[Callable]
+    skip_unchanged: bool
+
+
 ConversionSourceItem = Union[FieldLoc, OutputFieldLoc, GenericParamLoc]
 ConversionDestItem = Union[TypeHintLoc, InputFieldLoc, InputFuncFieldLoc, GenericParamLoc]
 
@@ -89,6 +97,17 @@ class CoercerRequest(Request[Coercer]):
         return replace(self, dst=self.dst.append_with(dst_loc))
 
 
+@dataclass(frozen=True)
+class AssignerRequest(Request[Assigner]):
+    """Request for the function assigning fields of source model to the existing instance of destination model.
+    The function takes source object, destination object and context.
+    """
+    src: LocStack[ConversionSourceItem]
+    ctx: ConversionContext
+    dst: LocStack[ConversionDestItem]
+    skip_unchanged: bool
+
+
 @dataclass(frozen=True)
 class UnlinkedOptionalPolicy:
     is_allowed: bool
@@ -97,3 +116,28 @@ class UnlinkedOptionalPolicy:
 @dataclass(frozen=True)
 class UnlinkedOptionalPolicyRequest(LocatedRequest[UnlinkedOptionalPolicy]):
     pass
+
+
+@dataclass(frozen=True)
+class CopyPolicy:
+    share_immutable: bool
+
+
+@dataclass(frozen=True)
+class CopyPolicyRequest(LocatedRequest[CopyPolicy]):
+    pass
+
+
+@dataclass(frozen=True)
+class Immutability:
+    is_immutable: bool
+
+
+@dataclass(frozen=True)
+class ImmutabilityRequest(LocatedRequest[Immutability]):
+    pass
+
+
+@dataclass(frozen=True)
+class InlineDepthRequest(LocatedRequest[int]):
+    """Request for the maximum depth of nested coercers inlined into the generated code"""
@@ -0,0 +1,47 @@
+from collections import namedtuple
+from collections.abc import Iterable, Mapping, Sequence
+from typing import Any, Union
+
+from ..common import TypeHint
+
+_ROW_TYPE_ATTR = "__adaptix_row_type__"
+
+Column = Union[str, Sequence[Any]]
+
+
+def make_row_type(
+    columns: Iterable[Column],
+    *,
+    types: Mapping[str, TypeHint] = {},
+    name: str = "Row",
+) -> type[tuple[Any, ...]]:
+    """Creates the type describing rows of query result with the specified column order.
+    The type can be used as a source of conversion, each field is read from the row by index,
+    so plain tuples (e.g. rows returned by DB-API cursor) can be passed to the converter.
+
+    Columns without a type are passed to the destination as is.
+
+    :param columns: Names of columns or items of DB-API ``cursor.description``.
+        Invalid identifiers are replaced with positional names like ``_1``.
+    :param types: Types of columns, keys are the original column names.
+    :param name: Name of created type.
+    :return: Type of row
+    :raises ValueError: Some keys of ``types`` do not match any column.
+    """
+    column_names = [column if isinstance(column, str) else column[0] for column in columns]
+    unknown_columns = types.keys() - set(column_names)
+    if unknown_columns:
+        raise ValueError(f"Types are set for unknown columns {sorted(unknown_columns)}")
+
+    row_type: Any = namedtuple(name, column_names, rename=True)  # type: ignore[misc]  # noqa: PYI024
+    field_ids: tuple[str, ...] = row_type._fields
+    row_type.__annotations__ = {
+        field_id: types.get(column_name, Any)
+        for column_name, field_id in zip(column_names, field_ids)
+    }
+    setattr(row_type, _ROW_TYPE_ATTR, True)
+    return row_type
+
+
+def is_row_type(tp: TypeHint) -> bool:
+    return getattr(tp, _ROW_TYPE_ATTR, False)
@@ -12,7 +12,6 @@ from collections.abc import (
     Sized,
     ValuesView,
 )
-from itertools import islice
 from typing import Callable, Generic, Optional, Protocol, TypeVar, Union, runtime_checkable
 
 from .common import VarTuple
@@ -219,59 +218,155 @@ StackT = TypeVar("StackT", bound="ImmutableStack")
 
 
 class ImmutableStack(Reversible[T_co], Hashable, Sized, Generic[T_co]):
-    __slots__ = ("_tuple", )
+    """Persistent linked stack.
+
+    Each stack is a node referring to its parent, so ``append_with``, ``replace_last``, ``__hash__``
+    and ``last`` take constant time and all stacks derived from the same prefix share it.
+    Tuple representation and the number of occurrences of the node item are materialized lazily
+    and cached per node.
+    """
+    __slots__ = ("_hash", "_item", "_item_count", "_len", "_parent", "_tuple")
+
+    _parent: "Optional[ImmutableStack[T_co]]"
+    _item: T_co
+    _len: int
+    _hash: int
+    _item_count: Optional[int]
+    _tuple: Optional[VarTuple[T_co]]
 
     def __init__(self, *args: T_co):
+        if not args:
+            self._init_empty()
+            return
+
+        parent = self._empty()
+        for arg in args[:-1]:
+            parent = parent.append_with(arg)
+        self._init_node(parent, args[-1])
         self._tuple = args
 
+    def _init_empty(self) -> None:
+        self._parent = None
+        self._len = 0
+        self._hash = hash(())
+        self._item_count = None
+        self._tuple = ()
+
+    def _init_node(self, parent: "ImmutableStack[T_co]", item: T_co) -> None:  # type: ignore[misc]
+        self._parent = parent
+        self._item = item
+        self._len = parent._len + 1
+        self._hash = hash((parent._hash, item))
+        self._item_count = None
+        self._tuple = None
+
     @classmethod
-    def _from_tuple(cls: type[StackT], tpl: VarTuple[T_co]) -> StackT:
+    def _empty(cls: type[StackT]) -> StackT:
         self = cls.__new__(cls)
-        self._tuple = tpl
+        self._init_empty()
         return self
 
     @classmethod
     def from_iter(cls: type[StackT], iterable: Iterable[T_co]) -> StackT:
-        return cls._from_tuple(tuple(iterable))
+        stack = cls._empty()
+        for item in iterable:
+            stack = stack.append_with(item)
+        return stack
 
     @property
     def last(self) -> T_co:
-        return self._tuple[-1]
+        if self._len == 0:
+            raise IndexError("stack is empty")
+        return self._item
+
+    def _as_tuple(self) -> VarTuple[T_co]:
+        if self._tuple is not None:
+            return self._tuple
+        pending = []
+        node: ImmutableStack[T_co] = self
+        while node._tuple is None:
+            pending.append(node)
+            node = node._parent  # type: ignore[assignment]
+        tpl = node._tuple
+        for node in reversed(pending):
+            tpl = (*tpl, node._item)
+            node._tuple = tpl
+        return tpl
 
     def __getitem__(self, item: int) -> T_co:
-        return self._tuple[item]
+        if item == -1 and self._len != 0:
+            return self._item
+        return self._as_tuple()[item]
 
     def __repr__(self):
-        return f"{type(self).__name__}{self._tuple!r}"
+        return f"{type(self).__name__}{self._as_tuple()!r}"
 
     def __len__(self):
-        return len(self._tuple)
+        return self._len
 
     def __hash__(self):
-        return hash(self._tuple)
+        return self._hash
 
     def __eq__(self, other):
-        if isinstance(other, type(self)):
-            return self._tuple == other._tuple
-        return NotImplemented
+        if not isinstance(other, type(self)):
+            return NotImplemented
+
+        left = self
+        right = other
+        while left is not right:
+            if left._len != right._len or left._hash != right._hash:
+                return False
+            if left._len == 0:
+                return True
+            if left._item != right._item:
+                return False
+            left = left._parent
+            right = right._parent
+        return True
 
     def __iter__(self) -> Iterator[T_co]:
-        return iter(self._tuple)
+        return iter(self._as_tuple())
 
     def __reversed__(self) -> Iterator[T_co]:
-        return reversed(self._tuple)
+        node = self
+        while node._len != 0:
+            yield node._item
+            node = node._parent  # type: ignore[assignment]
 
     def append_with(self: StackT, item: T_co) -> StackT:  # type: ignore[misc]
-        return self._from_tuple((*self._tuple, item))
+        stack = type(self).__new__(type(self))
+        stack._init_node(self, item)
+        return stack
 
     def replace_last(self: StackT, item: T_co) -> StackT:  # type: ignore[misc]
-        return self._from_tuple((*islice(self, len(self) - 1), item))
+        if self._len == 0:
+            raise IndexError("stack is empty")
+        return self._parent.append_with(item)  # type: ignore[union-attr,return-value]
 
     def reversed_slice(self: StackT, end_offset: int) -> StackT:
-        return self._from_tuple(self._tuple[:len(self) - end_offset])
+        node = self
+        for _ in range(min(end_offset, self._len)):
+            node = node._parent  # type: ignore[assignment]
+        return node
 
     def count(self, item: T_co) -> int:  # type: ignore[misc]
-        return sum(loc == item for loc in reversed(self))
+        """Return number of occurrences of the item.
+        Parents are walked only until the nearest node with the same item that has already been counted.
+        """
+        pending = []
+        node: ImmutableStack[T_co] = self
+        while node._len != 0:
+            if node._item == item:
+                if node._item_count is not None:
+                    break
+                pending.append(node)
+            node = node._parent  # type: ignore[assignment]
+
+        total = 0 if node._len == 0 else node._item_count
+        for node in reversed(pending):
+            total += 1  # type: ignore[operator]
+            node._item_count = total
+        return total  # type: ignore[return-value]
 
 
 ItemT = TypeVar("ItemT", bound=Hashable)
@@ -5,6 +5,7 @@ class DebugTrail(Enum):
     DISABLE = "DISABLE"
     FIRST = "FIRST"
     ALL = "ALL"
+    REPLAY = "REPLAY"
 
 
 class Direction(Enum):
@@ -7,7 +7,7 @@ from typing import Any, Callable, Generic, Optional, TypeVar, Union
 from ..common import Catchable, TypeHint, VarTuple
 from ..feature_requirement import DistributionRequirement, DistributionVersionRequirement
 from ..struct_trail import Attr, TrailElement
-from ..utils import SingletonMeta, pairs
+from ..utils import SingletonMeta, cache_hash, pairs
 
 S = TypeVar("S")
 T = TypeVar("T")
@@ -150,6 +150,7 @@ def is_valid_field_id(value: str) -> bool:
     return value.isidentifier()
 
 
+@cache_hash
 @dataclass(frozen=True)
 class BaseField:
     id: str
@@ -166,6 +167,7 @@ class BaseField:
             raise ValueError(f"Field id must be python identifier, now it is a {self.id!r}")
 
 
+@cache_hash
 @dataclass(frozen=True)
 class InputField(BaseField):
     is_required: bool
@@ -175,6 +177,7 @@ class InputField(BaseField):
         return not self.is_required
 
 
+@cache_hash
 @dataclass(frozen=True)
 class OutputField(BaseField):
     accessor: Accessor
@@ -188,6 +191,7 @@ class OutputField(BaseField):
         return self.accessor.access_error is None
 
 
+@cache_hash
 @dataclass(frozen=True)
 class BaseShape:
     """Signature of class, it is divided into two parts: input and output.
@@ -245,6 +249,7 @@ class ParamKwargs:
     type: TypeHint
 
 
+@cache_hash
 @dataclass(frozen=True)
 class InputShape(BaseShape, Generic[T]):
     """Description of desired object creation
@@ -302,6 +307,7 @@ class InputShape(BaseShape, Generic[T]):
                 raise ValueError(f"Field {param.field_id!r} cannot be positional only and optional")
 
 
+@cache_hash
 @dataclass(frozen=True)
 class OutputShape(BaseShape):
     """Description of extraction data from an object
@@ -316,6 +322,7 @@ Inp = TypeVar("Inp", bound=Optional[InputShape])
 Out = TypeVar("Out", bound=Optional[OutputShape])
 
 
+@cache_hash
 @dataclass(frozen=True)
 class Shape(Generic[Inp, Out]):
     input: Inp
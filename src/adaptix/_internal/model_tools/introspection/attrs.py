@@ -27,6 +27,11 @@ try:
 except ImportError:
     attrs = None  # type: ignore[assignment]
 
+try:
+    from attr._make import _frozen_setattrs
+except ImportError:
+    _frozen_setattrs = None  # type: ignore[assignment]
+
 
 def _get_default(attrs_field) -> Default:
     default: Any = attrs_field.default
@@ -164,3 +169,15 @@ def get_attrs_shape(tp) -> FullShape:
         input=_get_input_shape(tp, attrs_fields, type_hints),
         output=_get_output_shape(attrs_fields, type_hints),
     )
+
+
+def is_attrs_attribute_read_only(tp, attr_name: str) -> bool:
+    """Check that the attribute of attrs class cannot be assigned
+    because the class is frozen or the field is frozen via ``on_setattr``
+    """
+    if attrs is None or not attrs.has(tp):
+        return False
+    if _frozen_setattrs is not None and tp.__setattr__ is _frozen_setattrs:
+        return True
+    attrs_field = getattr(attrs.fields(tp), attr_name, None)
+    return attrs_field is not None and attrs_field.on_setattr is attrs.setters.frozen
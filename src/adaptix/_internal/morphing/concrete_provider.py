@@ -16,13 +16,13 @@ from ..provider.essential import CannotProvide, Mediator
 from ..provider.loc_stack_filtering import P, create_loc_stack_checker
 from ..provider.loc_stack_tools import find_owner_with_field
 from ..provider.located_request import LocatedRequest, for_predicate
-from ..special_cases_optimization import as_is_stub
+from ..special_cases_optimization import as_is_stub, with_passthrough
 from .json_schema.definitions import JSONSchema
 from .json_schema.request_cls import JSONSchemaRequest
 from .json_schema.schema_model import JSONSchemaBuiltinFormat, JSONSchemaType
 from .load_error import FormatMismatchLoadError, TypeLoadError, ValueLoadError
 from .provider_template import DumperProvider, JSONSchemaProvider, MorphingProvider
-from .request_cls import DumperRequest, LoaderRequest, StrictCoercionRequest
+from .request_cls import DumperRequest, LoaderRequest, StrictCoercionRequest, TrustedInputRequest
 
 
 class IsoFormatProvider(MorphingProvider):
@@ -235,6 +235,7 @@ class SecondsTimedeltaProvider(MorphingProvider):
         return JSONSchema(type=JSONSchemaType.NUMBER)
 
 
+@with_passthrough
 def none_loader(data):
     if data is None:
         return None  # noqa: RET501
@@ -397,22 +398,28 @@ class ScalarProvider(MorphingProvider, Generic[T]):
         lax_coercion_loader: Loader[T],
         dumper: Dumper[T],
         json_schema: JSONSchema,
+        trusted_loader: Optional[Loader[T]] = None,
     ):
         self._target = target
         self._loc_stack_checker = create_loc_stack_checker(target)
         self._strict_coercion_loader = strict_coercion_loader
         self._lax_coercion_loader = lax_coercion_loader
+        self._trusted_loader = trusted_loader
         self._dumper = dumper
         self._json_schema = json_schema
 
     def provide_loader(self, mediator: Mediator, request: LoaderRequest) -> Loader:
         strict_coercion = mediator.mandatory_provide(StrictCoercionRequest(loc_stack=request.loc_stack))
+        trusted = mediator.mandatory_provide(TrustedInputRequest(loc_stack=request.loc_stack))
         return mediator.cached_call(
             self._make_loader,
             strict_coercion=strict_coercion,
+            trusted=trusted,
         )
 
-    def _make_loader(self, *, strict_coercion: bool):
+    def _make_loader(self, *, strict_coercion: bool, trusted: bool):
+        if trusted and self._trusted_loader is not None:
+            return self._trusted_loader
         return self._strict_coercion_loader if strict_coercion else self._lax_coercion_loader
 
     def provide_dumper(self, mediator: Mediator, request: DumperRequest) -> Dumper:
@@ -422,6 +429,7 @@ class ScalarProvider(MorphingProvider, Generic[T]):
         return self._json_schema
 
 
+@with_passthrough
 def int_strict_coercion_loader(data):
     if type(data) is int:
         return data
@@ -446,6 +454,7 @@ INT_PROVIDER = ScalarProvider(
     lax_coercion_loader=int_lax_coercion_loader,
     dumper=as_is_stub,
     json_schema=JSONSchema(type=JSONSchemaType.INTEGER),
+    trusted_loader=as_is_stub,
 )
 
 
@@ -476,6 +485,7 @@ FLOAT_PROVIDER = ScalarProvider(
 )
 
 
+@with_passthrough
 def str_strict_coercion_loader(data):
     if type(data) is str:
         return data
@@ -488,9 +498,11 @@ STR_PROVIDER = ScalarProvider(
     lax_coercion_loader=str,
     dumper=as_is_stub,
     json_schema=JSONSchema(type=JSONSchemaType.STRING),
+    trusted_loader=as_is_stub,
 )
 
 
+@with_passthrough
 def bool_strict_coercion_loader(data):
     if type(data) is bool:
         return data
@@ -503,6 +515,7 @@ BOOL_PROVIDER = ScalarProvider(
     lax_coercion_loader=bool,
     dumper=as_is_stub,
     json_schema=JSONSchema(type=JSONSchemaType.BOOLEAN),
+    trusted_loader=as_is_stub,
 )
 
 
@@ -644,6 +657,8 @@ class SelfTypeProvider(MorphingProvider):
 @for_predicate(typing.LiteralString if HAS_PY_311 else ~P.ANY)
 class LiteralStringProvider(MorphingProvider):
     def provide_loader(self, mediator: Mediator, request: LoaderRequest) -> Loader:
+        if mediator.mandatory_provide(TrustedInputRequest(loc_stack=request.loc_stack)):
+            return as_is_stub
         strict_coercion = mediator.mandatory_provide(StrictCoercionRequest(loc_stack=request.loc_stack))
         return str_strict_coercion_loader if strict_coercion else str
 
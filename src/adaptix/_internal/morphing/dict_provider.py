@@ -2,6 +2,7 @@ import collections.abc
 from collections import defaultdict
 from collections.abc import Mapping
 from dataclasses import replace
+from functools import partial
 from typing import Callable, Optional
 
 from ..common import Dumper, Loader
@@ -11,10 +12,11 @@ from ..morphing.provider_template import DumperProvider, LoaderProvider
 from ..provider.essential import Mediator
 from ..provider.located_request import LocatedRequest, for_predicate
 from ..provider.location import GenericParamLoc
+from ..special_cases_optimization import as_is_stub
 from ..struct_trail import ItemKey, append_trail, render_trail_as_note
 from ..type_tools import BaseNormType
-from .load_error import AggregateLoadError, LoadError, TypeLoadError
-from .request_cls import DebugTrailRequest, DumperRequest, LoaderRequest
+from .load_error import AggregateLoadError, LimitedErrorList, LoadError, TypeLoadError
+from .request_cls import DebugTrailRequest, DumperRequest, LoaderRequest, MaxErrorsRequest, TrustedInputRequest
 from .utils import try_normalize_type
 
 CollectionsMapping = collections.abc.Mapping
@@ -45,22 +47,61 @@ class DictProvider(LoaderProvider, DumperProvider):
         debug_trail = mediator.mandatory_provide(
             DebugTrailRequest(loc_stack=request.loc_stack),
         )
+        max_errors = mediator.mandatory_provide(
+            MaxErrorsRequest(loc_stack=request.loc_stack),
+        )
+        trusted = mediator.mandatory_provide(
+            TrustedInputRequest(loc_stack=request.loc_stack),
+        )
         return mediator.cached_call(
             self._make_loader,
             key_loader=key_loader,
             value_loader=value_loader,
             debug_trail=debug_trail,
+            max_errors=max_errors,
+            trusted=trusted,
         )
 
-    def _make_loader(self, key_loader: Loader, value_loader: Loader, debug_trail: DebugTrail):
+    def _make_loader(
+        self,
+        key_loader: Loader,
+        value_loader: Loader,
+        debug_trail: DebugTrail,
+        max_errors: Optional[int],
+        *,
+        trusted: bool,
+    ):
+        if trusted:
+            return self._get_loader_trusted(key_loader, value_loader)
         if debug_trail == DebugTrail.DISABLE:
             return self._get_loader_dt_disable(key_loader, value_loader)
         if debug_trail == DebugTrail.FIRST:
             return self._get_loader_dt_first(key_loader, value_loader)
         if debug_trail == DebugTrail.ALL:
-            return self._get_loader_dt_all(key_loader, value_loader)
+            return self._get_loader_dt_all(key_loader, value_loader, max_errors)
         raise ValueError
 
+    def _get_loader_trusted(self, key_loader: Loader, value_loader: Loader):
+        if key_loader == as_is_stub and value_loader == as_is_stub:
+            return dict
+
+        if key_loader == as_is_stub:
+            def dict_loader_trusted_value(data):
+                return {k: value_loader(v) for k, v in data.items()}
+
+            return dict_loader_trusted_value
+
+        if value_loader == as_is_stub:
+            def dict_loader_trusted_key(data):
+                return {key_loader(k): v for k, v in data.items()}
+
+            return dict_loader_trusted_key
+
+        def dict_loader_trusted(data):
+            return {key_loader(k): value_loader(v) for k, v in data.items()}
+
+        return dict_loader_trusted
+
     def _get_loader_dt_disable(self, key_loader: Loader, value_loader: Loader):
         def dict_loader(data):
             try:
@@ -103,7 +144,13 @@ class DictProvider(LoaderProvider, DumperProvider):
 
         return dict_loader_dt_first
 
-    def _get_loader_dt_all(self, key_loader: Loader, value_loader: Loader):  # noqa: C901
+    def _get_loader_dt_all(self, key_loader: Loader, value_loader: Loader, max_errors: Optional[int]):  # noqa: C901
+        new_errors = (
+            list
+            if max_errors is None else
+            partial(LimitedErrorList, f"while loading {dict}", max_errors)
+        )
+
         def dict_loader_dt_all(data):
             try:
                 items_method = data.items
@@ -111,7 +158,7 @@ class DictProvider(LoaderProvider, DumperProvider):
                 raise TypeLoadError(CollectionsMapping, data)
 
             result = {}
-            errors = []
+            errors = new_errors()
             has_unexpected_error = False
             for k, v in items_method():
                 try:
@@ -38,7 +38,7 @@ from ..enum_provider import (
     FlagByListProvider,
 )
 from ..load_error import LoadError, ValidationLoadError
-from ..model.loader_provider import InlinedShapeModelLoaderProvider
+from ..model.loader_provider import InlinedShapeModelLoaderProvider, InputSharingProvider
 from ..name_layout.base import ExtraIn, ExtraOut
 from ..name_layout.component import ExtraMoveAndPoliciesOverlay, SievesOverlay, StructureOverlay
 from ..name_layout.name_mapping import (
@@ -200,6 +200,7 @@ def name_mapping(
     name_style: Omittable[Optional[NameStyle]] = Omitted(),
     # filtering of dumped data
     omit_default: Omittable[Union[Iterable[Pred], Pred, bool]] = Omitted(),
+    pure_default_factory: Omittable[Union[Iterable[Pred], Pred, bool]] = Omitted(),
     # policy for data that does not map to fields
     extra_in: Omittable[ExtraIn] = Omitted(),
     extra_out: Omittable[ExtraOut] = Omitted(),
@@ -230,6 +231,9 @@ def name_mapping(
     :param trim_trailing_underscore:
     :param name_style:
     :param omit_default:
+    :param pure_default_factory: Default factories of selected fields are considered pure,
+        so the result of a single call is used to detect default values at dumping.
+        It has effect only on fields affected by ``omit_default``.
     :param extra_in:
     :param extra_out:
     :param chain:
@@ -248,6 +252,7 @@ def name_mapping(
                 ),
                 SievesOverlay(
                     omit_default=_name_mapping_convert_omit_default(omit_default),
+                    pure_default_factory=_name_mapping_convert_omit_default(pure_default_factory),
                 ),
                 ExtraMoveAndPoliciesOverlay(
                     extra_in=_name_mapping_extra(extra_in),
@@ -510,3 +515,29 @@ def as_sentinel(pred: Pred) -> Provider:
     """
     return bound(pred, SentinelProvider())
 
+
+def share_typed_dict_input(*preds: Pred) -> Provider:
+    """Sets policy to return the input dict itself when loading TypedDict
+    if the input already conforms to the TypedDict.
+
+    It is applied only to TypedDict whose field loaders return their input unchanged
+    (e.g. ``str``, ``int``, ``bool``, ``None``, optionals and TypedDicts of them).
+    Valid input is only validated instead of being reconstructed,
+    so the result may be mutated together with the input.
+
+    :param preds: Predicate specifying target of policy.
+        Each predicate is merged via ``|`` operator.
+        See :ref:`predicate-system` for details.
+    """
+    return bound_by_any(preds, InputSharingProvider(share_input=True))
+
+
+def copy_typed_dict_input(*preds: Pred) -> Provider:
+    """Sets policy to return a shallow copy of the input dict when loading TypedDict
+    if the input already conforms to the TypedDict. This is the default behavior.
+
+    :param preds: Predicate specifying target of policy.
+        Each predicate is merged via ``|`` operator.
+        See :ref:`predicate-system` for details.
+    """
+    return bound_by_any(preds, InputSharingProvider(share_input=False))
@@ -1,6 +1,6 @@
 import collections.abc
 from abc import ABC
-from collections.abc import ByteString, Iterable, Mapping, MutableMapping  # noqa: PYI057
+from collections.abc import ByteString, Callable, Iterable, Mapping, MutableMapping  # noqa: PYI057
 from datetime import date, datetime, time
 from ipaddress import IPv4Address, IPv4Interface, IPv4Network, IPv6Address, IPv6Interface, IPv6Network
 from itertools import chain
@@ -10,7 +10,7 @@ from uuid import UUID
 
 from ...common import Dumper, Loader, TypeHint, VarTuple
 from ...definitions import DebugTrail
-from ...provider.essential import Provider, Request
+from ...provider.essential import CannotProvide, Provider, Request
 from ...provider.loc_stack_filtering import LocStack, P, VarTupleLSC
 from ...provider.location import TypeHintLoc
 from ...provider.shape_provider import BUILTIN_SHAPE_PROVIDER
@@ -57,14 +57,21 @@ from ..json_schema.providers import InlineJSONSchemaProvider, JSONSchemaRefProvi
 from ..json_schema.request_cls import JSONSchemaContext, JSONSchemaRequest
 from ..model.crown_definitions import ExtraSkip
 from ..model.dumper_provider import ModelDumperProvider
-from ..model.loader_provider import ModelLoaderProvider
+from ..model.loader_provider import InputSharingProvider, ModelLoaderProvider
 from ..model.request_filtering import AnyModelLSC
 from ..name_layout.component import BuiltinExtraMoveAndPoliciesMaker, BuiltinSievesMaker, BuiltinStructureMaker
 from ..name_layout.name_mapping import SkipPrivateFieldsNameMappingProvider
 from ..name_layout.provider import BuiltinNameLayoutProvider
 from ..provider_template import ABCProxy, ToVarTupleProxy
-from ..request_cls import DebugTrailRequest, DumperRequest, LoaderRequest, StrictCoercionRequest
-from ..union_provider import UnionProvider
+from ..request_cls import (
+    DebugTrailRequest,
+    DumperRequest,
+    LoaderRequest,
+    MaxErrorsRequest,
+    StrictCoercionRequest,
+    TrustedInputRequest,
+)
+from ..union_provider import ProbedUnionTrustProvider, UnionProvider
 from .provider import (
     as_is_dumper,
     as_is_loader,
@@ -146,6 +153,7 @@ class FilledRetort(OperatingRetort, ABC):
 
         LiteralProvider(),
         UnionProvider(),
+        ProbedUnionTrustProvider(),
         DictProvider(),
         DefaultDictProvider(),
         RegexPatternProvider(),
@@ -183,6 +191,7 @@ class FilledRetort(OperatingRetort, ABC):
             name_style=None,
             as_list=False,
             omit_default=False,
+            pure_default_factory=False,
             extra_in=ExtraSkip(),
             extra_out=ExtraSkip(),
         ),
@@ -222,22 +231,29 @@ class AdornedRetort(OperatingRetort):
         recipe: Iterable[Provider] = (),
         strict_coercion: bool = True,
         debug_trail: DebugTrail = DebugTrail.ALL,
+        max_errors: Optional[int] = None,
+        trusted: bool = False,
         error_renderer: Optional[ErrorRenderer] = default_error_renderer,
     ):
         self._strict_coercion = strict_coercion
         self._debug_trail = debug_trail
+        self._max_errors = self._validate_max_errors(max_errors)
+        self._trusted = trusted
         super().__init__(recipe=recipe, error_renderer=error_renderer)
 
     def _calculate_derived(self):
         super()._calculate_derived()
         self._loader_cache = {}
         self._dumper_cache = {}
+        self._replay_retort = None
 
     def replace(
         self: AR,
         *,
         strict_coercion: Omittable[bool] = Omitted(),
         debug_trail: Omittable[DebugTrail] = Omitted(),
+        max_errors: Omittable[Optional[int]] = Omitted(),
+        trusted: Omittable[bool] = Omitted(),
         error_renderer: Omittable[Optional[ErrorRenderer]] = Omitted(),
     ) -> AR:
         with self._clone() as clone:
@@ -245,6 +261,10 @@ class AdornedRetort(OperatingRetort):
                 clone._strict_coercion = strict_coercion
             if not isinstance(debug_trail, Omitted):
                 clone._debug_trail = debug_trail
+            if not isinstance(max_errors, Omitted):
+                clone._max_errors = self._validate_max_errors(max_errors)
+            if not isinstance(trusted, Omitted):
+                clone._trusted = trusted
             if not isinstance(error_renderer, Omitted):
                 clone._error_renderer = error_renderer
         return clone
@@ -257,12 +277,47 @@ class AdornedRetort(OperatingRetort):
 
         return clone
 
+    @staticmethod
+    def _validate_max_errors(max_errors: Optional[int]) -> Optional[int]:
+        if max_errors is not None and max_errors < 1:
+            raise ValueError(f"max_errors must be a positive integer or None, got {max_errors!r}")
+        return max_errors
+
     def _get_recipe_tail(self) -> VarTuple[Provider]:
         return (
             ValueProvider(StrictCoercionRequest, self._strict_coercion),
-            ValueProvider(DebugTrailRequest, self._debug_trail),
+            ValueProvider(
+                DebugTrailRequest,
+                DebugTrail.DISABLE if self._debug_trail == DebugTrail.REPLAY else self._debug_trail,
+            ),
+            ValueProvider(MaxErrorsRequest, self._max_errors),
+            ValueProvider(TrustedInputRequest, self._trusted),
+            InputSharingProvider(share_input=False),
         )
 
+    def _get_replay_retort(self) -> "AdornedRetort":
+        if self._replay_retort is None:
+            self._replay_retort = self.replace(debug_trail=DebugTrail.ALL)
+        return self._replay_retort
+
+    def _wrap_with_replay(self, converter: Callable[[Any], Any], get_detailed: Callable[[], Callable[[Any], Any]]):
+        detailed_converter = None
+
+        def replaying_wrapper(data):
+            try:
+                return converter(data)
+            except Exception as e:
+                error = e
+
+            nonlocal detailed_converter
+            if detailed_converter is None:
+                detailed_converter = get_detailed()
+            detailed_converter(data)
+            # replay can pass if the data can not be traversed twice (e.g. iterator)
+            raise error
+
+        return replaying_wrapper
+
     def get_loader(self, tp: type[T]) -> Loader[T]:
         try:
             return self._loader_cache[tp]
@@ -277,7 +332,11 @@ class AdornedRetort(OperatingRetort):
             LoaderRequest(loc_stack=LocStack(TypeHintLoc(type=tp))),
             error_message=f"Cannot produce loader for type {tp!r}",
         )
-        if self._debug_trail == DebugTrail.FIRST:
+        return self._wrap_loader(tp, loader_)
+
+    def _wrap_loader(self, tp: type[T], loader_: Loader[T]) -> Loader[T]:
+        # errors inside trusted models are not collected, they are raised with the trail as at DebugTrail.FIRST
+        if self._debug_trail == DebugTrail.FIRST or (self._trusted and self._debug_trail == DebugTrail.ALL):
             def trail_rendering_wrapper(data):
                 try:
                     return loader_(data)
@@ -286,6 +345,8 @@ class AdornedRetort(OperatingRetort):
                     raise
 
             return trail_rendering_wrapper
+        if self._debug_trail == DebugTrail.REPLAY:
+            return self._wrap_with_replay(loader_, lambda: self._get_replay_retort().get_loader(tp))
 
         return loader_
 
@@ -303,6 +364,9 @@ class AdornedRetort(OperatingRetort):
             DumperRequest(loc_stack=LocStack(TypeHintLoc(type=tp))),
             error_message=f"Cannot produce dumper for type {tp!r}",
         )
+        return self._wrap_dumper(tp, dumper_)
+
+    def _wrap_dumper(self, tp: type[T], dumper_: Dumper[T]) -> Dumper[T]:
         if self._debug_trail == DebugTrail.FIRST:
             def trail_rendering_wrapper(data):
                 try:
@@ -312,9 +376,45 @@ class AdornedRetort(OperatingRetort):
                     raise
 
             return trail_rendering_wrapper
+        if self._debug_trail == DebugTrail.REPLAY:
+            return self._wrap_with_replay(dumper_, lambda: self._get_replay_retort().get_dumper(tp))
 
         return dumper_
 
+    def can_load(self, tp: TypeHint) -> bool:
+        """Check that the loader for the type can be produced.
+        Unlike :meth:`get_loader`, it does not build a description of the error,
+        so it is cheap to use as a probe. The produced loader is cached.
+        """
+        if tp in self._loader_cache:
+            return True
+        try:
+            loader_ = self._provide_from_recipe(
+                LoaderRequest(loc_stack=LocStack(TypeHintLoc(type=tp))),
+                silent_errors=True,
+            )
+        except CannotProvide:
+            return False
+        self._loader_cache[tp] = self._wrap_loader(tp, loader_)
+        return True
+
+    def can_dump(self, tp: TypeHint) -> bool:
+        """Check that the dumper for the type can be produced.
+        Unlike :meth:`get_dumper`, it does not build a description of the error,
+        so it is cheap to use as a probe. The produced dumper is cached.
+        """
+        if tp in self._dumper_cache:
+            return True
+        try:
+            dumper_ = self._provide_from_recipe(
+                DumperRequest(loc_stack=LocStack(TypeHintLoc(type=tp))),
+                silent_errors=True,
+            )
+        except CannotProvide:
+            return False
+        self._dumper_cache[tp] = self._wrap_dumper(tp, dumper_)
+        return True
+
     @overload
     def load(self, data: Any, tp: type[T], /) -> T:
         ...
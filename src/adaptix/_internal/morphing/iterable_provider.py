@@ -1,7 +1,8 @@
 # ruff: noqa: SIM113
 import collections.abc
 from collections.abc import Iterable, Mapping
-from typing import Callable, TypeVar
+from functools import partial
+from typing import Callable, Optional, TypeVar
 
 from ..common import Dumper, Loader, TypeHint
 from ..compat import CompatExceptionGroup
@@ -9,12 +10,20 @@ from ..definitions import DebugTrail
 from ..morphing.provider_template import MorphingProvider
 from ..provider.essential import Mediator
 from ..provider.location import GenericParamLoc
+from ..special_cases_optimization import as_is_stub
 from ..struct_trail import append_trail, render_trail_as_note
 from .json_schema.definitions import JSONSchema
 from .json_schema.request_cls import JSONSchemaRequest
 from .json_schema.schema_model import JSONSchemaType
-from .load_error import AggregateLoadError, ExcludedTypeLoadError, LoadError, TypeLoadError
-from .request_cls import DebugTrailRequest, DumperRequest, LoaderRequest, StrictCoercionRequest
+from .load_error import AggregateLoadError, ExcludedTypeLoadError, LimitedErrorList, LoadError, TypeLoadError
+from .request_cls import (
+    DebugTrailRequest,
+    DumperRequest,
+    LoaderRequest,
+    MaxErrorsRequest,
+    StrictCoercionRequest,
+    TrustedInputRequest,
+)
 from .utils import try_normalize_type
 
 CollectionsMapping = collections.abc.Mapping
@@ -39,6 +48,8 @@ class IterableProvider(MorphingProvider):
         )
         strict_coercion = mediator.mandatory_provide(StrictCoercionRequest(loc_stack=request.loc_stack))
         debug_trail = mediator.mandatory_provide(DebugTrailRequest(loc_stack=request.loc_stack))
+        max_errors = mediator.mandatory_provide(MaxErrorsRequest(loc_stack=request.loc_stack))
+        trusted = mediator.mandatory_provide(TrustedInputRequest(loc_stack=request.loc_stack))
         return mediator.cached_call(
             self._make_loader,
             origin=origin,
@@ -46,6 +57,8 @@ class IterableProvider(MorphingProvider):
             arg_loader=arg_loader,
             strict_coercion=strict_coercion,
             debug_trail=debug_trail,
+            max_errors=max_errors,
+            trusted=trusted,
         )
 
     def _create_dt_first_iter_loader(self, origin, loader):
@@ -63,10 +76,16 @@ class IterableProvider(MorphingProvider):
 
         return iter_loader_dt_first
 
-    def _create_dt_all_iter_loader(self, origin, loader):
+    def _create_dt_all_iter_loader(self, origin, loader, max_errors: Optional[int]):
+        new_errors = (
+            list
+            if max_errors is None else
+            partial(LimitedErrorList, f"while loading iterable {origin}", max_errors)
+        )
+
         def iter_loader_dt_all(iterable):
             idx = 0
-            errors = []
+            errors = new_errors()
             has_unexpected_error = False
 
             for el in iterable:
@@ -93,7 +112,20 @@ class IterableProvider(MorphingProvider):
 
         return iter_loader_dt_all
 
-    def _make_loader(self, *, origin, iter_factory, arg_loader, strict_coercion: bool, debug_trail: DebugTrail):
+    def _make_loader(
+        self,
+        *,
+        origin,
+        iter_factory,
+        arg_loader,
+        strict_coercion: bool,
+        debug_trail: DebugTrail,
+        max_errors: Optional[int],
+        trusted: bool,
+    ):
+        if trusted:
+            return self._get_trusted_loader(iter_factory, arg_loader)
+
         if debug_trail == DebugTrail.DISABLE:
             if strict_coercion:
                 return self._get_dt_disable_sc_loader(iter_factory, arg_loader)
@@ -102,7 +134,7 @@ class IterableProvider(MorphingProvider):
         if debug_trail == DebugTrail.FIRST:
             iter_mapper = self._create_dt_first_iter_loader(origin, arg_loader)
         elif debug_trail == DebugTrail.ALL:
-            iter_mapper = self._create_dt_all_iter_loader(origin, arg_loader)
+            iter_mapper = self._create_dt_all_iter_loader(origin, arg_loader, max_errors)
         else:
             raise ValueError
 
@@ -110,6 +142,15 @@ class IterableProvider(MorphingProvider):
             return self._get_dt_sc_loader(iter_factory, iter_mapper)
         return self._get_dt_non_sc_loader(iter_factory, iter_mapper)
 
+    def _get_trusted_loader(self, iter_factory, arg_loader):
+        if arg_loader == as_is_stub:
+            return iter_factory
+
+        def iter_loader_trusted(data):
+            return iter_factory(map(arg_loader, data))
+
+        return iter_loader_trusted
+
     def _get_dt_non_sc_loader(self, iter_factory, iter_mapper):
         def iter_loader_dt(data):
             try:
@@ -2,10 +2,11 @@ import dataclasses
 from collections.abc import Iterable
 from dataclasses import dataclass
 from functools import partial
-from typing import Any, Optional, Union
+from typing import Any, ClassVar, NamedTuple, Optional, Union
 
 from ..common import TypeHint, VarTuple
 from ..compat import CompatExceptionGroup
+from ..struct_trail import DeferredTrailNotes, Trail, TrailChain, get_trail, render_trail_as_note
 from ..utils import fix_dataclass_from_builtin, with_module
 
 
@@ -41,6 +42,9 @@ class LoadError(Exception):
     when the loader gets invalid input data
     """
 
+    _adaptix_struct_trail: ClassVar[TrailChain] = None
+    __notes__ = DeferredTrailNotes()  # type: ignore[assignment]
+
 
 @custom_exception(str_by_fields=False)
 @dataclass(eq=False, init=False)
@@ -61,12 +65,40 @@ class AggregateLoadError(LoadExceptionGroup):
     """The class collecting distinct load errors"""
 
 
+@custom_exception(str_by_fields=False)
+@dataclass(eq=False, init=False)
+class TruncatedAggregateLoadError(AggregateLoadError):
+    """The class collecting distinct load errors
+    that is raised when the limit of errors is reached, so some errors may be missing
+    """
+
+
 @custom_exception(str_by_fields=False)
 @dataclass(eq=False, init=False)
 class UnionLoadError(LoadExceptionGroup):
     pass
 
 
+class LimitedErrorList(list):
+    """List of errors that aborts loading when the limit of errors is reached
+    or when one of the nested loaders is aborted
+    """
+    __slots__ = ("_max_errors", "_message")
+
+    def __init__(self, message: str, max_errors: int):
+        super().__init__()
+        self._message = message
+        self._max_errors = max_errors
+
+    def append(self, error: Exception) -> None:
+        super().append(error)
+        if len(self) >= self._max_errors or isinstance(error, TruncatedAggregateLoadError):
+            errors = tuple(render_trail_as_note(e) for e in self)
+            if all(isinstance(e, LoadError) for e in errors):
+                raise TruncatedAggregateLoadError(self._message, errors) from None
+            raise CompatExceptionGroup(self._message, errors) from None
+
+
 @custom_exception
 @dataclass(eq=False)
 class MsgLoadError(LoadError):
@@ -163,3 +195,27 @@ class OutOfRangeLoadError(LoadError):
     min_value: Optional[Union[int, float]]
     max_value: Optional[Union[int, float]]
     input_value: Any
+
+
+class FlatLoadError(NamedTuple):
+    trail: Trail
+    error: BaseException
+    input_value: Any
+
+
+def flatten_load_error(error: BaseException) -> list[FlatLoadError]:
+    """Collect leaves of the error tree in a single pass.
+    Each leaf is returned with a trail starting from the root of input data
+    and with an input value that caused the error (or None if the error does not store it).
+    Trail notes are not rendered and the error messages are not formatted.
+    """
+    result = []
+    stack: list[tuple[BaseException, Trail]] = [(error, ())]
+    while stack:
+        exc, parent_trail = stack.pop()
+        trail = (*parent_trail, *get_trail(exc))
+        if isinstance(exc, CompatExceptionGroup):
+            stack.extend((sub_exc, trail) for sub_exc in reversed(exc.exceptions))
+        else:
+            result.append(FlatLoadError(trail, exc, getattr(exc, "input_value", None)))
+    return result
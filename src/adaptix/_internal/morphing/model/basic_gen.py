@@ -6,7 +6,7 @@ from typing import Any, Callable, TypeVar, Union
 
 from ...code_tools.code_builder import CodeBuilder
 from ...code_tools.compiler import ClosureCompiler
-from ...code_tools.utils import get_literal_expr
+from ...feature_requirement import HAS_PY_311
 from ...model_tools.definitions import InputField, OutputField
 from ...provider.essential import CannotProvide, Mediator
 from ...provider.loc_stack_filtering import LocStack
@@ -199,15 +199,12 @@ def compile_closure_with_globals_capturing(
 ):
     builder = CodeBuilder()
 
+    # all values are passed via globals, so source text depends only on the structure of closure
     global_namespace_dict = {}
     for name, value in namespace.items():
-        value_literal = get_literal_expr(value)
-        if value_literal is None:
-            global_name = f"g_{name}"
-            global_namespace_dict[global_name] = value
-            builder += f"{name} = {global_name}"
-        else:
-            builder += f"{name} = {value_literal}"
+        global_name = f"g_{name}"
+        global_namespace_dict[global_name] = value
+        builder += f"{name} = {global_name}"
 
     builder.empty_line()
     builder += closure_code
@@ -228,6 +225,46 @@ def compile_closure_with_globals_capturing(
     )
 
 
+_SHARED_CLOSURE_NAME = "model_closure"
+
+
+def _rename_closure(closure: Callable, name: str) -> Callable:
+    qualname = closure.__qualname__.rsplit(".", 1)[0] + "." + name
+    if HAS_PY_311:
+        closure.__code__ = closure.__code__.replace(co_name=name, co_qualname=qualname)
+    else:
+        closure.__code__ = closure.__code__.replace(co_name=name)
+    closure.__name__ = name
+    closure.__qualname__ = qualname
+    return closure
+
+
+def compile_model_closure(
+    compiler: ClosureCompiler,
+    code_gen_hook: CodeGenHook,
+    gen: Union["ModelLoaderGen", "ModelDumperGen"],
+    *,
+    closure_name: str,
+    file_name: str,
+):
+    """Compile closure produced by model code generator.
+
+    The code is produced for a fixed closure name and the closure is renamed afterward.
+    Therefore, structurally identical models (like parametrizations of one generic)
+    produce the same source text and the compiler can reuse the code object.
+    """
+    closure_code, namespace = gen.produce_code(closure_name=_SHARED_CLOSURE_NAME)
+    closure = compile_closure_with_globals_capturing(
+        compiler=compiler,
+        code_gen_hook=code_gen_hook,
+        namespace=namespace,
+        closure_code=closure_code,
+        closure_name=_SHARED_CLOSURE_NAME,
+        file_name=file_name,
+    )
+    return _rename_closure(closure, closure_name)
+
+
 def has_collect_policy(crown: InpCrown) -> bool:
     if isinstance(crown, InpDictCrown):
         return crown.extra_policy == ExtraCollect() or any(
@@ -5,7 +5,7 @@ from typing import Any, Callable, Generic, TypeVar, Union
 from ...common import VarTuple
 from ...model_tools.definitions import BaseShape, DefaultFactory, DefaultValue, InputShape, OutputShape
 from ...provider.located_request import LocatedRequest
-from ...utils import MappingHashWrapper, SingletonMeta
+from ...utils import MappingHashWrapper, SingletonMeta, cache_hash
 
 T = TypeVar("T")
 
@@ -66,6 +66,7 @@ DictExtraPolicy = Union[ExtraSkip, ExtraForbid, ExtraCollect]
 ListExtraPolicy = Union[ExtraSkip, ExtraForbid]
 
 
+@cache_hash
 @dataclass(frozen=True)
 class InpDictCrown(BaseDictCrown["InpCrown"]):
     extra_policy: DictExtraPolicy
@@ -74,16 +75,19 @@ class InpDictCrown(BaseDictCrown["InpCrown"]):
         return hash(MappingHashWrapper(self.map))
 
 
+@cache_hash
 @dataclass(frozen=True)
 class InpListCrown(BaseListCrown["InpCrown"]):
     extra_policy: ListExtraPolicy
 
 
+@cache_hash
 @dataclass(frozen=True)
 class InpNoneCrown(BaseNoneCrown):
     pass
 
 
+@cache_hash
 @dataclass(frozen=True)
 class InpFieldCrown(BaseFieldCrown):
     pass
@@ -100,6 +104,7 @@ InpCrown = Union[BranchInpCrown, LeafInpCrown]
 Sieve = Callable[[Any, Any], bool]
 
 
+@cache_hash
 @dataclass(frozen=True)
 class OutDictCrown(BaseDictCrown["OutCrown"]):
     sieves: dict[str, Sieve]
@@ -118,6 +123,7 @@ class OutDictCrown(BaseDictCrown["OutCrown"]):
         return hash((MappingHashWrapper(self.map), MappingHashWrapper(self.sieves)))
 
 
+@cache_hash
 @dataclass(frozen=True)
 class OutListCrown(BaseListCrown["OutCrown"]):
     pass
@@ -126,11 +132,13 @@ class OutListCrown(BaseListCrown["OutCrown"]):
 Placeholder = Union[DefaultValue, DefaultFactory]
 
 
+@cache_hash
 @dataclass(frozen=True)
 class OutNoneCrown(BaseNoneCrown):
     placeholder: Placeholder
 
 
+@cache_hash
 @dataclass(frozen=True)
 class OutFieldCrown(BaseFieldCrown):
     pass
@@ -182,6 +190,7 @@ class BaseNameLayoutRequest(LocatedRequest[T], Generic[T]):
     shape: BaseShape
 
 
+@cache_hash
 @dataclass(frozen=True)
 class InputNameLayout(BaseNameLayout):
     crown: BranchInpCrown
@@ -193,6 +202,7 @@ class InputNameLayoutRequest(BaseNameLayoutRequest[InputNameLayout]):
     shape: InputShape
 
 
+@cache_hash
 @dataclass(frozen=True)
 class OutputNameLayout(BaseNameLayout):
     crown: BranchOutCrown
@@ -213,6 +213,17 @@ class DictFragment(NamedTuple):
     after: Optional[Statement] = None
 
 
+_SCALAR_TYPES = (int, float, str, bytes)
+_EMPTY_CONTAINER_FACTORIES = (list, dict, set, frozenset, tuple, bytearray)
+
+
+def _is_reflexive(value: Any) -> bool:
+    try:
+        return bool(value == value)  # noqa: PLR0124
+    except Exception:
+        return False
+
+
 class BuiltinModelDumperGen(ModelDumperGen):
     def __init__(
         self,
@@ -263,6 +274,7 @@ class BuiltinModelDumperGen(ModelDumperGen):
         namespace.add_constant("append_trail", append_trail)
         namespace.add_constant("extend_trail", extend_trail)
         namespace.add_constant("render_trail_as_note", render_trail_as_note)
+        namespace.add_constant("model_identity", self._model_identity)
         for field_id, dumper in self._fields_dumpers.items():
             namespace.add_constant(self._v_dumper(self._id_to_field[field_id]), dumper)
 
@@ -377,8 +389,8 @@ class BuiltinModelDumperGen(ModelDumperGen):
     def _process_dict_sieved_field(self, state: GenState, key: str, sieve: Sieve, field: OutputField) -> DictFragment:
         access_expr = self._get_access_expr(state.namespace, field)
         raw_var = self._alloc_var(state, f"r_{field.id}")
-        dumped_var = self._alloc_var(state, f"dumped_{field.id}")
         condition = self._get_sieve_condition_expr(state, sieve, key, raw_var)
+        on_kept_stmt = self._get_sieved_field_on_kept_stmt(state, key, field, raw_var)
 
         if field.is_required:
             state.error_handlers[field] = lambda collector: CodeBlock(
@@ -405,8 +417,7 @@ class BuiltinModelDumperGen(ModelDumperGen):
                     """
                     <access_stmt>
                     if <condition>:
-                        <dumped_stmt>
-                        <crown>[<key>] = <dumped_var>
+                        <on_kept_stmt>
                     """,
                     access_stmt=FieldErrorCatching(
                         state=state,
@@ -414,14 +425,7 @@ class BuiltinModelDumperGen(ModelDumperGen):
                         stmt=AssignmentStatement(raw_var, access_expr),
                     ),
                     condition=condition,
-                    dumped_stmt=FieldErrorCatching(
-                        state=state,
-                        field=field,
-                        stmt=AssignmentStatement(dumped_var, self._wrap_with_dumper(field, raw_var)),
-                    ),
-                    key=StringLiteral(key),
-                    crown=VarExpr(state.v_crown),
-                    dumped_var=dumped_var,
+                    on_kept_stmt=on_kept_stmt,
                 ),
             )
 
@@ -459,22 +463,46 @@ class BuiltinModelDumperGen(ModelDumperGen):
                     <on_unexpected_error>
                 else:
                     if <condition>:
-                        <dumped_stmt>
-                        <crown>[<key>] = <dumped_var>
+                        <on_kept_stmt>
                 """,
                 raw_var=raw_var,
                 access_expr=access_expr,
                 access_error_expr=access_error_expr,
                 condition=condition,
-                dumped_stmt=FieldErrorCatching(
-                    state=state,
-                    field=field,
-                    stmt=AssignmentStatement(dumped_var, self._wrap_with_dumper(field, raw_var)),
-                ),
+                on_kept_stmt=on_kept_stmt,
+                on_unexpected_error=ErrorHandling(state, field),
+            ),
+        )
+
+    def _get_sieved_field_on_kept_stmt(
+        self,
+        state: GenState,
+        key: str,
+        field: OutputField,
+        raw_var: VarExpr,
+    ) -> Statement:
+        if self._fields_dumpers[field.id] == as_is_stub:
+            # fields with defaults are often dumped as is,
+            # so the raw value is stored without an intermediate variable and error catching
+            return CodeBlock(
+                "<crown>[<key>] = <raw_var>",
+                crown=VarExpr(state.v_crown),
                 key=StringLiteral(key),
+                raw_var=raw_var,
+            )
+
+        dumped_var = self._alloc_var(state, f"dumped_{field.id}")
+        return statements(
+            FieldErrorCatching(
+                state=state,
+                field=field,
+                stmt=AssignmentStatement(dumped_var, self._wrap_with_dumper(field, raw_var)),
+            ),
+            CodeBlock(
+                "<crown>[<key>] = <dumped_var>",
                 crown=VarExpr(state.v_crown),
+                key=StringLiteral(key),
                 dumped_var=dumped_var,
-                on_unexpected_error=ErrorHandling(state, field),
             ),
         )
 
@@ -656,10 +684,12 @@ class BuiltinModelDumperGen(ModelDumperGen):
             def <error_handler>(idx, data, first_exc):
                 errors = [first_exc]
                 <error_testers>
-                return CompatExceptionGroup(<error_msg>, [render_trail_as_note(e) for e in errors])
+                return CompatExceptionGroup(
+                    f'while dumping model {model_identity}',
+                    [render_trail_as_note(e) for e in errors],
+                )
             """,
             error_testers=statements(*error_testers),
-            error_msg=StringLiteral(f"while dumping model {self._model_identity}"),
             error_handler=RawExpr(state.error_handler_name),
         )
 
@@ -797,18 +827,12 @@ class BuiltinModelDumperGen(ModelDumperGen):
             return RawExpr(f"{v_sieve}({test_var.name})")
 
         if isinstance(default_clause, DefaultValue):
-            literal_expr = get_literal_expr(default_clause.value)
-            if literal_expr is not None:
-                return RawExpr(
-                    f"{test_var.name} is not {literal_expr}"
-                    if is_singleton(default_clause.value) else
-                    f"{test_var.name} != {literal_expr}",
-                )
-            v_default = state.suffix("default", key)
-            state.namespace.add_constant(v_default, default_clause.value)
-            return RawExpr(f"{test_var.name} != {v_default}")
+            return self._get_default_value_condition_expr(state, default_clause.value, key, test_var)
 
         if isinstance(default_clause, DefaultFactory):
+            factory = default_clause.factory
+            if isinstance(factory, type) and factory in _EMPTY_CONTAINER_FACTORIES:
+                return self._get_empty_container_condition_expr(factory, test_var)
             literal_expr = get_literal_from_factory(default_clause.factory)
             if literal_expr is not None:
                 return RawExpr(f"{test_var.name} != {literal_expr}")
@@ -823,6 +847,41 @@ class BuiltinModelDumperGen(ModelDumperGen):
 
         raise TypeError
 
+    def _get_default_value_condition_expr(
+        self,
+        state: GenState,
+        value: Any,
+        key: str,
+        test_var: VarExpr,
+    ) -> Expression:
+        if is_singleton(value) or type(value) in _SCALAR_TYPES:
+            literal_expr = get_literal_expr(value)
+            if literal_expr is not None:
+                return RawExpr(
+                    f"{test_var.name} is not {literal_expr}"
+                    if is_singleton(value) else
+                    f"{test_var.name} != {literal_expr}",
+                )
+
+        if type(value) in _EMPTY_CONTAINER_FACTORIES and len(value) == 0:
+            return self._get_empty_container_condition_expr(type(value), test_var)
+
+        v_default = state.suffix("default", key)
+        state.namespace.add_constant(v_default, value)
+        if _is_reflexive(value):
+            # the value is usually taken straight from the default,
+            # so the identity check allows skipping a potentially expensive ``__eq__``
+            return RawExpr(f"{test_var.name} is not {v_default} and {test_var.name} != {v_default}")
+        return RawExpr(f"{test_var.name} != {v_default}")
+
+    def _get_empty_container_condition_expr(self, container_cls: type, test_var: VarExpr) -> Expression:
+        # an instance of exact builtin container is equal to an empty one only if it has zero length,
+        # other types fall back to the comparison
+        cls_name = get_literal_expr(container_cls)
+        return RawExpr(
+            f"({test_var.name} if {test_var.name}.__class__ is {cls_name} else {test_var.name} != {cls_name}())",
+        )
+
     def _get_placeholder_expr(self, state: GenState, placeholder: Placeholder) -> Expression:
         if isinstance(placeholder, DefaultFactory):
             literal_expr = get_literal_from_factory(placeholder.factory)
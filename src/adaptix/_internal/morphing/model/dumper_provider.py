@@ -20,7 +20,7 @@ from ..request_cls import DebugTrailRequest, DumperRequest
 from .basic_gen import (
     CodeGenHook,
     ModelDumperGen,
-    compile_closure_with_globals_capturing,
+    compile_model_closure,
     fetch_code_gen_hook,
     get_extra_targets_at_crown,
     get_optional_fields_at_list_crown,
@@ -70,12 +70,10 @@ class ModelDumperProvider(DumperProvider, JSONSchemaProvider):
             fields_dumpers=fields_dumpers.mapping,
             model_identity=model_identity,
         )
-        dumper_code, dumper_namespace = dumper_gen.produce_code(closure_name=closure_name)
-        return compile_closure_with_globals_capturing(
+        return compile_model_closure(
             compiler=self._get_compiler(),
             code_gen_hook=code_gen_hook.value,
-            namespace=dumper_namespace,
-            closure_code=dumper_code,
+            gen=dumper_gen,
             closure_name=closure_name,
             file_name=file_name,
         )
@@ -1,5 +1,5 @@
 import collections.abc
-from collections.abc import Mapping, Set
+from collections.abc import Mapping, Sequence, Set
 from contextlib import AbstractContextManager, contextmanager, nullcontext
 from dataclasses import dataclass, replace
 from typing import Any, Callable, Optional
@@ -10,9 +10,10 @@ from ...code_tools.utils import get_literal_expr, get_literal_from_factory
 from ...common import Loader
 from ...compat import CompatExceptionGroup
 from ...definitions import DebugTrail
-from ...model_tools.definitions import DefaultFactory, DefaultValue, InputField, InputShape, Param, ParamKind
-from ...special_cases_optimization import as_is_stub
+from ...model_tools.definitions import DefaultFactory, DefaultValue, InputField, InputShape, NoDefault, Param, ParamKind
+from ...special_cases_optimization import as_is_stub, is_passthrough
 from ...struct_trail import append_trail, extend_trail, render_trail_as_note
+from ...type_tools import is_typed_dict_class
 from ...utils import Omittable, Omitted
 from ..json_schema.definitions import JSONSchema
 from ..json_schema.schema_model import JSONSchemaType, JSONValue
@@ -21,6 +22,7 @@ from ..load_error import (
     ExcludedTypeLoadError,
     ExtraFieldsLoadError,
     ExtraItemsLoadError,
+    LimitedErrorList,
     LoadError,
     NoRequiredFieldsLoadError,
     NoRequiredItemsLoadError,
@@ -188,11 +190,19 @@ class BuiltinModelLoaderGen(ModelLoaderGen):
         skipped_fields: Set[str],
         model_identity: str,
         props: ModelLoaderProps,
+        max_errors: Optional[int] = None,
+        trusted: bool = False,
+        share_input: bool = False,
     ):
         self._shape = shape
         self._name_layout = name_layout
-        self._debug_trail = debug_trail
+        # trusted input can fail only inside unions, so there are no errors to collect,
+        # but the trail is still added to errors of field loaders
+        self._debug_trail = DebugTrail.FIRST if trusted and debug_trail == DebugTrail.ALL else debug_trail
+        self._max_errors = max_errors
         self._strict_coercion = strict_coercion
+        self._trusted = trusted
+        self._share_input = share_input
         self._id_to_field: dict[str, InputField] = {
             field.id: field for field in self._shape.fields
         }
@@ -224,6 +234,37 @@ class BuiltinModelLoaderGen(ModelLoaderGen):
             root_crown=self._name_layout.crown,
         )
 
+    def _get_passthrough_fields(self) -> Optional[Sequence[InputField]]:
+        """Returns fields of TypedDict that can be loaded by returning the input dict,
+        or None if the input always has to be reconstructed
+        """
+        crown = self._name_layout.crown
+        if (
+            not is_typed_dict_class(self._shape.constructor)
+            or self._can_collect_extra
+            or not isinstance(crown, InpDictCrown)
+        ):
+            return None
+
+        fields = []
+        for key, sub_crown in crown.map.items():
+            if not isinstance(sub_crown, InpFieldCrown) or sub_crown.id != key:
+                return None
+            field = self._id_to_field[key]
+            if (
+                not isinstance(field.default, NoDefault)
+                or self._field_id_to_param[field.id].name != key
+                or not is_passthrough(self._field_loaders[field.id])
+            ):
+                return None
+            fields.append(field)
+        return fields
+
+    @property
+    def passes_input_through(self) -> bool:
+        """Whether the produced loader returns the input dict itself for conforming input"""
+        return self._share_input and self._get_passthrough_fields() is not None
+
     @property
     def _has_packed_fields(self):
         return any(self._is_packed_field(fld) for fld in self._shape.fields)
@@ -254,10 +295,19 @@ class BuiltinModelLoaderGen(ModelLoaderGen):
         state.namespace.add_constant("CollectionsSequence", collections.abc.Sequence)
         state.namespace.add_constant("sentinel", object())
 
+        passthrough_fields = self._get_passthrough_fields()
+        if passthrough_fields is not None:
+            self._gen_passthrough(state, passthrough_fields)
+
         if self._debug_trail == DebugTrail.ALL:
-            state.builder += "errors = []"
-            state.builder += "has_unexpected_error = False"
             state.namespace.add_constant("model_identity", self._model_identity)
+            if self._max_errors is None:
+                state.builder += "errors = []"
+            else:
+                state.namespace.add_constant("LimitedErrorList", LimitedErrorList)
+                state.namespace.add_constant("model_error_message", f"while loading model {self._model_identity}")
+                state.builder += f"errors = LimitedErrorList(model_error_message, {self._max_errors!r})"
+            state.builder += "has_unexpected_error = False"
 
         if self._has_packed_fields:
             state.builder += "packed_fields = {}"
@@ -292,6 +342,52 @@ class BuiltinModelLoaderGen(ModelLoaderGen):
             builder.extend(state.builder)
         return builder.string(), namespace.all_constants
 
+    def _gen_passthrough(self, state: GenState, fields: Sequence[InputField]) -> None:
+        """Generates validation-only pass for input that already conforms to TypedDict.
+        The input is returned (or shallow copied) if all field loaders return their argument itself,
+        otherwise the regular code reconstructs the dict and reports errors.
+        """
+        state.namespace.add_constant(
+            "passthrough_known_keys",
+            frozenset(field.id for field in fields),
+        )
+        condition = "type(data) is dict and data.keys() <= passthrough_known_keys"
+        if any(field.is_required for field in fields):
+            state.namespace.add_constant(
+                "passthrough_required_keys",
+                frozenset(field.id for field in fields if field.is_required),
+            )
+            condition = "type(data) is dict and passthrough_required_keys <= data.keys() <= passthrough_known_keys"
+
+        checks = []
+        for field in fields:
+            if self._field_loaders[field.id] == as_is_stub:
+                continue
+            key = repr(field.id)
+            check = f"{state.v_field_loader(field.id)}(data[{key}]) is data[{key}]"
+            checks.append(f"({key} not in data or {check})" if field.is_optional else check)
+
+        result = "data" if self._share_input else "dict(data)"
+        with state.builder(f"if {condition}:"):
+            if not checks:
+                state.builder += f"return {result}"
+            else:
+                with state.builder("try:"):
+                    with state.builder("passthrough = ("):
+                        state.builder += checks[0]
+                        for check in checks[1:]:
+                            state.builder += f"and {check}"
+                    state.builder += ")"
+                state.builder(
+                    f"""
+                    except Exception:
+                        passthrough = False
+                    if passthrough:
+                        return {result}
+                    """,
+                )
+        state.builder.empty_line()
+
     def _gen_header(self, state: GenState):
         header_builder = CodeBuilder()
         if state.path_to_suffix:
@@ -406,7 +502,15 @@ class BuiltinModelLoaderGen(ModelLoaderGen):
         *,
         assign_to: str,
         on_lookup_error: Optional[str] = None,
-    ):
+    ) -> AbstractContextManager[Any]:
+        """Returns context manager generating code that is executed if the lookup succeeds"""
+        if self._trusted:
+            return self._gen_trusted_assignment_from_parent_data(
+                state,
+                assign_to=assign_to,
+                on_lookup_error=on_lookup_error,
+            )
+
         last_path_el = state.path[-1]
         if isinstance(last_path_el, str):
             lookup_error = "KeyError"
@@ -449,6 +553,30 @@ class BuiltinModelLoaderGen(ModelLoaderGen):
             state.type_checked_type_paths.add(state.parent_path)
 
         self._gen_unexpected_exc_catching(state)
+        return state.builder("else:")
+
+    def _gen_trusted_assignment_from_parent_data(
+        self,
+        state: GenState,
+        *,
+        assign_to: str,
+        on_lookup_error: Optional[str],
+    ) -> AbstractContextManager[Any]:
+        last_path_el = state.path[-1]
+        if on_lookup_error is None:
+            state.builder(f"{assign_to} = {state.parent.v_data}[{last_path_el!r}]")
+            return nullcontext()
+
+        lookup_error = "KeyError" if isinstance(last_path_el, str) else "IndexError"
+        state.builder(
+            f"""
+            try:
+                {assign_to} = {state.parent.v_data}[{last_path_el!r}]
+            except {lookup_error}:
+                {on_lookup_error}
+            """,
+        )
+        return state.builder("else:")
 
     def _gen_unexpected_exc_catching(self, state: GenState):
         if self._debug_trail == DebugTrail.FIRST:
@@ -501,12 +629,11 @@ class BuiltinModelLoaderGen(ModelLoaderGen):
         state.namespace.add_constant(state.v_known_keys, set(crown.map.keys()))
         state.namespace.add_constant(state.v_required_keys, self._get_dict_crown_required_keys(crown))
 
-        if state.path:
+        ctx = (
             self._gen_assignment_from_parent_data(state, assign_to=state.v_data)
-            state.builder.empty_line()
-            ctx: AbstractContextManager[Any] = state.builder("else:")
-        else:
-            ctx = nullcontext()
+            if state.path else
+            nullcontext()
+        )
 
         with ctx:
             if self._can_collect_extra:
@@ -518,13 +645,13 @@ class BuiltinModelLoaderGen(ModelLoaderGen):
                 for key, value in crown.map.items():
                     self._gen_crown_dispatch(state, value, key)
 
-                if state.path not in state.type_checked_type_paths:
+                if state.path not in state.type_checked_type_paths and not self._trusted:
                     with state.builder(f"if not isinstance({state.v_data}, CollectionsMapping):"):
                         self._gen_raise_bad_type_error(state, f"TypeLoadError(CollectionsMapping, {state.v_data})")
                     state.builder.empty_line()
                     state.type_checked_type_paths.add(state.path)
 
-                if crown.extra_policy == ExtraForbid():
+                if crown.extra_policy == ExtraForbid() and not self._trusted:
                     state.builder += f"""
                         {state.v_extra}_set = set({state.v_data}) - {state.v_known_keys}
                         if {state.v_extra}_set:
@@ -546,12 +673,11 @@ class BuiltinModelLoaderGen(ModelLoaderGen):
             self._gen_raise_bad_type_error(state, f"ExcludedTypeLoadError(CollectionsSequence, str, {state.v_data})")
 
     def _gen_list_crown(self, state: GenState, crown: InpListCrown):
-        if state.path:
+        ctx = (
             self._gen_assignment_from_parent_data(state, assign_to=state.v_data)
-            state.builder.empty_line()
-            ctx: AbstractContextManager[Any] = state.builder("else:")
-        else:
-            ctx = nullcontext()
+            if state.path else
+            nullcontext()
+        )
 
         with ctx:
             if self._can_collect_extra:
@@ -562,36 +688,40 @@ class BuiltinModelLoaderGen(ModelLoaderGen):
                 state.builder(f"{state.v_extra} = {list_literal!r}")
 
             with self._maybe_wrap_with_type_load_error_catching(state):
-                if self._strict_coercion:
+                if self._strict_coercion and not self._trusted:
                     self._gen_forbidden_sequence_check(state)
 
                 for key, value in enumerate(crown.map):
                     self._gen_crown_dispatch(state, value, key)
 
-                if state.path not in state.type_checked_type_paths:
+                if state.path not in state.type_checked_type_paths and not self._trusted:
                     with state.builder(f"if not isinstance({state.v_data}, CollectionsSequence):"):
                         self._gen_raise_bad_type_error(state, f"TypeLoadError(CollectionsSequence, {state.v_data})")
                     state.builder.empty_line()
                     state.type_checked_type_paths.add(state.path)
 
-                expected_len = len(crown.map)
-                if crown.extra_policy == ExtraForbid():
-                    state.builder += f"""
-                        if len({state.v_data}) != {expected_len}:
-                            if len({state.v_data}) < {expected_len}:
-                                {state.emit_error(f"NoRequiredItemsLoadError({expected_len}, {state.v_data})")}
-                            else:
-                                {state.emit_error(f"ExtraItemsLoadError({expected_len}, {state.v_data})")}
-                    """
-                else:
-                    state.builder += f"""
-                        if len({state.v_data}) < {expected_len}:
-                            {state.emit_error(f"NoRequiredItemsLoadError({expected_len}, {state.v_data})")}
-                    """
+                if not self._trusted:
+                    self._gen_list_length_check(state, crown)
 
             if self._can_collect_extra:
                 self._gen_add_self_extra_to_parent_extra(state)
 
+    def _gen_list_length_check(self, state: GenState, crown: InpListCrown) -> None:
+        expected_len = len(crown.map)
+        if crown.extra_policy == ExtraForbid():
+            state.builder += f"""
+                if len({state.v_data}) != {expected_len}:
+                    if len({state.v_data}) < {expected_len}:
+                        {state.emit_error(f"NoRequiredItemsLoadError({expected_len}, {state.v_data})")}
+                    else:
+                        {state.emit_error(f"ExtraItemsLoadError({expected_len}, {state.v_data})")}
+            """
+        else:
+            state.builder += f"""
+                if len({state.v_data}) < {expected_len}:
+                    {state.emit_error(f"NoRequiredItemsLoadError({expected_len}, {state.v_data})")}
+            """
+
     def _get_default_clause_expr(self, state: GenState, field: InputField) -> str:
         if isinstance(field.default, DefaultValue):
             literal_expr = get_literal_expr(field.default.value)
@@ -610,11 +740,10 @@ class BuiltinModelLoaderGen(ModelLoaderGen):
     def _gen_field_crown(self, state: GenState, crown: InpFieldCrown):
         field = state.get_field(crown)
         if field.is_required:
-            self._gen_assignment_from_parent_data(
+            with self._gen_assignment_from_parent_data(
                 state=state,
                 assign_to=state.v_raw_field(field),
-            )
-            with state.builder("else:"):
+            ):
                 self._gen_field_assignment(
                     assign_to=state.v_field(field),
                     field_id=field.id,
@@ -631,12 +760,11 @@ class BuiltinModelLoaderGen(ModelLoaderGen):
                 on_lookup_error = f"{state.v_field(field)} = {self._get_default_clause_expr(state, field)}"
 
             if isinstance(state.path[-1], int):
-                self._gen_assignment_from_parent_data(
+                with self._gen_assignment_from_parent_data(
                     state=state,
                     assign_to=state.v_raw_field(field),
                     on_lookup_error=on_lookup_error,
-                )
-                with state.builder("else:"):
+                ):
                     self._gen_field_assignment(
                         assign_to=assign_to,
                         field_id=field.id,
@@ -661,7 +789,7 @@ class BuiltinModelLoaderGen(ModelLoaderGen):
         assign_to: str,
         on_lookup_error: str,
     ):
-        if state.parent_path in state.type_checked_type_paths:
+        if state.parent_path in state.type_checked_type_paths or self._trusted:
             with state.builder(f"if {state.path[-1]!r} in {state.parent.v_data}:"):
                 self._gen_field_assignment(
                     assign_to=assign_to,
@@ -739,11 +867,10 @@ class BuiltinModelLoaderGen(ModelLoaderGen):
         state: GenState,
     ):
         if self._field_loaders[field_id] == as_is_stub:
-            processing_expr = loader_arg
-        else:
-            field_loader = state.v_field_loader(field_id)
-            processing_expr = f"{field_loader}({loader_arg})"
+            state.builder(f"{assign_to} = {loader_arg}")
+            return
 
+        processing_expr = f"{state.v_field_loader(field_id)}({loader_arg})"
         if self._debug_trail in (DebugTrail.ALL, DebugTrail.FIRST):
             state.builder(
                 f"""
@@ -1,5 +1,6 @@
 from collections.abc import Mapping, Set
 from functools import partial
+from typing import Optional
 
 from ...code_tools.compiler import BasicClosureCompiler, ClosureCompiler
 from ...code_tools.name_sanitizer import BuiltinNameSanitizer, NameSanitizer
@@ -9,18 +10,28 @@ from ...model_tools.definitions import DefaultFactory, DefaultValue, InputField,
 from ...provider.essential import CannotProvide, Mediator
 from ...provider.fields import input_field_to_loc
 from ...provider.located_request import LocatedRequest
+from ...provider.methods_provider import MethodsProvider, method_handler
 from ...provider.shape_provider import InputShapeRequest, provide_generic_resolved_shape
+from ...special_cases_optimization import with_passthrough
 from ...utils import AlwaysEqualHashWrapper, Omittable, Omitted, OrderedMappingHashWrapper
 from ..json_schema.definitions import JSONSchema
 from ..json_schema.request_cls import JSONSchemaRequest
 from ..json_schema.schema_model import JSONValue
 from ..model.loader_gen import BuiltinModelLoaderGen, ModelInputJSONSchemaGen, ModelLoaderProps
 from ..provider_template import JSONSchemaProvider, LoaderProvider
-from ..request_cls import DebugTrailRequest, DumperRequest, LoaderRequest, StrictCoercionRequest
+from ..request_cls import (
+    DebugTrailRequest,
+    DumperRequest,
+    InputSharingRequest,
+    LoaderRequest,
+    MaxErrorsRequest,
+    StrictCoercionRequest,
+    TrustedInputRequest,
+)
 from .basic_gen import (
     CodeGenHook,
     ModelLoaderGen,
-    compile_closure_with_globals_capturing,
+    compile_model_closure,
     fetch_code_gen_hook,
     get_extra_targets_at_crown,
     get_optional_fields_at_list_crown,
@@ -52,6 +63,9 @@ class ModelLoaderProvider(LoaderProvider, JSONSchemaProvider):
             field_loaders=OrderedMappingHashWrapper(field_loaders),
             strict_coercion=mediator.mandatory_provide(StrictCoercionRequest(loc_stack=request.loc_stack)),
             debug_trail=mediator.mandatory_provide(DebugTrailRequest(loc_stack=request.loc_stack)),
+            max_errors=mediator.mandatory_provide(MaxErrorsRequest(loc_stack=request.loc_stack)),
+            trusted=mediator.mandatory_provide(TrustedInputRequest(loc_stack=request.loc_stack)),
+            share_input=mediator.mandatory_provide(InputSharingRequest(loc_stack=request.loc_stack)),
             code_gen_hook=AlwaysEqualHashWrapper(fetch_code_gen_hook(mediator, request.loc_stack)),
             model_identity=self._fetch_model_identity(mediator, request, shape, name_layout),
             closure_name=self._get_closure_name(request),
@@ -66,6 +80,9 @@ class ModelLoaderProvider(LoaderProvider, JSONSchemaProvider):
         field_loaders: OrderedMappingHashWrapper[Mapping[str, Loader]],
         strict_coercion: bool,
         debug_trail: DebugTrail,
+        max_errors: Optional[int],
+        trusted: bool,
+        share_input: bool,
         code_gen_hook: AlwaysEqualHashWrapper[CodeGenHook],
         model_identity: str,
         closure_name: str,
@@ -75,22 +92,26 @@ class ModelLoaderProvider(LoaderProvider, JSONSchemaProvider):
         self._validate_params(shape, name_layout, skipped_fields)
         loader_gen = self._create_model_loader_gen(
             debug_trail=debug_trail,
+            max_errors=max_errors,
             strict_coercion=strict_coercion,
+            trusted=trusted,
+            share_input=share_input,
             shape=shape,
             name_layout=name_layout,
             field_loaders=field_loaders.mapping,
             skipped_fields=skipped_fields,
             model_identity=model_identity,
         )
-        loader_code, loader_namespace = loader_gen.produce_code(closure_name=closure_name)
-        return compile_closure_with_globals_capturing(
+        loader = compile_model_closure(
             compiler=self._get_compiler(),
             code_gen_hook=code_gen_hook.value,
-            namespace=loader_namespace,
-            closure_code=loader_code,
+            gen=loader_gen,
             closure_name=closure_name,
             file_name=file_name,
         )
+        if isinstance(loader_gen, BuiltinModelLoaderGen) and loader_gen.passes_input_through:
+            return with_passthrough(loader)
+        return loader
 
     def _generate_json_schema(self, mediator: Mediator, request: JSONSchemaRequest) -> JSONSchema:
         if request.ctx.direction != Direction.INPUT:
@@ -154,7 +175,10 @@ class ModelLoaderProvider(LoaderProvider, JSONSchemaProvider):
         self,
         *,
         debug_trail: DebugTrail,
+        max_errors: Optional[int],
         strict_coercion: bool,
+        trusted: bool,
+        share_input: bool,
         shape: InputShape,
         name_layout: InputNameLayout,
         field_loaders: Mapping[str, Loader],
@@ -165,7 +189,10 @@ class ModelLoaderProvider(LoaderProvider, JSONSchemaProvider):
             shape=shape,
             name_layout=name_layout,
             debug_trail=debug_trail,
+            max_errors=max_errors,
             strict_coercion=strict_coercion,
+            trusted=trusted,
+            share_input=share_input,
             field_loaders=field_loaders,
             skipped_fields=skipped_fields,
             model_identity=model_identity,
@@ -278,3 +305,12 @@ class InlinedShapeModelLoaderProvider(ModelLoaderProvider):
 
     def _fetch_shape(self, mediator: Mediator, request: LocatedRequest) -> InputShape:
         return self._shape
+
+
+class InputSharingProvider(MethodsProvider):
+    def __init__(self, *, share_input: bool):
+        self._share_input = share_input
+
+    @method_handler
+    def _input_sharing(self, mediator: Mediator, request: InputSharingRequest) -> bool:
+        return self._share_input
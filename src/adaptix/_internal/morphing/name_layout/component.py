@@ -1,6 +1,6 @@
 from collections import defaultdict
 from collections.abc import Iterable, Mapping, Sequence
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing import Callable, Optional, TypeVar, Union
 
 from ...common import VarTuple
@@ -341,11 +341,13 @@ class BuiltinStructureMaker(StructureMaker):
 @dataclass(frozen=True)
 class SievesSchema(Schema):
     omit_default: LocStackChecker
+    pure_default_factory: LocStackChecker
 
 
 @dataclass(frozen=True)
 class SievesOverlay(Overlay[SievesSchema]):
     omit_default: Omittable[LocStackChecker]
+    pure_default_factory: Omittable[LocStackChecker]
 
 
 class BuiltinSievesMaker(SievesMaker):
@@ -376,6 +378,11 @@ class BuiltinSievesMaker(SievesMaker):
             if isinstance(leaf, OutFieldCrown):
                 field = request.shape.fields_dict[leaf.id]
                 if field.default != NoDefault() and apply_lsc(mediator, request, schema.omit_default, field):
+                    if (
+                        isinstance(field.default, DefaultFactory)
+                        and apply_lsc(mediator, request, schema.pure_default_factory, field)
+                    ):
+                        field = replace(field, default=DefaultValue(field.default.factory()))
                     result[path] = self._create_sieve(field)
         return result
 
@@ -11,13 +11,14 @@ from ..provider.loc_stack_filtering import LocStack
 from ..provider.loc_stack_tools import format_type
 from ..provider.located_request import LocatedRequest, for_predicate
 from ..provider.location import GenericParamLoc
-from ..special_cases_optimization import as_is_stub
-from ..type_tools import BaseNormType, is_subclass_soft, strip_tags
+from ..provider.methods_provider import MethodsProvider, method_handler
+from ..special_cases_optimization import as_is_stub, is_passthrough, with_passthrough
+from ..type_tools import BaseNormType, is_subclass_soft, normalize_type, strip_tags
 from ..type_tools.normalize_type import NoneType
 from .concrete_provider import none_loader
 from .load_error import LoadError, TypeLoadError, UnionLoadError
 from .provider_template import DumperProvider, LoaderProvider
-from .request_cls import DebugTrailRequest, DumperRequest, LoaderRequest
+from .request_cls import DebugTrailRequest, DumperRequest, LoaderRequest, MaxErrorsRequest, TrustedInputRequest
 from .sentinel_provider import check_is_sentinel
 from .utils import try_normalize_type
 
@@ -71,18 +72,33 @@ class UnionProvider(LoaderProvider, DumperProvider):
             return loaders[0]
 
         if (not_none_loader := self._parse_single_optional_loader(loaders)) is not None:
-            if debug_trail in (DebugTrail.ALL, DebugTrail.FIRST):
-                return mediator.cached_call(self._produce_single_optional_dt_loader, norm.source, not_none_loader)
-            if debug_trail == DebugTrail.DISABLE:
-                return mediator.cached_call(self._produce_single_optional_dt_disable_loader, not_none_loader)
-            raise ValueError
+            return self._get_single_optional_loader(mediator, request, norm, debug_trail, not_none_loader)
 
         if debug_trail == DebugTrail.DISABLE:
             return mediator.cached_call(self._produce_loader_dt_disable, tuple(loaders))
         if debug_trail == DebugTrail.FIRST:
             return mediator.cached_call(self._produce_loader_dt_first, norm.source, tuple(loaders))
         if debug_trail == DebugTrail.ALL:
-            return mediator.cached_call(self._produce_loader_dt_all, norm.source, tuple(loaders))
+            max_errors = mediator.mandatory_provide(MaxErrorsRequest(loc_stack=request.loc_stack))
+            return mediator.cached_call(self._produce_loader_dt_all, norm.source, tuple(loaders), max_errors)
+        raise ValueError
+
+    def _get_single_optional_loader(
+        self,
+        mediator: Mediator,
+        request: LoaderRequest,
+        norm: BaseNormType,
+        debug_trail: DebugTrail,
+        not_none_loader: Loader,
+    ) -> Loader:
+        if not_none_loader == as_is_stub and mediator.mandatory_provide(
+            TrustedInputRequest(loc_stack=request.loc_stack),
+        ):
+            return as_is_stub
+        if debug_trail in (DebugTrail.ALL, DebugTrail.FIRST):
+            return mediator.cached_call(self._produce_single_optional_dt_loader, norm.source, not_none_loader)
+        if debug_trail == DebugTrail.DISABLE:
+            return mediator.cached_call(self._produce_single_optional_dt_disable_loader, not_none_loader)
         raise ValueError
 
     def _parse_single_optional_loader(self, loaders: Sequence[Loader]) -> Optional[Loader]:
@@ -102,6 +118,8 @@ class UnionProvider(LoaderProvider, DumperProvider):
                 return None
             return loader(data)
 
+        if is_passthrough(loader):
+            return with_passthrough(optional_dt_disable_loader)
         return optional_dt_disable_loader
 
     def _produce_single_optional_dt_loader(self, tp, loader: Loader) -> Loader:
@@ -113,6 +131,8 @@ class UnionProvider(LoaderProvider, DumperProvider):
             except LoadError as e:
                 raise UnionLoadError(f"while loading {tp}", [TypeLoadError(None, data), e])
 
+        if is_passthrough(loader):
+            return with_passthrough(optional_dt_loader)
         return optional_dt_loader
 
     def _produce_loader_dt_disable(self, loader_iter: Iterable[Loader]) -> Loader:
@@ -139,7 +159,8 @@ class UnionProvider(LoaderProvider, DumperProvider):
 
         return union_loader_dt_first
 
-    def _produce_loader_dt_all(self, tp, loader_iter: Iterable[Loader]) -> Loader:
+    def _produce_loader_dt_all(self, tp, loader_iter: Iterable[Loader], max_errors: Optional[int]) -> Loader:
+        # every case has to be tried to load valid data, so only the count of kept errors is limited
         def union_loader_dt_all(data):
             errors = []
             has_unexpected_error = False
@@ -156,8 +177,8 @@ class UnionProvider(LoaderProvider, DumperProvider):
                         return result
 
             if has_unexpected_error:
-                raise CompatExceptionGroup(f"while loading {tp}", errors)
-            raise UnionLoadError(f"while loading {tp}", errors)
+                raise CompatExceptionGroup(f"while loading {tp}", errors[:max_errors])
+            raise UnionLoadError(f"while loading {tp}", errors[:max_errors])
 
         return union_loader_dt_all
 
@@ -280,3 +301,24 @@ class UnionProvider(LoaderProvider, DumperProvider):
             return dumper_class_dispatcher.dispatch(type(data))(data)
 
         return union_dumper
+
+
+def _is_probed_union(tp: TypeHint) -> bool:
+    try:
+        norm = normalize_type(tp)
+    except ValueError:
+        return False
+    return norm.origin == Union and sum(case.origin is not None for case in norm.args) > 1
+
+
+class ProbedUnionTrustProvider(MethodsProvider):
+    """Union loader picks the case by trying loaders one by one,
+    so loaders inside such union must reject unsuitable data and never trust the input.
+    Other requests are passed to the next provider.
+    """
+
+    @method_handler
+    def _trusted_input(self, mediator: Mediator, request: TrustedInputRequest) -> bool:
+        if any(_is_probed_union(loc.type) for loc in request.loc_stack):
+            return False
+        raise CannotProvide
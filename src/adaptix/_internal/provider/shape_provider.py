@@ -2,6 +2,7 @@ import inspect
 from collections.abc import Container, Iterable
 from dataclasses import dataclass, replace
 from typing import Any, Generic, Optional, TypeVar, Union, cast
+from weakref import WeakKeyDictionary, WeakSet
 
 from ..common import TypeHint
 from ..model_tools.definitions import (
@@ -26,6 +27,7 @@ from ..model_tools.introspection.typed_dict import get_typed_dict_shape
 from ..provider.essential import CannotProvide, Mediator
 from ..provider.loc_stack_filtering import create_loc_stack_checker
 from ..type_tools.generic_resolver import GenericResolver, MembersStorage
+from ..utils import AlwaysEqualHashWrapper
 from .essential import RequestChecker
 from .located_request import LocatedRequest, LocatedRequestChecker
 from .methods_provider import MethodsProvider, method_handler
@@ -42,6 +44,89 @@ class OutputShapeRequest(LocatedRequest[OutputShape]):
     pass
 
 
+class ShapeCache:
+    """Process-wide storage of introspected shapes that is shared by all retorts.
+
+    Shape refers to the class itself (via constructor, field types and so on),
+    therefore an entry of any external weak-keyed mapping would keep its key alive forever.
+    To avoid that, the storage is put into ``__dict__`` of the introspected class,
+    so it lives exactly as long as the class does.
+    Classes that forbid setting attributes (builtins, extension types) are kept
+    at a separate weak-keyed mapping, such classes are almost never garbage collected.
+    """
+    _ATTR_NAME = "__adaptix_shapes__"
+
+    def __init__(self) -> None:
+        self._owners: WeakSet[type] = WeakSet()
+        self._immutable_owners: WeakKeyDictionary[type, dict[ShapeIntrospector, Shape]] = WeakKeyDictionary()
+
+    def get_or_introspect(self, introspector: ShapeIntrospector, tp: TypeHint) -> Shape:
+        storage = self._get_storage(tp)
+        if storage is None:
+            return introspector(tp)
+
+        try:
+            return storage[introspector]
+        except KeyError:
+            pass
+
+        shape = introspector(tp)
+        storage[introspector] = shape
+        return shape
+
+    def _get_storage(self, tp: TypeHint) -> Optional[dict[ShapeIntrospector, Shape]]:
+        if not isinstance(tp, type):
+            return None
+
+        try:
+            return tp.__dict__[self._ATTR_NAME]
+        except KeyError:
+            pass
+        try:
+            return self._immutable_owners[tp]
+        except KeyError:
+            pass
+
+        storage: dict[ShapeIntrospector, Shape] = {}
+        try:
+            setattr(tp, self._ATTR_NAME, storage)
+        except (TypeError, AttributeError):
+            self._immutable_owners[tp] = storage
+        else:
+            self._owners.add(tp)
+        return storage
+
+    def invalidate(self, tp: TypeHint) -> None:
+        """Drop all shapes of the class. It must be called if the class is modified in place"""
+        self._immutable_owners.pop(tp, None)
+        if isinstance(tp, type) and self._ATTR_NAME in tp.__dict__:
+            delattr(tp, self._ATTR_NAME)
+        self._owners.discard(tp)
+
+    def clear(self) -> None:
+        for owner in list(self._owners):
+            self.invalidate(owner)
+        self._immutable_owners.clear()
+
+
+shape_cache = ShapeCache()
+
+
+def invalidate_shape_cache(tp: Optional[TypeHint] = None) -> None:
+    """Drop shapes cached by introspection of models.
+
+    Shapes are shared between all retorts, so after a class is modified in place
+    (for example, its annotations are patched) the cache must be invalidated
+    before creating a new retort. Retorts that already produced loaders or dumpers are not affected.
+
+    :param tp: A class whose shapes will be dropped. If it is omitted, the whole cache is cleared
+    """
+    if tp is None:
+        shape_cache.clear()
+    else:
+        shape_cache.invalidate(tp)
+
+
 class ShapeProvider(MethodsProvider):
     def __init__(self, introspector: ShapeIntrospector):
         self._introspector = introspector
@@ -51,7 +136,7 @@ class ShapeProvider(MethodsProvider):
 
     def _get_shape(self, tp) -> Shape:
         try:
-            return self._introspector(tp)
+            return shape_cache.get_or_introspect(self._introspector, tp)
         except TooOldPackageError as e:
             raise CannotProvide(message=e.requirement.fail_reason, is_demonstrative=True) from e
         except ClarifiedIntrospectionError as e:
@@ -161,13 +246,24 @@ class ShapeGenericResolver(Generic[ShapeT]):
         )
 
     def _get_members(self, tp) -> MembersStorage[str, Optional[ShapeT]]:
+        # Members of unparametrized generic are shared by all its parametrizations,
+        # so they are memoized inside retort
+        return self._mediator.cached_call(
+            self._provide_members,
+            AlwaysEqualHashWrapper(self._mediator),
+            replace(
+                self._initial_request,
+                loc_stack=self._initial_request.loc_stack.replace_last_type(tp),
+            ),
+        )
+
+    @staticmethod
+    def _provide_members(
+        mediator: AlwaysEqualHashWrapper[Mediator],
+        request: LocatedRequest[ShapeT],
+    ) -> MembersStorage[str, Optional[ShapeT]]:
         try:
-            shape = self._mediator.delegating_provide(
-                replace(
-                    self._initial_request,
-                    loc_stack=self._initial_request.loc_stack.replace_last_type(tp),
-                ),
-            )
+            shape = mediator.value.delegating_provide(request)
         except CannotProvide:
             return MembersStorage(
                 meta=None,
@@ -181,8 +277,15 @@ class ShapeGenericResolver(Generic[ShapeT]):
         )
 
 
+def _provide_generic_resolved_shape(
+    mediator: AlwaysEqualHashWrapper[Mediator],
+    request: LocatedRequest[ShapeT],
+) -> ShapeT:
+    return ShapeGenericResolver(mediator.value, request).provide()
+
+
 def provide_generic_resolved_shape(mediator: Mediator, request: LocatedRequest[ShapeT]) -> ShapeT:
-    return ShapeGenericResolver(mediator, request).provide()
+    return mediator.cached_call(_provide_generic_resolved_shape, AlwaysEqualHashWrapper(mediator), request)
 
 
 T = TypeVar("T")
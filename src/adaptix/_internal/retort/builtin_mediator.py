@@ -21,6 +21,26 @@ class RequestBus(ABC, Generic[RequestT, ResponseT]):
         pass
 
 
+class CallCacheKey:
+    """Key of ``cached_call`` storage. The hash of arguments is computed only once per call"""
+    __slots__ = ("_hash", "_value")
+
+    def __init__(self, value: tuple[Any, ...]):
+        self._value = value
+        self._hash = hash(value)
+
+    def __hash__(self):
+        return self._hash
+
+    def __eq__(self, other):
+        if isinstance(other, CallCacheKey):
+            return self._hash == other._hash and self._value == other._value
+        return NotImplemented
+
+
+_MISSING = object()
+
+
 class BuiltinMediator(Mediator[ResponseT], Generic[ResponseT]):
     __slots__ = ("_call_cache", "_no_request_bus_error_maker", "_request", "_request_buses", "_search_offset")
 
@@ -52,9 +72,10 @@ class BuiltinMediator(Mediator[ResponseT], Generic[ResponseT]):
         return self._request_buses[type(self._request)].send_chaining(self._request, self._search_offset)
 
     def cached_call(self, func: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:  # type: ignore[override]
-        key = (func, *args, *kwargs.items())
-        if key in self._call_cache:
-            return self._call_cache[key]
+        key = CallCacheKey((func, *args, *kwargs.items()))
+        result = self._call_cache.get(key, _MISSING)
+        if result is not _MISSING:
+            return result
         result = func(*args, **kwargs)
         self._call_cache[key] = result
         return result
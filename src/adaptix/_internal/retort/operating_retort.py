@@ -1,4 +1,6 @@
 from collections.abc import Iterable, Sequence
+from functools import partial
+from types import FunctionType, MethodType
 from typing import Any, Callable, Generic, Optional, TypeVar
 
 from ..conversion.request_cls import CoercerRequest, LinkingRequest
@@ -34,6 +36,37 @@ class FuncWrapper:
         return hash(self._key)
 
 
+def bind_stub(stub: FuncWrapper, func: Callable) -> None:
+    """Replace the stub with the function inside closures reachable from this function.
+    References that cannot be patched (e.g. stored inside arbitrary objects) continue to use the stub.
+    """
+    visited = set()
+    to_visit: list[Any] = [func]
+    while to_visit:
+        obj = to_visit.pop()
+        if id(obj) in visited:
+            continue
+        visited.add(id(obj))
+
+        if isinstance(obj, tuple):
+            to_visit.extend(obj)
+        elif isinstance(obj, MethodType):
+            to_visit.append(obj.__func__)
+        elif isinstance(obj, partial):
+            to_visit.append(obj.func)
+            to_visit.extend(obj.args)
+        elif isinstance(obj, FunctionType) and obj.__closure__ is not None:
+            for cell in obj.__closure__:
+                try:
+                    value = cell.cell_contents
+                except ValueError:  # cell is empty
+                    continue
+                if value is stub:
+                    cell.cell_contents = func
+                else:
+                    to_visit.append(value)
+
+
 CallableT = TypeVar("CallableT", bound=Callable)
 
 
@@ -43,7 +76,7 @@ class LocatedRequestCallableRecursionResolver(RecursionResolver[LocatedRequest,
 
     def track_request(self, request: LocatedRequest) -> Optional[Any]:
         last_loc = request.last_loc
-        if sum(loc == last_loc for loc in request.loc_stack) == 1:
+        if request.loc_stack.count(last_loc) == 1:
             return None
 
         if last_loc in self._loc_to_stub:
@@ -55,7 +88,9 @@ class LocatedRequestCallableRecursionResolver(RecursionResolver[LocatedRequest,
     def track_response(self, request: LocatedRequest, response: CallableT) -> None:
         last_loc = request.last_loc
         if last_loc in self._loc_to_stub:
-            self._loc_to_stub.pop(last_loc).set_func(response)
+            stub = self._loc_to_stub.pop(last_loc)
+            stub.set_func(response)
+            bind_stub(stub, response)
 
 
 RequestT = TypeVar("RequestT", bound=Request)
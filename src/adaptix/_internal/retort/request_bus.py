@@ -27,6 +27,16 @@ class ErrorRepresentor(ABC, Generic[RequestT]):
         ...
 
 
+class SilentErrorRepresentor(ErrorRepresentor[RequestT], Generic[RequestT]):
+    """Error representor for the cases when the error is never shown, so descriptions are not built"""
+
+    def get_provider_not_found_description(self, request: RequestT) -> str:
+        return ""
+
+    def get_request_context_notes(self, request: RequestT) -> Iterable[str]:
+        return ()
+
+
 class RequestRouter(ABC, Generic[RequestT]):
     """An offset of each element must belong to [0; max_offset)"""
 
@@ -18,7 +18,14 @@ from ..utils import add_note, copy_exception_dunders, with_module
 from .base_retort import BaseRetort
 from .builtin_mediator import BuiltinMediator, RequestBus
 from .error_renderer import BuiltinErrorRenderer, ErrorRenderer
-from .request_bus import BasicRequestBus, ErrorRepresentor, RecursionResolver, RecursiveRequestBus, RequestRouter
+from .request_bus import (
+    BasicRequestBus,
+    ErrorRepresentor,
+    RecursionResolver,
+    RecursiveRequestBus,
+    RequestRouter,
+    SilentErrorRepresentor,
+)
 from .routers import CheckerAndHandler
 
 
@@ -26,13 +33,41 @@ from .routers import CheckerAndHandler
 class ProviderNotFoundError(Exception):
     def __init__(self, message: str, description: Optional[str] = None):
         self.message = message
-        self.description = description
+        self._description = description
+        self._description_factory: Optional[Callable[[], Optional[str]]] = None
+
+    @classmethod
+    def _with_lazy_description(
+        cls,
+        message: str,
+        description_factory: Callable[[], Optional[str]],
+    ) -> "ProviderNotFoundError":
+        exception = cls(message)
+        exception._description_factory = description_factory
+        return exception
+
+    @property
+    def description(self) -> Optional[str]:
+        if self._description_factory is not None:
+            self._description = self._description_factory()
+            self._description_factory = None
+        return self._description
+
+    @description.setter
+    def description(self, value: Optional[str]) -> None:
+        self._description = value
+        self._description_factory = None
 
     def __str__(self):
         if self.description is not None:
             return self.message + "\n" + self.description
         return self.message
 
+    def __reduce__(self):
+        # accessing description renders it and drops the factory referring to the retort
+        description = self.description
+        return type(self), (self.message, description), self.__dict__
+
 
 T = TypeVar("T")
 RequestT = TypeVar("RequestT", bound=Request)
@@ -53,8 +88,8 @@ class SearchingRetort(BaseRetort, Provider, ABC):
         self._error_renderer = error_renderer
         super().__init__(recipe=recipe)
 
-    def _provide_from_recipe(self, request: Request[T]) -> T:
-        return self._create_mediator(request).provide(request)
+    def _provide_from_recipe(self, request: Request[T], *, silent_errors: bool = False) -> T:
+        return self._create_mediator(request, silent_errors=silent_errors).provide(request)
 
     def get_request_handlers(self) -> Sequence[RequestHandlerRegisterRecord]:
         def retort_request_handler(mediator, request):
@@ -87,16 +122,17 @@ class SearchingRetort(BaseRetort, Provider, ABC):
             raise self._get_facade_error(e, error_message)
 
     def _get_facade_error(self, e: CannotProvide, error_message: str) -> Exception:
-        cause = self._get_exception_cause(e)
+        error_renderer = self._error_renderer
+        if error_renderer is not None:
+            def render_description() -> Optional[str]:
+                cause = self._get_exception_cause(e)
+                return error_renderer.render(cause) if cause is not None else None
 
-        if self._error_renderer is not None:
-            exception = ProviderNotFoundError(
-                error_message,
-                self._error_renderer.render(cause) if cause is not None else None,
-            )
+            exception = ProviderNotFoundError._with_lazy_description(error_message, render_description)
             exception.__cause__ = None
             return exception
 
+        cause = self._get_exception_cause(e)
         exception = ProviderNotFoundError(error_message)
         if cause is not None:
             for sub_exc in self._exception_walk(cause):
@@ -135,6 +171,7 @@ class SearchingRetort(BaseRetort, Provider, ABC):
             for request_cls in self._request_cls_to_router
         }
         self._call_cache: dict[Any, Any] = {}
+        self._silent_error_representor: ErrorRepresentor = SilentErrorRepresentor()
 
     def _create_request_cls_to_router(self, full_recipe: Sequence[Provider]) -> Mapping[type[Request], RequestRouter]:
         request_cls_to_checkers_and_handlers: defaultdict[type[Request], list[CheckerAndHandler]] = defaultdict(list)
@@ -168,8 +205,8 @@ class SearchingRetort(BaseRetort, Provider, ABC):
         request_cls: type[RequestT],
         router: RequestRouter[RequestT],
         mediator_factory: Callable[[Request, int], Mediator],
+        error_representor: ErrorRepresentor[RequestT],
     ) -> RequestBus:
-        error_representor = self._request_cls_to_error_representor[request_cls]
         recursion_resolver = self._create_recursion_resolver(request_cls)
         if recursion_resolver is not None:
             return RecursiveRequestBus(
@@ -190,7 +227,7 @@ class SearchingRetort(BaseRetort, Provider, ABC):
 
         return no_request_bus_error_maker
 
-    def _create_mediator(self, init_request: Request[T]) -> Mediator[T]:
+    def _create_mediator(self, init_request: Request[T], *, silent_errors: bool = False) -> Mediator[T]:
         request_buses: Mapping[type[Request], RequestBus]
         no_request_bus_error_maker = self._create_no_request_bus_error_maker()
         call_cache = self._call_cache
@@ -205,7 +242,16 @@ class SearchingRetort(BaseRetort, Provider, ABC):
             )
 
         request_buses = {
-            request_cls: self._create_request_bus(request_cls, router, mediator_factory)
+            request_cls: self._create_request_bus(
+                request_cls,
+                router,
+                mediator_factory,
+                (
+                    self._silent_error_representor
+                    if silent_errors else
+                    self._request_cls_to_error_representor[request_cls]
+                ),
+            )
             for request_cls, router in self._request_cls_to_router.items()
         }
         return mediator_factory(init_request, 0)
@@ -1,4 +1,4 @@
-from typing import Optional, TypeVar, Union
+from typing import Callable, Optional, TypeVar, Union
 
 from .model_tools.definitions import DefaultFactory, DefaultFactoryWithSelf, DefaultValue
 from .morphing.model.crown_definitions import Sieve
@@ -7,6 +7,7 @@ as_is_stub = lambda x: x  # noqa: E731
 as_is_stub_with_ctx = lambda x, ctx: x  # noqa: E731
 
 S = TypeVar("S", bound=Sieve)
+F = TypeVar("F", bound=Callable)
 
 
 _DEFAULT_CLAUSE_ATTR_NAME = "_adaptix_default_clause"
@@ -19,3 +20,19 @@ def with_default_clause(default: Union[DefaultValue, DefaultFactory, DefaultFact
 
 def get_default_clause(sieve: Sieve) -> Optional[Union[DefaultValue, DefaultFactory, DefaultFactoryWithSelf]]:
     return getattr(sieve, _DEFAULT_CLAUSE_ATTR_NAME, None)
+
+
+_PASSTHROUGH_ATTR_NAME = "_adaptix_passthrough"
+
+
+def with_passthrough(loader: F) -> F:
+    """Marks loader that returns its argument itself for valid input.
+    The caller still has to compare the result with the argument by identity,
+    because a marked loader is allowed to produce a new object for some inputs.
+    """
+    setattr(loader, _PASSTHROUGH_ATTR_NAME, True)
+    return loader
+
+
+def is_passthrough(loader: Callable) -> bool:
+    return loader == as_is_stub or getattr(loader, _PASSTHROUGH_ATTR_NAME, False)
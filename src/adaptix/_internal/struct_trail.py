@@ -1,7 +1,6 @@
-from collections import deque
 from collections.abc import Reversible, Sequence
 from dataclasses import dataclass
-from typing import Any, TypeVar, Union
+from typing import Any, Optional, TypeVar, Union
 
 from .feature_requirement import HAS_NATIVE_EXC_GROUP
 
@@ -35,19 +34,28 @@ Trail = Sequence[TrailElement]
 
 T = TypeVar("T")
 
+# Trail is stored as a linked chain of tuples built from the inside out.
+# Prepending an element does not copy the chain, so a chain that is already captured never changes
+TrailChain = Optional[tuple[TrailElement, "TrailChain"]]
+
+
+def _unwind_trail_chain(chain: TrailChain) -> list[TrailElement]:
+    result = []
+    while chain is not None:
+        element, chain = chain
+        result.append(element)
+    return result
+
 
 def append_trail(obj: T, trail_element: TrailElement) -> T:
     """Append a trail element to object. Trail stores in special attribute,
     if an object does not allow adding 3rd-party attributes, do nothing.
     Element inserting to start of the path (it is built in reverse order)
     """
-    try:
-        # noinspection PyProtectedMember
-        trail = obj._adaptix_struct_trail  # type: ignore[attr-defined]
-    except AttributeError:
-        obj._adaptix_struct_trail = deque([trail_element])  # type: ignore[attr-defined]
-    else:
-        trail.appendleft(trail_element)
+    obj._adaptix_struct_trail = (  # type: ignore[attr-defined]
+        trail_element,
+        getattr(obj, "_adaptix_struct_trail", None),
+    )
     return obj
 
 
@@ -56,39 +64,86 @@ def extend_trail(obj: T, sub_trail: Reversible[TrailElement]) -> T:
     if an object does not allow adding 3rd-party attributes, do nothing.
     Sub path inserting to start (it is built in reverse order)
     """
-    try:
-        # noinspection PyProtectedMember
-        trail = obj._adaptix_struct_trail  # type: ignore[attr-defined]
-    except AttributeError:
-        obj._adaptix_struct_trail = deque(sub_trail)  # type: ignore[attr-defined]
-    else:
-        trail.extendleft(reversed(sub_trail))
+    chain = getattr(obj, "_adaptix_struct_trail", None)
+    for trail_element in reversed(sub_trail):
+        chain = (trail_element, chain)
+    obj._adaptix_struct_trail = chain  # type: ignore[attr-defined]
     return obj
 
 
 def get_trail(obj: object) -> Trail:
     """Retrieve trail from an object. Trail stores in special private attribute that never be accessed directly"""
-    try:
-        # noinspection PyProtectedMember
-        return obj._adaptix_struct_trail  # type: ignore[attr-defined]
-    except AttributeError:
-        return deque()
+    return _unwind_trail_chain(getattr(obj, "_adaptix_struct_trail", None))
+
+
+def _format_trail_note(chain: TrailChain) -> str:
+    return f"Exception was caused at {_unwind_trail_chain(chain)}"
+
+
+class DeferredTrailNotes:
+    """Descriptor replacing ``__notes__`` of exception.
+    It allows :func:`render_trail_as_note` only to capture the trail,
+    the note is formatted when notes are accessed (e.g. exception is displayed)
+    """
+
+    def _flush(self, instance_dict: dict[str, Any]) -> None:
+        pending = instance_dict.pop("_adaptix_pending_trail_note", None)
+        if pending is None:
+            return
+        notes = instance_dict.setdefault("_adaptix_notes", [])
+        for offset, (idx, chain) in enumerate(pending):
+            notes.insert(idx + offset, _format_trail_note(chain))
+
+    def defer(self, instance: BaseException, chain: TrailChain) -> None:
+        instance_dict = instance.__dict__
+        notes_count = len(instance_dict.get("_adaptix_notes", ()))
+        instance_dict.setdefault("_adaptix_pending_trail_note", []).append((notes_count, chain))
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+
+        instance_dict = instance.__dict__
+        self._flush(instance_dict)
+        try:
+            return instance_dict["_adaptix_notes"]
+        except KeyError:
+            raise AttributeError("__notes__") from None
+
+    def __set__(self, instance, value):
+        instance_dict = instance.__dict__
+        instance_dict.pop("_adaptix_pending_trail_note", None)
+        instance_dict["_adaptix_notes"] = value
+
+    def __delete__(self, instance):
+        instance_dict = instance.__dict__
+        instance_dict.pop("_adaptix_pending_trail_note", None)
+        try:
+            del instance_dict["_adaptix_notes"]
+        except KeyError:
+            raise AttributeError("__notes__") from None
 
 
 BaseExcT = TypeVar("BaseExcT", bound=BaseException)
 
 if HAS_NATIVE_EXC_GROUP:
-    def render_trail_as_note(exc: BaseExcT) -> BaseExcT:
-        trail = get_trail(exc)
-        if trail:
-            exc.add_note(f"Exception was caused at {list(trail)}")
-        return exc
+    def _add_trail_note(exc: BaseException, chain: TrailChain) -> None:
+        exc.add_note(_format_trail_note(chain))
 else:
-    def render_trail_as_note(exc: BaseExcT) -> BaseExcT:
-        trail = get_trail(exc)
-        if trail:
-            if hasattr(exc, "__notes__"):
-                exc.__notes__.append(f"Exception was caused at {list(trail)}")
-            else:
-                exc.__notes__ = [f"Exception was caused at {list(trail)}"]
-        return exc
+    def _add_trail_note(exc: BaseException, chain: TrailChain) -> None:
+        note = _format_trail_note(chain)
+        if hasattr(exc, "__notes__"):
+            exc.__notes__.append(note)
+        else:
+            exc.__notes__ = [note]
+
+
+def render_trail_as_note(exc: BaseExcT) -> BaseExcT:
+    chain = getattr(exc, "_adaptix_struct_trail", None)
+    if chain is not None:
+        notes_descriptor = getattr(type(exc), "__notes__", None)
+        if isinstance(notes_descriptor, DeferredTrailNotes):
+            notes_descriptor.defer(exc, chain)
+        else:
+            _add_trail_note(exc, chain)
+    return exc
@@ -209,6 +209,32 @@ def fix_dataclass_from_builtin(cls: ClassT) -> ClassT:
     return cls
 
 
+def cache_hash(cls: ClassT) -> ClassT:
+    """Make instances of frozen dataclass compute hash only once.
+    Decorator must be applied after the dataclass decorator
+    and to every subclass because dataclass generates a new ``__hash__`` for each of them.
+    """
+    compute_hash = cls.__hash__
+
+    def __hash__(self):  # noqa: N807
+        try:
+            return self.__dict__["_cached_hash"]
+        except KeyError:
+            result = compute_hash(self)
+            object.__setattr__(self, "_cached_hash", result)
+            return result
+
+    def __getstate__(self):  # noqa: N807
+        # hash of strings is randomized per process, so it can not be stored
+        state = self.__dict__.copy()
+        state.pop("_cached_hash", None)
+        return state
+
+    cls.__hash__ = __hash__  # type: ignore[assignment]
+    cls.__getstate__ = __getstate__  # type: ignore[method-assign,assignment]
+    return cls
+
+
 def create_deprecated_alias_getter(module_name, old_name_to_new_name):
     def deprecated_alias_getter(name):
         if name not in old_name_to_new_name:
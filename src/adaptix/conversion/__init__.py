@@ -1,14 +1,26 @@
-from adaptix._internal.conversion.facade.func import convert, get_converter, impl_converter
+from adaptix._internal.conversion.facade.func import (
+    convert,
+    convert_many,
+    get_converter,
+    get_updater,
+    impl_converter,
+    impl_updater,
+)
 from adaptix._internal.conversion.facade.provider import (
     allow_unlinked_optional,
     coercer,
+    copy_immutable,
     forbid_unlinked_optional,
     from_param,
+    inline_depth,
     link,
     link_constant,
     link_function,
+    share_immutable,
+    treat_as_immutable,
 )
 from adaptix._internal.conversion.facade.retort import AdornedConversionRetort, ConversionRetort, FilledConversionRetort
+from adaptix._internal.conversion.row import make_row_type
 
 __all__ = (
     "AdornedConversionRetort",
@@ -17,11 +29,19 @@ __all__ = (
     "allow_unlinked_optional",
     "coercer",
     "convert",
+    "convert_many",
+    "copy_immutable",
     "forbid_unlinked_optional",
     "from_param",
     "get_converter",
+    "get_updater",
     "impl_converter",
+    "impl_updater",
+    "inline_depth",
     "link",
     "link_constant",
     "link_function",
+    "make_row_type",
+    "share_immutable",
+    "treat_as_immutable",
 )
@@ -5,6 +5,7 @@ from adaptix._internal.morphing.load_error import (
     ExcludedTypeLoadError,
     ExtraFieldsLoadError,
     ExtraItemsLoadError,
+    FlatLoadError,
     FormatMismatchLoadError,
     LoadError,
     LoadExceptionGroup,
@@ -13,10 +14,12 @@ from adaptix._internal.morphing.load_error import (
     NoRequiredFieldsLoadError,
     NoRequiredItemsLoadError,
     OutOfRangeLoadError,
+    TruncatedAggregateLoadError,
     TypeLoadError,
     UnionLoadError,
     ValidationLoadError,
     ValueLoadError,
+    flatten_load_error,
 )
 from adaptix._internal.utils import create_deprecated_alias_getter
 
@@ -27,6 +30,7 @@ __all__ = (
     "ExcludedTypeLoadError",
     "ExtraFieldsLoadError",
     "ExtraItemsLoadError",
+    "FlatLoadError",
     "FormatMismatchLoadError",
     "LoadError",
     "LoadExceptionGroup",
@@ -35,10 +39,12 @@ __all__ = (
     "NoRequiredFieldsLoadError",
     "NoRequiredItemsLoadError",
     "OutOfRangeLoadError",
+    "TruncatedAggregateLoadError",
     "TypeLoadError",
     "UnionLoadError",
     "ValidationLoadError",
     "ValueLoadError",
+    "flatten_load_error",
 )
 
 
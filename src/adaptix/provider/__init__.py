@@ -1,6 +1,7 @@
 from adaptix._internal.provider.essential import AggregateCannotProvide, CannotProvide, Mediator, Provider, Request
 from adaptix._internal.provider.loc_stack_filtering import LocStackPattern, P, create_loc_stack_checker
 from adaptix._internal.provider.provider_wrapper import Chain
+from adaptix._internal.provider.shape_provider import invalidate_shape_cache
 
 __all__ = (
     "AggregateCannotProvide",
@@ -12,4 +13,5 @@ __all__ = (
     "Provider",
     "Request",
     "create_loc_stack_checker",
+    "invalidate_shape_cache",
 )
@@ -1,3 +1,9 @@
+from adaptix._internal.code_tools.compiler import (
+    SourceRetention,
+    clear_code_caches,
+    get_retained_source_size,
+    set_source_retention,
+)
 from adaptix._internal.retort.base_retort import BaseRetort
 from adaptix._internal.retort.operating_retort import OperatingRetort
 from adaptix._internal.retort.searching_retort import ProviderNotFoundError
@@ -7,6 +13,10 @@ __all__ = (
     "BaseRetort",
     "OperatingRetort",
     "ProviderNotFoundError",
+    "SourceRetention",
+    "clear_code_caches",
+    "get_retained_source_size",
+    "set_source_retention",
 )
 
 __getattr__ = create_deprecated_alias_getter(
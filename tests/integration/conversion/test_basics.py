@@ -22,6 +22,57 @@ def test_convert(model_spec):
     assert convert(SourceModel(field1=1, field2=2), DestModel) == DestModel(field1=1, field2=2)
 
 
+@exclude_model_spec(ModelSpec.TYPED_DICT)
+def test_convert_many(model_spec):
+    from adaptix.conversion import convert_many
+
+    @model_spec.decorator
+    class SourceModel(*model_spec.bases):
+        field1: Any
+        field2: Any
+
+    @model_spec.decorator
+    class DestModel(*model_spec.bases):
+        field1: Any
+        field2: Any
+
+    assert (
+        convert_many([SourceModel(field1=1, field2=2), SourceModel(field1=3, field2=4)], DestModel)
+        ==
+        [DestModel(field1=1, field2=2), DestModel(field1=3, field2=4)]
+    )
+    assert (
+        convert_many(iter([SourceModel(field1=1, field2=2)]), DestModel)
+        ==
+        [DestModel(field1=1, field2=2)]
+    )
+    assert convert_many([], DestModel) == []
+
+
+def test_convert_many_with_explicit_src(model_spec):
+    from adaptix.conversion import convert_many
+
+    @model_spec.decorator
+    class SourceModel(*model_spec.bases):
+        field1: Any
+        field2: Any
+
+    @model_spec.decorator
+    class DestModel(*model_spec.bases):
+        field1: Any
+        field2: Any
+
+    assert (
+        convert_many(
+            (SourceModel(field1=i, field2=i) for i in range(3)),
+            DestModel,
+            src=SourceModel,
+        )
+        ==
+        [DestModel(field1=i, field2=i) for i in range(3)]
+    )
+
+
 def test_copy(model_spec):
     @model_spec.decorator
     class ExampleAny(*model_spec.bases):
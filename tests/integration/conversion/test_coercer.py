@@ -345,6 +345,33 @@ def test_iterable_with_model_and_ctx(model_spec):
     )
 
 
+def test_iterable_of_models_to_tuple(model_spec):
+    @model_spec.decorator
+    class SourceModel(*model_spec.bases):
+        v: int
+
+    @model_spec.decorator
+    class DestModel(*model_spec.bases):
+        v: int
+
+    @impl_converter
+    def convert(a: List[SourceModel]) -> Tuple[DestModel, ...]:
+        ...
+
+    assert convert([SourceModel(v=1), SourceModel(v=2)]) == (DestModel(v=1), DestModel(v=2))
+
+
+def test_iterable_is_copied():
+    @impl_converter
+    def convert(a: List[int]) -> List[int]:
+        ...
+
+    src = [1, 2, 3]
+    result = convert(src)
+    assert result == src
+    assert result is not src
+
+
 def test_iterable_on_top_level():
     @impl_converter(recipe=[coercer(str, int, func=int)])
     def convert(a: List[str]) -> List[int]:
@@ -455,3 +482,30 @@ def test_dict_with_model_and_ctx(model_spec):
         ==
         DestModel(field1=1, field2={"a": DestModelInner(data=1, extra1="e1"), "b": DestModelInner(data=2, extra1="e1")})
     )
+
+
+def test_dict_with_model_and_key_coercer(model_spec):
+    @model_spec.decorator
+    class SourceModel(*model_spec.bases):
+        v: int
+
+    @model_spec.decorator
+    class DestModel(*model_spec.bases):
+        v: int
+
+    @impl_converter(recipe=[coercer(str, int, func=int)])
+    def convert(a: Dict[str, SourceModel]) -> Dict[int, DestModel]:
+        ...
+
+    assert convert({"1": SourceModel(v=1), "2": SourceModel(v=2)}) == {1: DestModel(v=1), 2: DestModel(v=2)}
+
+
+def test_dict_is_copied():
+    @impl_converter
+    def convert(a: Dict[str, int]) -> Dict[str, int]:
+        ...
+
+    src = {"a": 1, "b": 2}
+    result = convert(src)
+    assert result == src
+    assert result is not src
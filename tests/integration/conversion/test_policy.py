@@ -1,6 +1,20 @@
+from dataclasses import dataclass
+from typing import NamedTuple, Optional
+
+import pytest
 from tests_helpers import ModelSpec, exclude_model_spec
 
-from adaptix.conversion import allow_unlinked_optional, impl_converter
+from adaptix._internal.morphing.model.basic_gen import CodeGenAccumulator
+from adaptix.conversion import (
+    ConversionRetort,
+    allow_unlinked_optional,
+    coercer,
+    copy_immutable,
+    impl_converter,
+    inline_depth,
+    share_immutable,
+    treat_as_immutable,
+)
 
 
 @exclude_model_spec(ModelSpec.TYPED_DICT)
@@ -25,3 +39,195 @@ def test_unlinked_optional(src_model_spec, dst_model_spec):
         assert convert(SourceModel(field1="1", field2="2")) == DestModel(field1="1", field2="2")
     else:
         assert convert(SourceModel(field1="1", field2="2")) == DestModel(field1="1", field2="2", wild="")
+
+
+@dataclass(frozen=True)
+class Country:
+    code: str
+    names: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class Category:
+    name: str
+    parent: Optional["Category"]
+
+
+class Point(NamedTuple):
+    x: int
+    y: int
+
+
+@dataclass(frozen=True)
+class FrozenWithList:
+    items: list[int]
+
+
+class Registry:
+    pass
+
+
+@pytest.mark.parametrize(
+    ["tp", "value", "is_shared"],
+    [
+        pytest.param(Country, Country(code="us", names=("USA",)), True),
+        pytest.param(tuple[Country, ...], (Country(code="us", names=("USA",)),), True),
+        pytest.param(Category, Category(name="b", parent=Category(name="a", parent=None)), True),
+        pytest.param(Point, Point(x=1, y=2), True),
+        pytest.param(FrozenWithList, FrozenWithList(items=[1, 2]), False),
+    ],
+)
+def test_share_immutable(tp, value, is_shared):
+    @dataclass
+    class SourceModel:
+        field: tp
+
+    @dataclass
+    class DestModel:
+        field: tp
+
+    @impl_converter(recipe=[share_immutable()])
+    def convert(a: SourceModel) -> DestModel:
+        ...
+
+    result = convert(SourceModel(field=value))
+    assert result == DestModel(field=value)
+    assert (result.field is value) == is_shared
+
+
+def test_copy_immutable_by_default():
+    @dataclass
+    class SourceModel:
+        field: Country
+
+    @dataclass
+    class DestModel:
+        field: Country
+
+    @impl_converter
+    def convert(a: SourceModel) -> DestModel:
+        ...
+
+    @impl_converter(recipe=[copy_immutable("field"), share_immutable()])
+    def convert_with_copy(a: SourceModel) -> DestModel:
+        ...
+
+    country = Country(code="us", names=("USA",))
+    assert convert(SourceModel(field=country)).field is not country
+    assert convert_with_copy(SourceModel(field=country)).field is not country
+
+
+def test_treat_as_immutable():
+    @dataclass(frozen=True)
+    class Config:
+        registry: Registry
+
+    @dataclass
+    class SourceModel:
+        field: Config
+
+    @dataclass
+    class DestModel:
+        field: Config
+
+    @impl_converter(recipe=[share_immutable()])
+    def convert(a: SourceModel) -> DestModel:
+        ...
+
+    @impl_converter(recipe=[share_immutable(), treat_as_immutable(Registry)])
+    def convert_with_registry(a: SourceModel) -> DestModel:
+        ...
+
+    config = Config(registry=Registry())
+    assert convert(SourceModel(field=config)).field is not config
+    assert convert_with_registry(SourceModel(field=config)).field is config
+
+
+def test_shared_immutable_skips_nested_rules():
+    @dataclass
+    class SourceModel:
+        field: Country
+
+    @dataclass
+    class DestModel:
+        field: Country
+
+    @impl_converter(recipe=[coercer(str, str, str.upper), share_immutable()])
+    def convert(a: SourceModel) -> DestModel:
+        ...
+
+    @impl_converter(recipe=[coercer(str, str, str.upper), copy_immutable(Country), share_immutable()])
+    def convert_with_copy(a: SourceModel) -> DestModel:
+        ...
+
+    country = Country(code="us", names=("USA",))
+    assert convert(SourceModel(field=country)).field is country
+    assert convert_with_copy(SourceModel(field=country)).field == Country(code="US", names=("USA",))
+
+
+@dataclass
+class SourceLevel4:
+    value: int
+
+
+@dataclass
+class SourceLevel3:
+    inner: SourceLevel4
+
+
+@dataclass
+class SourceLevel2:
+    inner: SourceLevel3
+
+
+@dataclass
+class SourceLevel1:
+    inner: SourceLevel2
+
+
+@dataclass
+class DestLevel4:
+    value: int
+
+
+@dataclass
+class DestLevel3:
+    inner: DestLevel4
+
+
+@dataclass
+class DestLevel2:
+    inner: DestLevel3
+
+
+@dataclass
+class DestLevel1:
+    inner: DestLevel2
+
+
+@pytest.mark.parametrize(
+    ["recipe", "called_coercer"],
+    [
+        pytest.param([inline_depth(0)], "coerce_SourceLevel2_to_DestLevel2", id="disabled"),
+        pytest.param([inline_depth(1)], "coerce_SourceLevel3_to_DestLevel3", id="depth-1"),
+        pytest.param([inline_depth(2)], "coerce_SourceLevel4_to_DestLevel4", id="depth-2"),
+        pytest.param([], None, id="default"),
+        pytest.param([inline_depth(0, DestLevel1), inline_depth(2)], "coerce_SourceLevel2_to_DestLevel2", id="bound"),
+    ],
+)
+def test_inline_depth(recipe, called_coercer):
+    accum = CodeGenAccumulator()
+    converter = ConversionRetort(recipe=[accum, *recipe]).get_converter(SourceLevel1, DestLevel1)
+    assert converter(SourceLevel1(SourceLevel2(SourceLevel3(SourceLevel4(1))))) == DestLevel1(
+        DestLevel2(DestLevel3(DestLevel4(1))),
+    )
+
+    [outer_coercer_source] = [
+        source for _, source in accum.code_pairs if "def coerce_SourceLevel1_to_DestLevel1" in source
+    ]
+    called_coercers = {
+        name
+        for name in [f"coerce_SourceLevel{i}_to_DestLevel{i}" for i in range(2, 5)]
+        if f"{name}(" in outer_coercer_source
+    }
+    assert called_coercers == ({called_coercer} if called_coercer else set())
@@ -0,0 +1,77 @@
+import sqlite3
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any
+
+import pytest
+from tests_helpers import raises_exc
+
+from adaptix import P
+from adaptix.conversion import coercer, convert_many, get_converter, link, make_row_type
+
+
+@dataclass
+class Book:
+    id: int
+    title: str
+    price: Decimal
+
+
+@pytest.fixture
+def connection():
+    connection = sqlite3.connect(":memory:")
+    connection.execute("CREATE TABLE book (id INTEGER, author TEXT, title TEXT, price TEXT)")
+    connection.executemany(
+        "INSERT INTO book VALUES (?, ?, ?, ?)",
+        [(1, "Ray Bradbury", "Fahrenheit 451", "100.5"), (2, "George Orwell", "1984", "120")],
+    )
+    yield connection
+    connection.close()
+
+
+def test_cursor_description(connection):
+    cursor = connection.execute("SELECT title, author, price, id FROM book ORDER BY id")
+    row_type = make_row_type(cursor.description, types={"price": str})
+    convert = get_converter(row_type, Book, recipe=[coercer(str, Decimal, func=Decimal)])
+
+    assert [convert(row) for row in cursor] == [
+        Book(id=1, title="Fahrenheit 451", price=Decimal("100.5")),
+        Book(id=2, title="1984", price=Decimal("120")),
+    ]
+
+
+def test_convert_many(connection):
+    cursor = connection.execute("SELECT * FROM book ORDER BY id")
+    row_type = make_row_type(cursor.description, types={"id": int, "title": str, "price": str})
+
+    assert convert_many(cursor, Book, src=row_type, recipe=[coercer(str, Decimal, func=Decimal)]) == [
+        Book(id=1, title="Fahrenheit 451", price=Decimal("100.5")),
+        Book(id=2, title="1984", price=Decimal("120")),
+    ]
+
+
+def test_invalid_column_names():
+    row_type = make_row_type(["id", "title", "price * 2"])
+    assert row_type._fields == ("id", "title", "_2")
+
+    convert = get_converter(row_type, Book, recipe=[link(P[row_type]._2, P[Book].price)])
+    assert convert((1, "Fahrenheit 451", 201)) == Book(id=1, title="Fahrenheit 451", price=201)
+
+
+def test_types_of_invalid_column_names():
+    row_type = make_row_type(["id", "title", "price * 2"], types={"price * 2": str})
+    assert row_type.__annotations__ == {"id": Any, "title": Any, "_2": str}
+
+    convert = get_converter(
+        row_type,
+        Book,
+        recipe=[link(P[row_type]._2, P[Book].price), coercer(str, Decimal, func=Decimal)],
+    )
+    assert convert((1, "Fahrenheit 451", "201")) == Book(id=1, title="Fahrenheit 451", price=Decimal("201"))
+
+
+def test_types_of_unknown_columns():
+    raises_exc(
+        ValueError("Types are set for unknown columns ['_2', 'author']"),
+        lambda: make_row_type(["id", "title", "price * 2"], types={"_2": str, "author": str}),
+    )
@@ -0,0 +1,162 @@
+from dataclasses import dataclass
+from typing import Any, NamedTuple
+
+import attrs
+import pytest
+from tests_helpers import ModelSpec, exclude_model_spec
+
+from adaptix import P, ProviderNotFoundError
+from adaptix.conversion import from_param, get_updater, impl_updater, link
+
+
+@exclude_model_spec(ModelSpec.NAMED_TUPLE)
+def test_simple(src_model_spec, dst_model_spec):
+    @src_model_spec.decorator
+    class SourceModel(*src_model_spec.bases):
+        field1: Any
+        field2: Any
+
+    @dst_model_spec.decorator
+    class DestModel(*dst_model_spec.bases):
+        field1: Any
+        field2: Any
+        field3: Any
+
+    @impl_updater
+    def update(a: SourceModel, b: DestModel) -> None:
+        ...
+
+    dst = DestModel(field1=1, field2=2, field3=3)
+    assert update(SourceModel(field1=10, field2=20), dst) is None
+    assert dst == DestModel(field1=10, field2=20, field3=3)
+
+
+@exclude_model_spec(ModelSpec.NAMED_TUPLE)
+def test_get_updater(model_spec):
+    @model_spec.decorator
+    class SourceModel(*model_spec.bases):
+        field1: Any
+
+    @model_spec.decorator
+    class DestModel(*model_spec.bases):
+        field1: Any
+        field2: Any
+
+    update = get_updater(SourceModel, DestModel)
+    dst = DestModel(field1=1, field2=2)
+    update(SourceModel(field1=10), dst)
+    assert dst == DestModel(field1=10, field2=2)
+
+
+@exclude_model_spec(ModelSpec.NAMED_TUPLE)
+def test_extra_params(model_spec):
+    @model_spec.decorator
+    class SourceModel(*model_spec.bases):
+        field1: Any
+
+    @model_spec.decorator
+    class DestModel(*model_spec.bases):
+        field1: Any
+        field2: Any
+        field3: Any
+
+    @impl_updater(recipe=[link(from_param("extra"), P[DestModel].field2)])
+    def update(a: SourceModel, b: DestModel, extra: Any) -> None:
+        ...
+
+    dst = DestModel(field1=1, field2=2, field3=3)
+    update(SourceModel(field1=10), dst, 20)
+    assert dst == DestModel(field1=10, field2=20, field3=3)
+
+
+@exclude_model_spec(ModelSpec.TYPED_DICT, ModelSpec.NAMED_TUPLE)
+def test_skip_unchanged(model_spec):
+    @model_spec.decorator
+    class SourceModel(*model_spec.bases):
+        field1: Any
+        field2: Any
+
+    @model_spec.decorator
+    class DestModel(*model_spec.bases):
+        field1: Any
+        field2: Any
+
+    assigned = []
+
+    class TrackedDestModel(DestModel):
+        def __setattr__(self, key, value):
+            assigned.append(key)
+            super().__setattr__(key, value)
+
+    dst = TrackedDestModel(field1=1, field2=2)
+    assigned.clear()
+
+    @impl_updater(skip_unchanged=True)
+    def update(a: SourceModel, b: TrackedDestModel) -> None:
+        ...
+
+    update(SourceModel(field1=1, field2=20), dst)
+    assert assigned == ["field2"]
+    assert (dst.field1, dst.field2) == (1, 20)
+
+
+def test_no_linked_fields(model_spec):
+    @model_spec.decorator
+    class SourceModel(*model_spec.bases):
+        field1: Any
+
+    @model_spec.decorator
+    class DestModel(*model_spec.bases):
+        field2: Any
+
+    with pytest.raises(ProviderNotFoundError, match="No fields of destination model are linked"):
+        get_updater(SourceModel, DestModel)
+
+
+def test_immutable_destination():
+    class SourceModel(NamedTuple):
+        field1: Any
+
+    class DestModel(NamedTuple):
+        field1: Any
+
+    with pytest.raises(Exception, match="destination object does not support assignment"):
+        get_updater(SourceModel, DestModel)
+
+
+@dataclass
+class SourceModelWithField1:
+    field1: Any
+
+
+@dataclass(frozen=True)
+class FrozenDataclassDestModel:
+    field1: Any
+
+
+@attrs.frozen
+class FrozenAttrsDestModel:
+    field1: Any
+
+
+@attrs.define
+class FrozenAttrsFieldDestModel:
+    field1: Any = attrs.field(on_setattr=attrs.setters.frozen)
+
+
+@dataclass
+class DataclassDestModel:
+    field1: Any
+
+
+class PropertyDestModel(DataclassDestModel):
+    field1 = property(lambda self: 1)  # type: ignore[assignment]
+
+
+@pytest.mark.parametrize(
+    "dst_model",
+    [FrozenDataclassDestModel, FrozenAttrsDestModel, FrozenAttrsFieldDestModel, PropertyDestModel],
+)
+def test_read_only_destination(dst_model):
+    with pytest.raises(ProviderNotFoundError, match="destination object does not support assignment"):
+        get_updater(SourceModelWithField1, dst_model)
@@ -94,6 +94,52 @@ def test_int_dt_disable(accum):
     assert dumper(ExampleInt(field1=1, field2=1)) == {"field1": 1, "field2": 1}
 
 
+def test_int_dt_replay(accum):
+    retort = Retort(recipe=[accum], debug_trail=DebugTrail.REPLAY)
+    loader = retort.get_loader(ExampleInt)
+
+    assert loader({"field1": 1, "field2": 1}) == ExampleInt(field1=1, field2=1)
+    assert retort._replay_retort is None
+
+    raises_exc(
+        AggregateLoadError(
+            f"while loading model {ExampleInt}",
+            [
+                with_trail(
+                    TypeLoadError(int, "1"),
+                    ["field1"],
+                ),
+                with_trail(
+                    TypeLoadError(int, "2"),
+                    ["field2"],
+                ),
+            ],
+        ),
+        lambda: loader({"field1": "1", "field2": "2"}),
+    )
+
+    dumper = retort.get_dumper(ExampleInt)
+    assert dumper(ExampleInt(field1=1, field2=1)) == {"field1": 1, "field2": 1}
+
+
+def test_dt_replay_unreproducible_error():
+    calls = []
+
+    def flaky_int(data):
+        calls.append(data)
+        if len(calls) == 1:
+            raise TypeLoadError(int, data)
+        return data
+
+    retort = Retort(recipe=[loader_recipe(int, flaky_int)], debug_trail=DebugTrail.REPLAY)
+
+    with pytest.raises(TypeLoadError) as exc_info:
+        retort.load(1, int)
+
+    assert list(get_trail(exc_info.value)) == []
+    assert calls == [1, 1]
+
+
 def test_int_child():
     class CustomInt(int):
         pass
@@ -0,0 +1,124 @@
+from dataclasses import dataclass, field
+from typing import Any
+
+from adaptix import Retort, name_mapping
+
+
+class CountingEq:
+    def __init__(self, value: int):
+        self.value = value
+        self.eq_calls = 0
+
+    def __eq__(self, other):
+        self.eq_calls += 1
+        return isinstance(other, CountingEq) and self.value == other.value
+
+    def __hash__(self):
+        return hash(self.value)
+
+
+COUNTING_DEFAULT = CountingEq(0)
+
+
+@dataclass
+class WithDefaults:
+    a: int = 0
+    b: tuple[int, ...] = (1, 2, 3)
+    c: Any = COUNTING_DEFAULT
+    d: list[int] = field(default_factory=list)
+    e: dict[str, int] = field(default_factory=dict)
+    f: set[int] = field(default_factory=set)
+    g: frozenset[int] = frozenset()
+
+
+@dataclass
+class WithNaN:
+    a: float = float("nan")
+
+
+class MyList(list):
+    pass
+
+
+def test_values_equal_to_default_are_omitted(accum):
+    retort = Retort(recipe=[accum, name_mapping(omit_default=True)])
+    dumper = retort.get_dumper(WithDefaults)
+
+    assert dumper(WithDefaults()) == {}
+    assert dumper(WithDefaults(b=(1, 2, 3), c=CountingEq(0), d=[], e={}, f=set())) == {}
+    assert dumper(WithDefaults(d=MyList())) == {}
+
+
+def test_values_differ_from_default_are_kept(accum):
+    retort = Retort(recipe=[accum, name_mapping(omit_default=True)])
+    dumper = retort.get_dumper(WithDefaults)
+
+    assert dumper(
+        WithDefaults(a=1, b=(1, 2), d=[1], e={"x": 1}, f={1}, g=frozenset([1])),
+    ) == {"a": 1, "b": (1, 2), "d": [1], "e": {"x": 1}, "f": [1], "g": (1, )}
+    assert dumper(WithDefaults(d=MyList([1]))) == {"d": [1]}
+
+
+def test_non_reflexive_default(accum):
+    retort = Retort(recipe=[accum, name_mapping(omit_default=True)])
+    dumper = retort.get_dumper(WithNaN)
+
+    assert "a" in dumper(WithNaN())
+
+
+def test_default_is_checked_by_identity(accum):
+    retort = Retort(recipe=[accum, name_mapping(omit_default=True)])
+    dumper = retort.get_dumper(WithDefaults)
+
+    COUNTING_DEFAULT.eq_calls = 0
+    assert dumper(WithDefaults()) == {}
+    assert COUNTING_DEFAULT.eq_calls == 0
+
+
+class Config:
+    factory_calls = 0
+
+    def __init__(self, level: int = 0):
+        Config.factory_calls += 1
+        self.level = level
+
+    def __eq__(self, other):
+        return isinstance(other, Config) and self.level == other.level
+
+    def __hash__(self):
+        return hash(self.level)
+
+
+@dataclass
+class WithConfig:
+    config: Any = field(default_factory=Config)
+
+
+def test_pure_default_factory(accum):
+    retort = Retort(
+        recipe=[
+            accum,
+            name_mapping(omit_default=True, pure_default_factory=True),
+        ],
+    )
+    dumper = retort.get_dumper(WithConfig)
+
+    Config.factory_calls = 0
+    assert dumper(WithConfig()) == {}
+    assert dumper(WithConfig(Config(level=0))) == {}
+    assert Config.factory_calls == 2
+    assert dumper(WithConfig(Config(level=1))) == {"config": Config(level=1)}
+
+
+def test_impure_default_factory(accum):
+    retort = Retort(
+        recipe=[
+            accum,
+            name_mapping(omit_default=True),
+        ],
+    )
+    dumper = retort.get_dumper(WithConfig)
+
+    Config.factory_calls = 0
+    assert dumper(WithConfig()) == {}
+    assert Config.factory_calls == 2
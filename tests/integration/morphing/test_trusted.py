@@ -0,0 +1,173 @@
+import inspect
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Any, Optional, Union
+
+import pytest
+from tests_helpers import raises_exc, with_trail
+
+from adaptix import DebugTrail, ExtraForbid, Retort, name_mapping
+from adaptix.load_error import AggregateLoadError, TypeLoadError, UnionLoadError
+
+
+@dataclass
+class Author:
+    name: str
+    born_at: int
+
+
+@dataclass
+class Book:
+    title: str
+    price: int
+    author: Author
+    tags: list[str] = field(default_factory=list)
+    sub_title: Optional[str] = None
+
+
+def test_loading(accum, debug_trail):
+    retort = Retort(recipe=[accum], debug_trail=debug_trail, trusted=True)
+    loader = retort.get_loader(Book)
+
+    assert loader(
+        {
+            "title": "Fahrenheit 451",
+            "price": 100,
+            "author": {"name": "Ray Bradbury", "born_at": 1920},
+        },
+    ) == Book(
+        title="Fahrenheit 451",
+        price=100,
+        author=Author(name="Ray Bradbury", born_at=1920),
+    )
+    assert loader(
+        {
+            "title": "Fahrenheit 451",
+            "price": 100,
+            "author": {"name": "Ray Bradbury", "born_at": 1920},
+            "tags": ["sci-fi"],
+            "sub_title": "The temperature at which book paper catches fire",
+        },
+    ) == Book(
+        title="Fahrenheit 451",
+        price=100,
+        author=Author(name="Ray Bradbury", born_at=1920),
+        tags=["sci-fi"],
+        sub_title="The temperature at which book paper catches fire",
+    )
+
+
+def test_generated_code_has_no_checks(accum, debug_trail):
+    retort = Retort(recipe=[accum], debug_trail=debug_trail, trusted=True)
+    retort.get_loader(Author)
+    source = accum.code_dict[Author]
+
+    assert "isinstance" not in source
+    assert "try" not in source
+    assert "except" not in source
+
+
+def test_nested_crowns(accum):
+    retort = Retort(
+        recipe=[
+            accum,
+            name_mapping(
+                Author,
+                map={"name": ("info", 0), "born_at": ("info", 1)},
+                extra_in=ExtraForbid(),
+            ),
+        ],
+        trusted=True,
+    )
+    loader = retort.get_loader(Author)
+
+    assert loader({"info": ["Ray Bradbury", 1920]}) == Author(name="Ray Bradbury", born_at=1920)
+
+
+@dataclass
+class WithExtra:
+    name: str
+    extra: dict[str, Any]
+
+
+def test_extra_is_collected(accum):
+    retort = Retort(
+        recipe=[
+            accum,
+            name_mapping(
+                WithExtra,
+                extra_in="extra",
+                extra_out="extra",
+            ),
+        ],
+        trusted=True,
+    )
+    loader = retort.get_loader(WithExtra)
+
+    assert loader({"name": "a", "b": 1}) == WithExtra(name="a", extra={"b": 1})
+
+
+@dataclass
+class WithUnion:
+    author: Union[int, Author]
+    alias: Optional[str] = None
+
+
+def test_union_cases_are_not_trusted(accum):
+    retort = Retort(recipe=[accum], trusted=True)
+    loader = retort.get_loader(WithUnion)
+
+    assert loader({"author": 1}) == WithUnion(author=1)
+    assert loader({"author": {"name": "Ray Bradbury", "born_at": 1920}, "alias": "Ray"}) == WithUnion(
+        author=Author(name="Ray Bradbury", born_at=1920),
+        alias="Ray",
+    )
+
+
+def test_trust_can_be_revoked(accum):
+    retort = Retort(recipe=[accum], trusted=True).replace(trusted=False)
+    loader = retort.get_loader(Author)
+    source = inspect.getsource(loader)
+
+    assert "except" in source
+    assert retort.replace(debug_trail=DebugTrail.DISABLE).get_loader(Author)(
+        {"name": "Ray Bradbury", "born_at": 1920},
+    ) == Author(name="Ray Bradbury", born_at=1920)
+
+
+@pytest.mark.parametrize(
+    ["debug_trail", "author_error"],
+    [
+        pytest.param(DebugTrail.FIRST, TypeLoadError(Mapping, "Ray"), id="first"),
+        pytest.param(
+            DebugTrail.ALL,
+            AggregateLoadError(f"while loading model {Author}", [TypeLoadError(Mapping, "Ray")]),
+            id="all",
+        ),
+        pytest.param(
+            DebugTrail.REPLAY,
+            AggregateLoadError(f"while loading model {Author}", [TypeLoadError(Mapping, "Ray")]),
+            id="replay",
+        ),
+    ],
+)
+def test_debug_trail_is_kept_for_untrusted_parts(accum, debug_trail, author_error):
+    retort = Retort(recipe=[accum], trusted=True, debug_trail=debug_trail)
+    loader = retort.get_loader(WithUnion)
+
+    raises_exc(
+        with_trail(
+            UnionLoadError(f"while loading {Union[int, Author]}", [TypeLoadError(int, "Ray"), author_error]),
+            ["author"],
+        ),
+        lambda: loader({"author": "Ray"}),
+    )
+
+
+def test_top_level_union_is_replayed():
+    retort = Retort(trusted=True, debug_trail=DebugTrail.REPLAY)
+
+    raises_exc(
+        UnionLoadError(f"while loading {Union[int, str]}", [TypeLoadError(int, None), TypeLoadError(str, None)]),
+        lambda: retort.load(None, Union[int, str]),
+    )
@@ -0,0 +1,114 @@
+from datetime import date
+from typing import Optional, TypedDict
+
+import pytest
+from tests_helpers import raises_exc, with_trail
+
+from adaptix import ExtraForbid, Retort, copy_typed_dict_input, name_mapping, share_typed_dict_input
+from adaptix.load_error import AggregateLoadError, ExtraFieldsLoadError, TypeLoadError
+
+
+class _AuthorBase(TypedDict):
+    name: str
+
+
+class Author(_AuthorBase, total=False):
+    born_at: Optional[int]
+
+
+class Book(TypedDict):
+    title: str
+    is_draft: bool
+    author: Author
+
+
+class Event(TypedDict):
+    title: str
+    day: date
+
+
+BOOK_DATA = {"title": "Fahrenheit 451", "is_draft": False, "author": {"name": "Ray Bradbury", "born_at": None}}
+
+
+def test_shared_input(accum, debug_trail):
+    retort = Retort(recipe=[accum, share_typed_dict_input()], debug_trail=debug_trail)
+    loader = retort.get_loader(Book)
+
+    data = {"title": "Fahrenheit 451", "is_draft": False, "author": {"name": "Ray Bradbury"}}
+    assert loader(data) is data
+    assert loader(BOOK_DATA) is BOOK_DATA
+
+
+def test_copied_input(accum, debug_trail):
+    retort = Retort(recipe=[accum], debug_trail=debug_trail)
+    loader = retort.get_loader(Author)
+
+    data = {"name": "Ray Bradbury", "born_at": 1920}
+    result = loader(data)
+    assert result == data
+    assert result is not data
+
+    book_result = retort.get_loader(Book)(BOOK_DATA)
+    assert book_result == BOOK_DATA
+    assert book_result is not BOOK_DATA
+    assert book_result["author"] is not BOOK_DATA["author"]
+
+
+def test_copy_policy_overrides_share_policy(accum):
+    retort = Retort(recipe=[accum, copy_typed_dict_input(Author), share_typed_dict_input()])
+    loader = retort.get_loader(Book)
+
+    result = loader(BOOK_DATA)
+    assert result == BOOK_DATA
+    assert result is not BOOK_DATA
+    assert result["author"] is not BOOK_DATA["author"]
+
+
+@pytest.mark.parametrize("share", [False, True])
+def test_non_conforming_input_is_reconstructed(accum, share):
+    retort = Retort(recipe=[accum, share_typed_dict_input()] if share else [accum])
+    loader = retort.get_loader(Book)
+
+    data = {"title": "Fahrenheit 451", "is_draft": False, "author": {"name": "Ray Bradbury", "extra": 1}}
+    assert loader(data) == {"title": "Fahrenheit 451", "is_draft": False, "author": {"name": "Ray Bradbury"}}
+    assert loader({**BOOK_DATA, "extra": 1}) == BOOK_DATA
+
+    raises_exc(
+        AggregateLoadError(
+            f"while loading model {Book}",
+            [with_trail(TypeLoadError(bool, 0), ["is_draft"])],
+        ),
+        lambda: loader({**BOOK_DATA, "is_draft": 0}),
+    )
+
+
+def test_extra_forbid(accum):
+    retort = Retort(recipe=[accum, share_typed_dict_input(), name_mapping(extra_in=ExtraForbid())])
+    loader = retort.get_loader(Author)
+
+    data = {"name": "Ray Bradbury"}
+    assert loader(data) is data
+    raises_exc(
+        AggregateLoadError(
+            f"while loading model {Author}",
+            [ExtraFieldsLoadError({"extra"}, {"name": "Ray Bradbury", "extra": 1})],
+        ),
+        lambda: loader({"name": "Ray Bradbury", "extra": 1}),
+    )
+
+
+def test_transforming_field_loader_disables_sharing(accum):
+    retort = Retort(recipe=[accum, share_typed_dict_input()])
+    loader = retort.get_loader(Event)
+
+    data = {"title": "Release", "day": "2024-01-01"}
+    assert loader(data) == {"title": "Release", "day": date(2024, 1, 1)}
+    assert data == {"title": "Release", "day": "2024-01-01"}
+
+
+def test_renamed_fields_disable_sharing(accum):
+    retort = Retort(recipe=[accum, share_typed_dict_input(), name_mapping(Author, map={"name": "full_name"})])
+    loader = retort.get_loader(Author)
+
+    data = {"full_name": "Ray Bradbury"}
+    assert loader(data) == {"name": "Ray Bradbury"}
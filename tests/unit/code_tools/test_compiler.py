@@ -0,0 +1,109 @@
+import linecache
+
+import pytest
+
+from adaptix._internal.code_tools.code_builder import CodeBuilder
+from adaptix._internal.code_tools.compiler import BasicClosureCompiler, _compile_source, generated_source_registry
+from adaptix.retort import SourceRetention, clear_code_caches, get_retained_source_size, set_source_retention
+
+
+def _make_builder() -> CodeBuilder:
+    builder = CodeBuilder()
+    builder += """
+        value = g_value
+
+        def closure():
+            return value
+
+        return closure
+    """
+    return builder
+
+
+def test_code_reuse():
+    compiler = BasicClosureCompiler()
+    first = compiler.compile("test_code_reuse", lambda uid: f"<{uid}>", _make_builder(), {"g_value": 1})
+    second = compiler.compile("test_code_reuse", lambda uid: f"<{uid}>", _make_builder(), {"g_value": 2})
+
+    assert first() == 1
+    assert second() == 2
+    assert first.__code__.co_code == second.__code__.co_code
+    assert first.__code__.co_filename == "<test_code_reuse>"
+    assert second.__code__.co_filename == "<test_code_reuse 1>"
+    assert linecache.getline(second.__code__.co_filename, second.__code__.co_firstlineno).strip() == "def closure():"
+
+
+@pytest.fixture
+def source_retention():
+    initial = generated_source_registry.retention
+    yield set_source_retention
+    set_source_retention(initial)
+
+
+def _compile_with_unique_source(base_id: str, lines_count: int = 1):
+    builder = CodeBuilder()
+    builder += "def closure():"
+    with builder:
+        for _ in range(lines_count):
+            builder += f"result = {base_id!r}"
+        builder += "return result"
+    builder += "return closure"
+    return BasicClosureCompiler().compile(base_id, lambda uid: f"<{uid}>", builder, {})
+
+
+def _get_source_size(closure) -> int:
+    return len("".join(linecache.getlines(closure.__code__.co_filename)))
+
+
+def test_lazy_source_retention(source_retention):
+    source_retention(SourceRetention.FULL)
+    initial_size = get_retained_source_size()
+    full = _compile_with_unique_source("test_full_source_retention", lines_count=100)
+    full_delta = get_retained_source_size() - initial_size
+
+    source_retention(SourceRetention.LAZY)
+    initial_size = get_retained_source_size()
+    lazy = _compile_with_unique_source("test_lazy_source_retention", lines_count=100)
+    lazy_delta = get_retained_source_size() - initial_size
+
+    full_source_size = _get_source_size(full)
+    assert _get_source_size(lazy) == full_source_size
+    assert full_delta > full_source_size
+    assert 0 < lazy_delta < full_source_size // 4
+    assert (
+        linecache.getline(lazy.__code__.co_filename, lazy.__code__.co_firstlineno)
+        == linecache.getline(full.__code__.co_filename, full.__code__.co_firstlineno)
+        == "    def closure():\n"
+    )
+    assert "result = 'test_lazy_source_retention'" in "".join(linecache.getlines(lazy.__code__.co_filename))
+
+
+def test_none_source_retention(source_retention):
+    source_retention(SourceRetention.NONE)
+    initial_size = get_retained_source_size()
+    closure = _compile_with_unique_source("test_none_source_retention")
+
+    assert closure() == "test_none_source_retention"
+    assert get_retained_source_size() == initial_size
+    assert linecache.getlines(closure.__code__.co_filename) == []
+
+
+def test_removed_sources_are_forgotten(source_retention):
+    source_retention(SourceRetention.FULL)
+    closure = _compile_with_unique_source("test_removed_sources_are_forgotten")
+    filename = closure.__code__.co_filename
+    assert filename in generated_source_registry._filenames
+
+    del linecache.cache[filename]
+    get_retained_source_size()
+    assert filename not in generated_source_registry._filenames
+
+
+def test_clear_code_caches():
+    closure = _compile_with_unique_source("test_clear_code_caches")
+    assert _compile_source.values()
+
+    clear_code_caches()
+    assert _compile_source.values() == []
+    assert closure() == "test_clear_code_caches"
+    assert _compile_with_unique_source("test_clear_code_caches")() == "test_clear_code_caches"
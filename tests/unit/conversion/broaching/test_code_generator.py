@@ -0,0 +1,112 @@
+from inspect import Parameter, Signature
+
+import pytest
+
+from adaptix._internal.code_tools.name_sanitizer import BuiltinNameSanitizer
+from adaptix._internal.conversion.broaching.code_generator import (
+    BroachingPlan,
+    BuiltinBroachingCodeGenerator,
+    attach_broaching_plan,
+)
+from adaptix._internal.conversion.broaching.definitions import (
+    AccessorElement,
+    FunctionElement,
+    ParameterElement,
+    PositionalArg,
+)
+from adaptix._internal.model_tools.definitions import create_attr_accessor
+
+SIGNATURE = Signature(
+    parameters=[
+        Parameter("data", Parameter.POSITIONAL_ONLY),
+        Parameter("ctx", Parameter.POSITIONAL_ONLY),
+    ],
+)
+
+
+def attr(target: BroachingPlan, name: str) -> BroachingPlan:
+    return AccessorElement(target, create_attr_accessor(name, is_required=True))
+
+
+def call(func, data_arg: BroachingPlan) -> BroachingPlan:
+    return FunctionElement(func=func, args=(PositionalArg(data_arg), PositionalArg(ParameterElement("ctx"))))
+
+
+def produce(plan: BroachingPlan, max_inline_depth: int) -> str:
+    code_gen = BuiltinBroachingCodeGenerator(
+        plan=plan,
+        name_sanitizer=BuiltinNameSanitizer(),
+        max_inline_depth=max_inline_depth,
+    )
+    code, namespace = code_gen.produce_code(signature=SIGNATURE, closure_name="coerce")
+    return code
+
+
+def wrap(data, ctx):
+    return [data]
+
+
+def make_nested_coercer(inner):
+    def nested_coercer(data, ctx):
+        return inner(data.value, ctx)
+
+    attach_broaching_plan(
+        nested_coercer,
+        FunctionElement(func=wrap, args=(PositionalArg(call(inner, attr(ParameterElement("data"), "value"))),)),
+    )
+    return nested_coercer
+
+
+def leaf_coercer(data, ctx):
+    return data
+
+
+@pytest.mark.parametrize(
+    ["max_inline_depth", "called_coercers"],
+    [
+        pytest.param(0, {"outer_coercer"}, id="disabled"),
+        pytest.param(1, {"inner_coercer"}, id="depth-1"),
+        pytest.param(2, {"leaf_coercer"}, id="depth-2"),
+        pytest.param(3, {"leaf_coercer"}, id="depth-3"),
+    ],
+)
+def test_inlining_depth(max_inline_depth, called_coercers):
+    inner_coercer = make_nested_coercer(leaf_coercer)
+    inner_coercer.__name__ = "inner_coercer"
+    outer_coercer = make_nested_coercer(inner_coercer)
+    outer_coercer.__name__ = "outer_coercer"
+
+    code = produce(call(outer_coercer, ParameterElement("data")), max_inline_depth)
+    for name in ["outer_coercer", "inner_coercer", "leaf_coercer"]:
+        assert (f"{name}(" in code) == (name in called_coercers)
+
+
+def test_inlined_argument_is_evaluated_once():
+    def model_coercer(data, ctx):
+        return wrap(data.a, data.b)
+
+    attach_broaching_plan(
+        model_coercer,
+        FunctionElement(
+            func=wrap,
+            args=(
+                PositionalArg(attr(ParameterElement("data"), "a")),
+                PositionalArg(attr(ParameterElement("data"), "b")),
+            ),
+        ),
+    )
+
+    code = produce(call(model_coercer, attr(ParameterElement("data"), "field")), max_inline_depth=1)
+    assert "model_coercer" not in code
+    assert code.count("data.field") == 1
+    assert ":=" in code
+
+
+def test_recursive_plan_is_not_inlined():
+    def recursive_coercer(data, ctx):
+        return recursive_coercer(data.child, ctx)
+
+    attach_broaching_plan(recursive_coercer, call(recursive_coercer, attr(ParameterElement("data"), "child")))
+
+    code = produce(call(recursive_coercer, ParameterElement("data")), max_inline_depth=10)
+    assert code.count("recursive_coercer(") == 1
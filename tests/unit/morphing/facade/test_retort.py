@@ -1,7 +1,10 @@
+import pickle
+from typing import Callable
+
 import pytest
 from tests_helpers import PlaceholderProvider, full_match
 
-from adaptix import DebugTrail, Retort
+from adaptix import DebugTrail, ProviderNotFoundError, Retort
 
 
 def test_retort_replace():
@@ -45,3 +48,46 @@ def test_generic_class_inferring():
         ),
     ):
         Retort().dump([1, 2, 3])
+
+
+def test_can_load_and_can_dump():
+    retort = Retort()
+
+    assert retort.can_load(int)
+    assert retort.can_dump(int)
+    assert int in retort._loader_cache
+    assert int in retort._dumper_cache
+    assert retort.get_loader(int) is retort._loader_cache[int]
+
+    assert not retort.can_load(Callable[[], int])
+    assert not retort.can_dump(Callable[[], int])
+    assert Callable[[], int] not in retort._loader_cache
+    assert Callable[[], int] not in retort._dumper_cache
+
+
+def test_provider_not_found_error_lazy_description():
+    retort = Retort()
+
+    with pytest.raises(ProviderNotFoundError) as exc_info:
+        retort.get_loader(Callable[[], int])
+
+    assert exc_info.value._description_factory is not None
+    assert str(exc_info.value).startswith(
+        "Cannot produce loader for type typing.Callable[[], int]\n",
+    )
+    assert exc_info.value._description_factory is None
+    assert exc_info.value.description is not None
+
+
+def test_provider_not_found_error_pickling():
+    retort = Retort()
+
+    with pytest.raises(ProviderNotFoundError) as exc_info:
+        retort.get_loader(Callable[[], int])
+
+    unpickled = pickle.loads(pickle.dumps(exc_info.value))  # noqa: S301
+    assert exc_info.value._description_factory is None
+    assert unpickled._description_factory is None
+    assert unpickled.message == exc_info.value.message
+    assert unpickled.description == exc_info.value.description
+    assert str(unpickled) == str(exc_info.value)
@@ -42,6 +42,7 @@ from adaptix.load_error import (
     LoadError,
     NoRequiredFieldsLoadError,
     NoRequiredItemsLoadError,
+    TruncatedAggregateLoadError,
     TypeLoadError,
 )
 
@@ -111,6 +112,7 @@ def make_loader_getter(
     name_layout: InputNameLayout,
     debug_trail: DebugTrail,
     strict_coercion: bool = True,
+    max_errors: Optional[int] = None,
     debug_ctx: DebugCtx,
 ) -> Callable[[], Loader]:
     def getter():
@@ -125,6 +127,7 @@ def make_loader_getter(
         return retort.replace(
             debug_trail=debug_trail,
             strict_coercion=strict_coercion,
+            max_errors=max_errors,
         ).get_loader(
             Gauge,
         )
@@ -1149,6 +1152,57 @@ def test_exception_collection(debug_ctx):
     )
 
 
+def test_exception_collection_limit(debug_ctx):
+    loader_getter = make_loader_getter(
+        shape=shape(
+            TestField("a", ParamKind.POS_OR_KW, is_required=True),
+            TestField("b", ParamKind.POS_OR_KW, is_required=True),
+            TestField("c", ParamKind.POS_OR_KW, is_required=True),
+        ),
+        name_layout=InputNameLayout(
+            crown=InpDictCrown(
+                {
+                    "a": InpFieldCrown("a"),
+                    "b": InpFieldCrown("b"),
+                    "c": InpFieldCrown("c"),
+                },
+                extra_policy=ExtraForbid(),
+            ),
+            extra_move=None,
+        ),
+        debug_trail=DebugTrail.ALL,
+        max_errors=2,
+        debug_ctx=debug_ctx,
+    )
+    loader = loader_getter()
+
+    raises_exc(
+        TruncatedAggregateLoadError(
+            f"while loading model {Gauge}",
+            [
+                with_trail(ValueLoadError("error at a", ...), ["a"]),
+                with_trail(ValueLoadError("error at b", ...), ["b"]),
+            ],
+        ),
+        lambda: loader(
+            {
+                "a": ValueLoadError("error at a", ...),
+                "b": ValueLoadError("error at b", ...),
+                "c": ValueLoadError("error at c", ...),
+            },
+        ),
+    )
+    raises_exc(
+        AggregateLoadError(
+            f"while loading model {Gauge}",
+            [
+                with_trail(ValueLoadError("error at a", ...), ["a"]),
+            ],
+        ),
+        lambda: loader({"a": ValueLoadError("error at a", ...), "b": 2, "c": 3}),
+    )
+
+
 def test_empty_dict(debug_ctx, debug_trail, extra_policy, trail_select):
     loader_getter = make_loader_getter(
         shape=shape(),
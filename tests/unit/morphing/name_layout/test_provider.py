@@ -164,6 +164,7 @@ DEFAULT_NAME_MAPPING = name_mapping(
     name_style=None,
     as_list=False,
     omit_default=False,
+    pure_default_factory=False,
     extra_in=ExtraSkip(),
     extra_out=ExtraSkip(),
 )
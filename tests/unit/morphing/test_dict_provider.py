@@ -9,7 +9,7 @@ from adaptix import DebugTrail, Retort, default_dict, dumper, loader
 from adaptix._internal.compat import CompatExceptionGroup
 from adaptix._internal.morphing.load_error import AggregateLoadError
 from adaptix._internal.struct_trail import ItemKey
-from adaptix.load_error import TypeLoadError
+from adaptix.load_error import TruncatedAggregateLoadError, TypeLoadError
 
 
 def string_dumper(data):
@@ -214,3 +214,50 @@ def test_defaultdict_dumping(retort, debug_trail):
     )
 
     assert dumper_(defaultdict(None, {"a": "b", "c": "d"})) == {"a": "b", "c": "d"}
+
+
+def test_max_errors(retort):
+    loader_ = retort.replace(
+        debug_trail=DebugTrail.ALL,
+        max_errors=2,
+    ).get_loader(Dict[str, str])
+
+    raises_exc(
+        TruncatedAggregateLoadError(
+            "while loading <class 'dict'>",
+            [
+                with_trail(TypeLoadError(str, 0), ["a"]),
+                with_trail(TypeLoadError(str, 1), ["b"]),
+            ],
+        ),
+        lambda: loader_({"a": 0, "b": 1, "c": 2}),
+    )
+
+
+@pytest.mark.parametrize(
+    ["key_loader", "value_loader", "expected"],
+    [
+        (None, None, {"a": 1, "b": 2}),
+        (str.upper, None, {"A": 1, "B": 2}),
+        (None, lambda x: x * 10, {"a": 10, "b": 20}),
+        (str.upper, lambda x: x * 10, {"A": 10, "B": 20}),
+    ],
+)
+def test_trusted_loading(retort, debug_trail, key_loader, value_loader, expected):
+    recipe = []
+    if key_loader is not None:
+        recipe.append(loader(str, key_loader))
+    if value_loader is not None:
+        recipe.append(loader(int, value_loader))
+
+    loader_ = retort.replace(
+        debug_trail=debug_trail,
+        trusted=True,
+    ).extend(
+        recipe=recipe,
+    ).get_loader(Dict[str, int])
+
+    data = {"a": 1, "b": 2}
+    loaded = loader_(data)
+    assert loaded == expected
+    assert loaded is not data
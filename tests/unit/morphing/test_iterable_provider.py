@@ -22,7 +22,7 @@ from tests_helpers import raises_exc, with_trail
 from adaptix import DebugTrail, Retort, dumper, loader
 from adaptix._internal.compat import CompatExceptionGroup
 from adaptix._internal.morphing.load_error import AggregateLoadError
-from adaptix.load_error import ExcludedTypeLoadError, TypeLoadError
+from adaptix.load_error import ExcludedTypeLoadError, TruncatedAggregateLoadError, TypeLoadError
 
 
 def string_dumper(data):
@@ -253,3 +253,76 @@ def test_dumping(retort, debug_trail):
             ),
             lambda: iterable_dumper(["10", 20]),
         )
+
+
+def test_max_errors(retort):
+    loader_ = retort.replace(
+        debug_trail=DebugTrail.ALL,
+        max_errors=2,
+    ).get_loader(List[List[int]])
+
+    consumed = []
+
+    def data_gen():
+        for i in range(100):
+            consumed.append(i)
+            yield ["a"]
+
+    raises_exc(
+        TruncatedAggregateLoadError(
+            f"while loading iterable {list}",
+            [
+                with_trail(
+                    AggregateLoadError(
+                        f"while loading iterable {list}",
+                        [with_trail(TypeLoadError(int, "a"), [0])],
+                    ),
+                    [0],
+                ),
+                with_trail(
+                    AggregateLoadError(
+                        f"while loading iterable {list}",
+                        [with_trail(TypeLoadError(int, "a"), [0])],
+                    ),
+                    [1],
+                ),
+            ],
+        ),
+        lambda: loader_(data_gen()),
+    )
+    assert consumed == [0, 1]
+
+    raises_exc(
+        TruncatedAggregateLoadError(
+            f"while loading iterable {list}",
+            [
+                with_trail(
+                    TruncatedAggregateLoadError(
+                        f"while loading iterable {list}",
+                        [
+                            with_trail(TypeLoadError(int, "a"), [0]),
+                            with_trail(TypeLoadError(int, "b"), [1]),
+                        ],
+                    ),
+                    [0],
+                ),
+            ],
+        ),
+        lambda: loader_([["a", "b", "c"], ["d"]]),
+    )
+
+
+def test_trusted_loading(retort, debug_trail):
+    retort = retort.replace(
+        debug_trail=debug_trail,
+        trusted=True,
+    )
+
+    data = ["a", "b", "c"]
+    loaded = retort.get_loader(List[str])(data)
+    assert loaded == ["a", "b", "c"]
+    assert loaded is not data
+    assert retort.get_loader(FrozenSet[str])(data) == frozenset(["a", "b", "c"])
+
+    loader_ = retort.extend(recipe=[loader(int, lambda x: x * 2)]).get_loader(Tuple[int, ...])
+    assert loader_([1, 2, 3]) == (2, 4, 6)
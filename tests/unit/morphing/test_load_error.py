@@ -0,0 +1,59 @@
+from dataclasses import dataclass
+from typing import Dict, List, Union
+
+import pytest
+
+from adaptix import DebugTrail, Retort
+from adaptix.load_error import FlatLoadError, LoadError, NoRequiredFieldsLoadError, TypeLoadError, flatten_load_error
+
+
+@dataclass
+class Item:
+    id: int
+    tags: List[str]
+
+
+@dataclass
+class Order:
+    items: List[Item]
+    meta: Dict[str, Union[int, str]]
+
+
+def _simplify(flat_errors: List[FlatLoadError]):
+    return [(trail, type(error), input_value) for trail, error, input_value in flat_errors]
+
+
+def test_flatten_load_error():
+    loader = Retort(debug_trail=DebugTrail.ALL).get_loader(Order)
+    data = {
+        "items": [
+            {"id": 1, "tags": ["a", 2]},
+            {"tags": []},
+            {"id": "3", "tags": 5},
+        ],
+        "meta": {"x": []},
+    }
+
+    with pytest.raises(LoadError) as exc_info:
+        loader(data)
+
+    assert _simplify(flatten_load_error(exc_info.value)) == [
+        (("items", 0, "tags", 1), TypeLoadError, 2),
+        (("items", 1), NoRequiredFieldsLoadError, {"tags": []}),
+        (("items", 2, "id"), TypeLoadError, "3"),
+        (("items", 2, "tags"), TypeLoadError, 5),
+        (("meta", "x"), TypeLoadError, []),
+        (("meta", "x"), TypeLoadError, []),
+    ]
+    assert not hasattr(exc_info.value.exceptions[0], "_adaptix_notes")
+
+
+def test_flatten_single_error():
+    loader = Retort(debug_trail=DebugTrail.FIRST).get_loader(Order)
+
+    with pytest.raises(LoadError) as exc_info:
+        loader({"items": [{"id": 1, "tags": [1]}], "meta": {}})
+
+    assert _simplify(flatten_load_error(exc_info.value)) == [
+        (("items", 0, "tags", 0), TypeLoadError, 1),
+    ]
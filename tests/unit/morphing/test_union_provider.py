@@ -314,3 +314,24 @@ def test_sentinel_as_is_dumping(strict_coercion, debug_trail):
        Union[str, Omitted],
     )
     assert dumper_("a") == "a"
+
+
+def test_max_errors():
+    union_tp = _norm_union_tp(Union[int, str, Decimal])
+    retort = Retort(debug_trail=DebugTrail.ALL)
+    loader_ = retort.get_loader(union_tp)
+    limited_loader = retort.replace(max_errors=2).get_loader(union_tp)
+
+    assert limited_loader(1) == 1
+
+    with pytest.raises(UnionLoadError) as full_exc_info:
+        loader_([])
+    with pytest.raises(UnionLoadError) as limited_exc_info:
+        limited_loader([])
+
+    assert len(full_exc_info.value.exceptions) == 3
+    assert (
+        [str(e) for e in limited_exc_info.value.exceptions]
+        ==
+        [str(e) for e in full_exc_info.value.exceptions[:2]]
+    )
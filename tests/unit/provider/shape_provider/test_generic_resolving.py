@@ -8,7 +8,7 @@ from tests_helpers import ModelSpec, cond_list, exclude_model_spec, load_namespa
 from tests_helpers.misc import create_mediator
 from tests_helpers.model_spec import only_generic_models, with_model_spec_requirement
 
-from adaptix import CannotProvide
+from adaptix import CannotProvide, Retort
 from adaptix._internal.feature_requirement import (
     HAS_PY_312,
     HAS_SELF_TYPE,
@@ -20,6 +20,7 @@ from adaptix._internal.feature_requirement import (
 )
 from adaptix._internal.provider.loc_stack_filtering import LocStack
 from adaptix._internal.provider.location import TypeHintLoc
+from adaptix._internal.provider.methods_provider import MethodsProvider, method_handler
 from adaptix._internal.provider.shape_provider import (
     InputShapeRequest,
     OutputShapeRequest,
@@ -605,3 +606,23 @@ def test_tv_tuple_default(model_spec):
     assert_fields_types(MyModel[int, str], {"a": tuple[int, str], "b": int})
     assert_fields_types(MyModel[int, str, bool], {"a": tuple[int, str, bool], "b": int})
     assert_fields_types(MyModel[T], {"a": tuple[T], "b": int})
+
+
+def test_unparametrized_members_are_reused(model_spec):
+    requested_types = []
+
+    class RequestCounter(MethodsProvider):
+        @method_handler
+        def _provide_input_shape(self, mediator, request: InputShapeRequest):
+            requested_types.append(request.last_loc.type)
+            return mediator.provide_from_next()
+
+    @model_spec.decorator
+    class MyGeneric(*model_spec.bases, Generic[T]):
+        a: T
+        b: List[T]
+
+    retort = Retort(recipe=[RequestCounter()])
+    assert retort.load({"a": 1, "b": [2]}, MyGeneric[int]) == MyGeneric(a=1, b=[2])
+    assert retort.load({"a": "1", "b": ["2"]}, MyGeneric[str]) == MyGeneric(a="1", b=["2"])
+    assert requested_types.count(MyGeneric) == 1
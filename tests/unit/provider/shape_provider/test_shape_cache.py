@@ -0,0 +1,68 @@
+import gc
+import weakref
+from dataclasses import dataclass
+
+from adaptix import Retort
+from adaptix._internal.model_tools.introspection.dataclass import get_dataclass_shape
+from adaptix._internal.provider.shape_provider import ShapeCache, ShapeProvider
+from adaptix.conversion import ConversionRetort
+from adaptix.provider import invalidate_shape_cache
+
+
+def make_counting_provider():
+    calls = []
+
+    def introspector(tp):
+        calls.append(tp)
+        return get_dataclass_shape(tp)
+
+    return ShapeProvider(introspector), calls
+
+
+@dataclass
+class Example:
+    a: int
+    b: str
+
+
+def test_shape_is_shared_between_retorts():
+    provider, calls = make_counting_provider()
+
+    for _ in range(3):
+        retort = Retort(recipe=[provider])
+        assert retort.load({"a": 1, "b": "x"}, Example) == Example(a=1, b="x")
+        assert retort.dump(Example(a=1, b="x")) == {"a": 1, "b": "x"}
+
+    ConversionRetort(recipe=[provider]).get_converter(Example, Example)
+    assert calls.count(Example) == 1
+
+
+def test_invalidation():
+    provider, calls = make_counting_provider()
+
+    @dataclass
+    class Model:
+        a: int
+
+    Retort(recipe=[provider]).get_loader(Model)
+    invalidate_shape_cache(Model)
+    Retort(recipe=[provider]).get_loader(Model)
+    invalidate_shape_cache()
+    Retort(recipe=[provider]).get_loader(Model)
+    assert calls.count(Model) == 3
+
+
+def test_cache_does_not_keep_class_alive():
+    @dataclass
+    class Model:
+        a: int
+
+    shape_cache = ShapeCache()
+    assert shape_cache.get_or_introspect(get_dataclass_shape, Model) is shape_cache.get_or_introspect(
+        get_dataclass_shape,
+        Model,
+    )
+    model_ref = weakref.ref(Model)
+    del Model
+    gc.collect()
+    assert model_ref() is None
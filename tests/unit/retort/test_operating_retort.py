@@ -1,10 +1,13 @@
 from dataclasses import dataclass
-from typing import List
+from functools import partial
+from types import FunctionType
+from typing import List, Optional
 
 import pytest
 from tests_helpers.misc import raises_exc_text
 
 from adaptix import Retort
+from adaptix._internal.retort.operating_retort import FuncWrapper, bind_stub
 from adaptix.conversion import get_converter
 
 
@@ -192,3 +195,66 @@ def test_cannot_produce_converter_no_coercer_complex_type(list_tp, list_tp_name)
             "__main__": __name__,
         },
     )
+
+
+def _make_caller(func):
+    def caller(x):
+        return func(x)
+
+    return caller
+
+
+def test_bind_stub():
+    stub = FuncWrapper("key")
+    direct = _make_caller(stub)
+    inner = _make_caller(stub)
+    nested = _make_caller((partial(inner), ))
+    opaque = _make_caller([stub])
+
+    def func(x):
+        return (direct, nested, opaque, x)
+
+    stub.set_func(str)
+    bind_stub(stub, func)
+
+    assert direct.__closure__[0].cell_contents is func
+    assert inner.__closure__[0].cell_contents is func
+    assert opaque.__closure__[0].cell_contents == [stub]
+    assert opaque.__closure__[0].cell_contents[0](10) == "10"
+
+
+@dataclass
+class Comment:
+    text: str
+    replies: List["Comment"]
+    parent: Optional["Comment"] = None
+
+
+def _find_stubs(root):
+    found = []
+    visited = set()
+    to_visit = [root]
+    while to_visit:
+        obj = to_visit.pop()
+        if id(obj) in visited:
+            continue
+        visited.add(id(obj))
+        if isinstance(obj, FuncWrapper):
+            found.append(obj)
+        elif isinstance(obj, tuple):
+            to_visit.extend(obj)
+        elif isinstance(obj, FunctionType) and obj.__closure__ is not None:
+            to_visit.extend(cell.cell_contents for cell in obj.__closure__)
+    return found
+
+
+def test_recursive_converters_are_bound_directly():
+    retort = Retort()
+    loader = retort.get_loader(Comment)
+    dumper = retort.get_dumper(Comment)
+
+    assert _find_stubs(loader) == []
+    assert _find_stubs(dumper) == []
+
+    data = {"text": "a", "replies": [{"text": "b", "replies": [], "parent": None}], "parent": None}
+    assert dumper(loader(data)) == data
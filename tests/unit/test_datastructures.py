@@ -1,6 +1,6 @@
 import pytest
 
-from adaptix._internal.datastructures import ClassDispatcher
+from adaptix._internal.datastructures import ClassDispatcher, ImmutableStack
 
 
 class Cls1:
@@ -62,3 +62,72 @@ def test_class_dispatcher_dispatch_multi():
 
     dispatcher2 = ClassDispatcher({BaseRight: 2, BaseLeft: 1})
     assert dispatcher2.dispatch(Child) == 1
+
+
+def test_immutable_stack_sequence_protocol():
+    stack = ImmutableStack(1, 2, 3)
+
+    assert len(stack) == 3
+    assert stack.last == 3
+    assert list(stack) == [1, 2, 3]
+    assert list(reversed(stack)) == [3, 2, 1]
+    assert stack[0] == 1
+    assert stack[-1] == 3
+    assert stack[-2] == 2
+    assert repr(stack) == "ImmutableStack(1, 2, 3)"
+
+    assert len(ImmutableStack()) == 0
+    assert list(ImmutableStack()) == []
+    with pytest.raises(IndexError):
+        ImmutableStack().last  # noqa: B018
+
+
+def test_immutable_stack_persistence():
+    base = ImmutableStack(1, 2)
+    left = base.append_with(3)
+    right = base.append_with(4)
+
+    assert list(base) == [1, 2]
+    assert list(left) == [1, 2, 3]
+    assert list(right) == [1, 2, 4]
+    assert list(left.replace_last(5)) == [1, 2, 5]
+    assert list(left.reversed_slice(1)) == [1, 2]
+    assert list(left.reversed_slice(3)) == []
+    assert list(left.reversed_slice(10)) == []
+
+
+def test_immutable_stack_equality():
+    stack = ImmutableStack(1, 2, 3)
+
+    assert stack == ImmutableStack.from_iter([1, 2, 3])
+    assert stack == ImmutableStack(1, 2).append_with(3)
+    assert hash(stack) == hash(ImmutableStack(1, 2).append_with(3))
+    assert stack != ImmutableStack(1, 2)
+    assert stack != ImmutableStack(1, 2, 4)
+    assert stack != ImmutableStack(0, 2, 3)
+    assert ImmutableStack() == ImmutableStack()
+    assert stack.reversed_slice(3) == ImmutableStack()
+
+
+def test_immutable_stack_count():
+    stack = ImmutableStack(1, 2, 1, 3)
+
+    assert stack.count(1) == 2
+    assert stack.count(2) == 1
+    assert stack.count(4) == 0
+    assert stack.append_with(1).count(1) == 3
+    assert stack.reversed_slice(2).count(1) == 1
+    assert stack.count(1) == 2
+
+
+def test_immutable_stack_count_of_branches():
+    prefix = ImmutableStack(1, 2)
+    left = prefix.append_with(1)
+    right = prefix.append_with(2).append_with(1)
+
+    assert left.count(1) == 2
+    assert right.count(1) == 2
+    assert right.count(2) == 2
+    assert prefix.count(2) == 1
+    assert left.count(2) == 1
+    assert right.replace_last(3).count(2) == 2
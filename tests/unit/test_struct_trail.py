@@ -1,8 +1,9 @@
-from collections import deque
+import traceback
 
 import pytest
 
-from adaptix.struct_trail import append_trail, extend_trail, get_trail
+from adaptix.load_error import LoadError, TypeLoadError
+from adaptix.struct_trail import append_trail, extend_trail, get_trail, render_trail_as_note
 
 
 def _raw_trail(obj: object):
@@ -14,20 +15,20 @@ def test_append_trail():
     exc = Exception()
 
     append_trail(exc, "foo")
-    assert _raw_trail(exc) == deque(["foo"])
+    assert _raw_trail(exc) == ("foo", None)
     append_trail(exc, "bar")
-    assert _raw_trail(exc) == deque(["bar", "foo"])
+    assert _raw_trail(exc) == ("bar", ("foo", None))
     append_trail(exc, 3)
-    assert _raw_trail(exc) == deque([3, "bar", "foo"])
+    assert _raw_trail(exc) == (3, ("bar", ("foo", None)))
 
 
 def test_extend_trail():
     exc = Exception()
 
     extend_trail(exc, ["a", "b"])
-    assert _raw_trail(exc) == deque(["a", "b"])
+    assert get_trail(exc) == ["a", "b"]
     extend_trail(exc, ["c", "d"])
-    assert _raw_trail(exc) == deque(["c", "d", "a", "b"])
+    assert get_trail(exc) == ["c", "d", "a", "b"]
 
 
 def test_get_trail():
@@ -44,3 +45,47 @@ def test_get_trail():
     append_trail(new_exc, "bar")
 
     assert list(get_trail(new_exc)) == ["bar"]
+
+
+def test_load_error_trail_default():
+    exc = LoadError()
+
+    assert _raw_trail(exc) is None
+    assert list(get_trail(exc)) == []
+    assert not hasattr(exc, "__notes__")
+
+
+def test_render_trail_as_note():
+    exc = render_trail_as_note(extend_trail(Exception(), ["a", 0]))
+    assert exc.__notes__ == ["Exception was caused at ['a', 0]"]
+
+
+def test_deferred_trail_note():
+    exc = TypeLoadError(int, "a")
+    append_trail(exc, "b")
+    render_trail_as_note(exc)
+    append_trail(exc, "a")  # captured trail is not affected
+
+    assert "_adaptix_notes" not in vars(exc)
+    assert exc.__notes__ == ["Exception was caused at ['b']"]
+    assert "".join(traceback.format_exception_only(type(exc), exc)).endswith(
+        "Exception was caused at ['b']\n",
+    )
+
+
+def test_deferred_trail_note_order():
+    exc = TypeLoadError(int, "a")
+    exc.__notes__ = ["first"]
+    render_trail_as_note(append_trail(exc, "a"))
+    render_trail_as_note(append_trail(exc, "b"))
+    exc.__notes__.append("last")
+
+    assert exc.__notes__ == [
+        "first",
+        "Exception was caused at ['a']",
+        "Exception was caused at ['b', 'a']",
+        "last",
+    ]
+
+    del exc.__notes__
+    assert not hasattr(exc, "__notes__")
@@ -1,9 +1,10 @@
 import pickle
 from copy import copy, deepcopy
+from dataclasses import dataclass
 
 import pytest
 
-from adaptix._internal.utils import SingletonMeta, get_prefix_groups
+from adaptix._internal.utils import SingletonMeta, cache_hash, get_prefix_groups
 
 
 class SomeSingleton(metaclass=SingletonMeta):
@@ -77,3 +78,26 @@ def test_singleton_new():
 )
 def test_get_prefix_groups(values, result):
     assert get_prefix_groups(values) == result
+
+
+@cache_hash
+@dataclass(frozen=True)
+class HashCounting:
+    value: list
+
+    def __hash__(self):
+        self.value.append(None)
+        return len(self.value)
+
+
+def test_cache_hash():
+    instance = HashCounting([])
+
+    assert hash(instance) == 1
+    assert hash(instance) == 1
+    assert instance.value == [None]
+    assert instance == HashCounting([None])
+
+    unpickled = pickle.loads(pickle.dumps(instance))  # noqa: S301
+    assert unpickled == instance
+    assert hash(unpickled) == 2